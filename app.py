@@ -14,6 +14,16 @@ load_dotenv()
 def create_app():
     app = Flask(__name__)
 
+    # 업로드 파일을 업로드 임시 디렉토리로 바로 스트리밍 (저장 시 복사 없이 이동)
+    from utils.upload_stream import (
+        UploadRequest,
+        init_upload_limits,
+        sweep_orphaned_uploads,
+    )
+
+    app.request_class = UploadRequest
+    init_upload_limits(app)
+
     # 슬래시 유무에 관계없이 동일 라우팅 처리
     app.url_map.strict_slashes = False
 
@@ -108,41 +118,46 @@ def create_app():
     db.init_app(app)
     Migrate(app, db)
 
-    # 정적 파일 서빙 설정
-    from flask import send_from_directory
+    # 캐시 백엔드 초기화 (권한/세션/동아리 카탈로그 조회에 사용)
+    from utils.cache import init_cache
+
+    init_cache(app)
+
+    # 비밀번호 해시 워커 풀 초기화 (로그인/회원가입 해시 계산 동시 실행 수 제한)
+    from utils.password_hasher import init_password_hasher
+
+    init_password_hasher(app)
+
+    # 이미지 변환 워커 풀 초기화 (업로드 이미지 WebP 변환을 백그라운드에서 처리)
+    from utils.image_worker import init_image_worker
+
+    init_image_worker(app)
+
+    # 서버 중단으로 남은 업로드 임시 파일 정리
+    sweep_orphaned_uploads(app)
+
+    # 업로드 파일 서빙 설정 (ETag/304/Range, 내용 주소 파일은 immutable 캐시)
+    from utils.static_files import get_upload_dir, send_upload_file
 
     @app.route("/banners/<path:filename>")
     def serve_banner(filename):
-        banners_dir = app.config.get("BANNERS_DIR", "banners")
-        # 절대 경로로 변환
-        if not os.path.isabs(banners_dir):
-            banners_dir = os.path.join(app.root_path, banners_dir)
-        return send_from_directory(banners_dir, filename)
+        return send_upload_file(get_upload_dir("BANNERS_DIR", "banners"), filename)
 
     @app.route("/clubs/<path:filename>")
     def serve_club_image(filename):
-        clubs_dir = app.config.get("CLUBS_DIR", "clubs")
-        # 절대 경로로 변환
-        if not os.path.isabs(clubs_dir):
-            clubs_dir = os.path.join(app.root_path, clubs_dir)
-        return send_from_directory(clubs_dir, filename)
+        return send_upload_file(get_upload_dir("CLUBS_DIR", "clubs"), filename)
 
     @app.route("/reservations/<path:filename>")
     def serve_reservation_file(filename):
-        reservations_dir = app.config.get("RESERVATIONS_DIR", "reservations")
-        # 절대 경로로 변환
-        if not os.path.isabs(reservations_dir):
-            reservations_dir = os.path.join(app.root_path, reservations_dir)
-        return send_from_directory(reservations_dir, filename)
+        return send_upload_file(
+            get_upload_dir("RESERVATIONS_DIR", "reservations"), filename
+        )
 
     @app.route("/notices/<path:filename>")
     def serve_notice_file(filename):
         from flask import current_app, abort
 
-        notices_dir = app.config.get("NOTICES_DIR", "notices")
-        # 절대 경로로 변환
-        if not os.path.isabs(notices_dir):
-            notices_dir = os.path.join(app.root_path, notices_dir)
+        notices_dir = get_upload_dir("NOTICES_DIR", "notices")
 
         # 파일 경로 구성
         file_path = os.path.join(notices_dir, filename)
@@ -155,19 +170,22 @@ def create_app():
             abort(404)
 
         # 파일 서빙
-        return send_from_directory(notices_dir, filename)
+        return send_upload_file(notices_dir, filename)
 
     # 413 오류 핸들러 추가
     @app.errorhandler(413)
     def too_large(e):
         from flask import jsonify, current_app
 
+        from utils.upload_stream import get_max_upload_file_bytes
+
         current_app.logger.error(f"413 Error: {e}")
+        max_mb = get_max_upload_file_bytes() // (1024 * 1024)
         return (
             jsonify(
                 {
                     "status": "error",
-                    "message": "파일 크기가 너무 큽니다. 최대 500MB까지 업로드 가능합니다.",
+                    "message": f"파일 크기가 너무 큽니다. 최대 {max_mb}MB까지 업로드 가능합니다.",
                     "code": "413-01",
                 }
             ),
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+업로드 파일 캐시 벤치마크 스크립트
+기존 send_from_directory 서빙(before)과 ETag/immutable 캐시 정책을 적용한 서빙(after)의
+페이지 조회당 요청 수와 전송 바이트를 브라우저 캐시를 흉내 낸 클라이언트로 비교합니다.
+
+사용법: python -m benchmarks.benchmark_asset_cache [--views 10] (저장소 루트에서 실행)
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from flask import Flask, send_from_directory
+
+from utils.static_files import send_upload_file
+
+# 한 페이지에서 불러오는 업로드 파일 (경로, 크기)
+# 홈 화면 기준: 동아리 로고 4개, 배너 3개(내용 주소 저장소), 저장소 도입 전 업로드된 로고 1개
+PAGE_ASSETS = [(f"store/{i:02x}/{i:02x}{'0' * 62}.webp", 40 * 1024) for i in range(4)]
+PAGE_ASSETS += [
+    (f"store/{i:02x}/{i:02x}{'1' * 62}.webp", 180 * 1024) for i in range(4, 7)
+]
+PAGE_ASSETS += [("1/images/logo_legacy.webp", 40 * 1024)]
+
+
+class BrowserCache:
+    """Cache-Control/ETag를 따르는 단순한 브라우저 캐시"""
+
+    def __init__(self, client, enabled=True):
+        self.client = client
+        self.enabled = enabled
+        self.entries = {}
+
+    def fetch(self, url):
+        """
+        URL 조회
+
+        Returns:
+            (요청 수, 전송 바이트)
+        """
+        entry = self.entries.get(url) if self.enabled else None
+        if entry and entry["expires_at"] > time.time():
+            return 0, 0
+
+        headers = {}
+        if entry and entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        response = self.client.get(url, headers=headers)
+
+        transferred = _header_bytes(headers) + _header_bytes(response.headers)
+        transferred += len(response.get_data())
+
+        if response.status_code == 200:
+            cache_control = response.cache_control
+            max_age = cache_control.max_age or 0
+            self.entries[url] = {
+                "etag": response.headers.get("ETag"),
+                "expires_at": (
+                    time.time() + max_age
+                    if max_age and not cache_control.no_cache
+                    else 0
+                ),
+            }
+        return 1, transferred
+
+
+def _header_bytes(headers):
+    return sum(len(key) + len(value) + 4 for key, value in dict(headers).items())
+
+
+def create_benchmark_app(upload_dir):
+    """기존 방식(/before/)과 새 방식(/after/)으로 같은 디렉토리를 서빙하는 앱"""
+    app = Flask(__name__)
+
+    @app.route("/before/<path:filename>")
+    def before(filename):
+        return send_from_directory(upload_dir, filename)
+
+    @app.route("/after/<path:filename>")
+    def after(filename):
+        return send_upload_file(upload_dir, filename)
+
+    return app
+
+
+def write_assets(upload_dir):
+    for path, size in PAGE_ASSETS:
+        full_path = os.path.join(upload_dir, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "wb") as f:
+            f.write(os.urandom(size))
+
+
+def run_page_views(app, prefix, views, cache_enabled=True):
+    """
+    페이지 조회 반복
+
+    Returns:
+        [(요청 수, 전송 바이트), ...] 조회별 결과
+    """
+    results = []
+    with app.test_client() as client:
+        browser = BrowserCache(client, enabled=cache_enabled)
+        for _ in range(views):
+            requests_count = 0
+            transferred = 0
+            for path, _ in PAGE_ASSETS:
+                count, size = browser.fetch(f"/{prefix}/{path}")
+                requests_count += count
+                transferred += size
+            results.append((requests_count, transferred))
+    return results
+
+
+def print_summary(label, results):
+    first_requests, first_bytes = results[0]
+    repeat = results[1:] or results
+    repeat_requests = sum(r for r, _ in repeat) / len(repeat)
+    repeat_bytes = sum(b for _, b in repeat) / len(repeat)
+    print(
+        f"{label:<28} 첫 조회 {first_requests:>3}회 {first_bytes / 1024:>9.1f}KB"
+        f"  | 재조회 평균 {repeat_requests:>5.1f}회 {repeat_bytes / 1024:>9.1f}KB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="업로드 파일 캐시 벤치마크")
+    parser.add_argument("--views", type=int, default=10, help="페이지 조회 횟수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as upload_dir:
+        write_assets(upload_dir)
+        app = create_benchmark_app(upload_dir)
+
+        total_kb = sum(size for _, size in PAGE_ASSETS) / 1024
+        print(f"페이지당 업로드 파일 {len(PAGE_ASSETS)}개, 합계 {total_kb:.0f}KB")
+        print(f"페이지 조회 {args.views}회\n")
+
+        print_summary(
+            "캐시 없는 클라이언트",
+            run_page_views(app, "before", args.views, cache_enabled=False),
+        )
+        print_summary(
+            "before (send_from_directory)", run_page_views(app, "before", args.views)
+        )
+        print_summary(
+            "after (send_upload_file)", run_page_views(app, "after", args.views)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -35,6 +35,69 @@ class Config:
     NOTICES_DIR = os.getenv("NOTICES_DIR", "notices")
     RESERVATIONS_DIR = os.getenv("RESERVATIONS_DIR", "reservations")
 
+    # 캐시 설정
+    # memory: 워커별 메모리 캐시 / sqlite: 같은 호스트의 모든 워커가 공유하는 파일 캐시
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+    # 앱 워커 프로세스 수 (memory 백엔드에서 2 이상이면 세션 캐시/세션 토큰을 사용하지 않음)
+    WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+    CACHE_SQLITE_PATH = os.getenv("CACHE_SQLITE_PATH", "cache/clubu_cache.sqlite3")
+    CACHE_LOCAL_MAX_ENTRIES = int(os.getenv("CACHE_LOCAL_MAX_ENTRIES", "1024"))
+    CACHE_SHARED_MAX_ENTRIES = int(os.getenv("CACHE_SHARED_MAX_ENTRIES", "10000"))
+    # 다른 워커의 캐시 무효화가 반영되기까지의 최대 지연 (초)
+    CACHE_SYNC_INTERVAL = float(os.getenv("CACHE_SYNC_INTERVAL", "2"))
+
+    # 서명된 세션 토큰 설정
+    # 활성화 시 쿠키에 서명된 세션 정보를 함께 저장하여 대부분의 요청을 DB 조회 없이 검증
+    SESSION_TOKEN_ENABLED = (
+        os.getenv("SESSION_TOKEN_ENABLED", "false").lower() == "true"
+    )
+    # 폐기 epoch가 바뀌지 않아도 DB에서 세션을 다시 확인하는 주기 (초)
+    SESSION_TOKEN_REFRESH_SECONDS = int(
+        os.getenv("SESSION_TOKEN_REFRESH_SECONDS", "300")
+    )
+
+    # 비밀번호 해시 설정
+    # 해시 방식/비용 (변경 시 기존 사용자는 다음 로그인 때 새 방식으로 재해시)
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:600000")
+    # 동시에 해시를 계산하는 워커 수와 최대 대기 요청 수
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "32"))
+
+    # 동아리 공간 사용 시간 정책 (일일 제한은 공간의 max_daily_hours와 비교해 더 작은 값 적용)
+    CLUB_MAX_DAILY_HOURS = float(os.getenv("CLUB_MAX_DAILY_HOURS", "6"))
+    CLUB_MAX_WEEKLY_HOURS = float(os.getenv("CLUB_MAX_WEEKLY_HOURS", "20"))
+
+    # 업로드 이미지 WebP 변환 워커 설정
+    # 동시에 변환하는 워커 수, 최대 대기 작업 수, 실패 시 최대 시도 횟수
+    IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", "2"))
+    IMAGE_QUEUE_MAX = int(os.getenv("IMAGE_QUEUE_MAX", "64"))
+    IMAGE_JOB_MAX_ATTEMPTS = int(os.getenv("IMAGE_JOB_MAX_ATTEMPTS", "3"))
+    # 크기별 이미지 변형 ("이름:최대 변 길이" 쉼표 구분, 가장 큰 변형이 기본 이미지 URL로 사용됨)
+    IMAGE_VARIANT_SIZES = os.getenv(
+        "IMAGE_VARIANT_SIZES", "thumbnail:320,medium:960,full:2048"
+    )
+    # 손실 WebP 품질, AVIF 생성 여부(Pillow가 AVIF 저장을 지원할 때만)와 품질
+    IMAGE_WEBP_QUALITY = int(os.getenv("IMAGE_WEBP_QUALITY", "82"))
+    IMAGE_AVIF_ENABLED = os.getenv("IMAGE_AVIF_ENABLED", "false").lower() == "true"
+    IMAGE_AVIF_QUALITY = int(os.getenv("IMAGE_AVIF_QUALITY", "55"))
+    # 디코딩 전 헤더로 확인하는 최대 해상도(픽셀 수)와 최대 이미지 파일 크기
+    IMAGE_MAX_PIXELS = int(os.getenv("IMAGE_MAX_PIXELS", "40000000"))
+    IMAGE_MAX_FILE_BYTES = int(os.getenv("IMAGE_MAX_FILE_BYTES", str(30 * 1024 * 1024)))
+
+    # 업로드 임시 디렉토리 (업로드 디렉토리와 같은 파일 시스템이면 복사 없이 이동)
+    UPLOAD_TEMP_DIR = os.getenv("UPLOAD_TEMP_DIR", "uploads_tmp")
+    # 시작 시 이 시간보다 오래 남아 있는 업로드 임시 파일(temp_*, *.part) 삭제
+    UPLOAD_ORPHAN_SECONDS = int(os.getenv("UPLOAD_ORPHAN_SECONDS", "3600"))
+    # 업로드 파일 전송 방식 (direct, x-accel-redirect, x-sendfile)
+    # x-accel-redirect는 nginx에 "<X_ACCEL_REDIRECT_PREFIX>/<banners|clubs|notices|reservations>/"
+    # internal location이 업로드 디렉토리를 가리키도록 설정되어 있어야 함
+    FILE_SERVING_MODE = os.getenv("FILE_SERVING_MODE", "direct")
+    X_ACCEL_REDIRECT_PREFIX = os.getenv("X_ACCEL_REDIRECT_PREFIX", "/_protected")
+    # 공지사항 첨부파일 최대 크기
+    NOTICE_FILE_MAX_BYTES = int(
+        os.getenv("NOTICE_FILE_MAX_BYTES", str(100 * 1024 * 1024))
+    )
+
     # 파일 업로드 크기 제한 설정 (500MB)
     MAX_CONTENT_LENGTH = 500 * 1024 * 1024  # 500MB
 
@@ -3,6 +3,8 @@
 모든 API 엔드포인트의 권한 설정을 한 곳에서 관리
 """
 
+from types import MappingProxyType
+
 # 권한 레벨 정의
 ROLE_HIERARCHY = {
     "STUDENT": 1,
@@ -103,6 +105,10 @@ PERMISSION_POLICY = {
         "allowed_roles": {"UNION_ADMIN", "DEVELOPER"},
         "description": "전체 배너 목록 조회 (GET /api/v1/banners/all)",
     },
+    "reservations.export": {
+        "allowed_roles": {"UNION_ADMIN", "DEVELOPER"},
+        "description": "예약/청소 현황 CSV 내보내기 (GET /api/v1/reservations/integration/export)",
+    },
     # ===== CLUB_PRESIDENT만 접근 가능한 API들 (동아리 내 권한 관리) =====
     "clubs.member_role_change": {
         "allowed_roles": {"CLUB_PRESIDENT", "DEVELOPER"},
@@ -132,7 +138,7 @@ PERMISSION_POLICY = {
     # ===== 예약 관련 권한 =====
     "reservations.create": {
         "allowed_roles": {"CLUB_MEMBER", "CLUB_OFFICER", "CLUB_PRESIDENT", "DEVELOPER"},
-        "description": "대관 신청 (POST /api/v1/reservations)",
+        "description": "대관 신청 (POST /api/v1/reservations, POST /api/v1/reservations/recurring)",
     },
     "reservations.list": {
         "allowed_roles": {"CLUB_MEMBER", "CLUB_OFFICER", "CLUB_PRESIDENT", "DEVELOPER"},
@@ -154,7 +160,7 @@ PERMISSION_POLICY = {
             "CLUB_PRESIDENT",
             "DEVELOPER",
         },
-        "description": "공간 가용시간 조회 (GET /api/v1/rooms/{id}/availability)",
+        "description": "공간 가용시간 조회 (GET /api/v1/rooms/{id}/availability, GET /api/v1/rooms/availability)",
     },
     "clubs.remaining_usage": {
         "allowed_roles": {"CLUB_MEMBER", "CLUB_OFFICER", "CLUB_PRESIDENT", "DEVELOPER"},
@@ -217,3 +223,59 @@ def is_role_higher_or_equal(role1, role2):
     level1 = ROLE_HIERARCHY.get(role1, 0)
     level2 = ROLE_HIERARCHY.get(role2, 0)
     return level1 >= level2
+
+
+# ===== 사전 컴파일된 권한 정책 =====
+# 모듈 로드 시 1회 컴파일: 역할명 -> 비트, 권한 키 -> 허용 역할 비트마스크
+# 권한 검사는 (사용자 역할 비트마스크 & 허용 역할 비트마스크) 정수 연산으로 처리
+
+# 권한 정책이 없거나 허용 역할이 비어 있는 경우의 기본 역할
+DEFAULT_ALLOWED_ROLES = frozenset({"STUDENT"})
+
+
+def _compile_role_bits():
+    """ROLE_HIERARCHY 순서로 역할별 비트 위치 할당 (정책에만 있는 역할은 뒤에 추가)"""
+    role_names = sorted(ROLE_HIERARCHY, key=lambda role: ROLE_HIERARCHY[role])
+    for policy in PERMISSION_POLICY.values():
+        for role in sorted(policy["allowed_roles"]):
+            if role not in role_names:
+                role_names.append(role)
+    return MappingProxyType({role: 1 << bit for bit, role in enumerate(role_names)})
+
+
+ROLE_BITS = _compile_role_bits()
+
+
+def roles_to_mask(roles):
+    """역할명 집합을 비트마스크로 변환 (정의되지 않은 역할은 무시)"""
+    mask = 0
+    for role in roles:
+        mask |= ROLE_BITS.get(role, 0)
+    return mask
+
+
+def mask_to_roles(mask):
+    """비트마스크를 역할명 집합으로 변환"""
+    return {role for role, bit in ROLE_BITS.items() if mask & bit}
+
+
+def _compile_permission_policy():
+    """권한 키 -> (허용 역할 비트마스크, 허용 역할 frozenset)"""
+    compiled = {}
+    for permission_key, policy in PERMISSION_POLICY.items():
+        allowed_roles = frozenset(policy["allowed_roles"]) or DEFAULT_ALLOWED_ROLES
+        compiled[permission_key] = (roles_to_mask(allowed_roles), allowed_roles)
+    return MappingProxyType(compiled)
+
+
+COMPILED_PERMISSION_POLICY = _compile_permission_policy()
+
+DEFAULT_PERMISSION_RULE = (roles_to_mask(DEFAULT_ALLOWED_ROLES), DEFAULT_ALLOWED_ROLES)
+
+
+def get_compiled_permission(permission_key):
+    """컴파일된 권한 정책 조회 -> (허용 역할 비트마스크, 허용 역할 frozenset)
+
+    정책이 없는 권한 키는 기본 STUDENT 권한을 반환합니다.
+    """
+    return COMPILED_PERMISSION_POLICY.get(permission_key, DEFAULT_PERMISSION_RULE)
@@ -20,6 +20,7 @@ from services.session_service import (
     get_current_user,
     get_current_session,
 )
+from utils.password_hasher import PasswordHashBusyError
 from utils.permission_decorator import require_permission
 
 
@@ -219,6 +220,8 @@ class RegisterController(Resource):
                     "message": error_message,
                     "code": "400-07",
                 }, 400
+        except PasswordHashBusyError as e:
+            return {"status": "error", "message": str(e), "code": "503-00"}, 503
         except Exception as e:
             current_app.logger.exception("auth.register failed")
             return {
@@ -313,6 +316,8 @@ class LoginController(Resource):
 
         except ValueError as e:
             return {"status": "error", "message": str(e), "code": "401-01"}, 401
+        except PasswordHashBusyError as e:
+            return {"status": "error", "message": str(e), "code": "503-00"}, 503
         except Exception as e:
             current_app.logger.exception("auth.login failed")
             return {
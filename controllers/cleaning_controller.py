@@ -4,6 +4,7 @@ from werkzeug.datastructures import FileStorage
 from services.cleaning_service import CleaningService
 from services.session_service import get_session_info
 from utils.permission_decorator import require_permission
+from utils.upload_stream import DEFAULT_IMAGE_FILE_MAX_BYTES, upload_limit
 
 cleaning_ns = Namespace("", description="청소 사진 관리 API")
 
@@ -60,6 +61,9 @@ class UsageDetailController(Resource):
 @cleaning_ns.route("/reservations/<int:reservation_id>/cleaning/photos")
 @cleaning_ns.route("/reservations/<int:reservation_id>/cleaning/photos/<int:photo_id>")
 class CleaningPhotoController(Resource):
+    @upload_limit(
+        "IMAGE_MAX_FILE_BYTES", DEFAULT_IMAGE_FILE_MAX_BYTES, single_file=True
+    )
     @cleaning_ns.expect(cleaning_photo_parser)
     @cleaning_ns.doc("upload_cleaning_photo", consumes=["multipart/form-data"])
     @cleaning_ns.response(201, "청소 사진 업로드 성공")
@@ -1,7 +1,9 @@
-from flask import send_file, abort, current_app
+from flask import abort, current_app
 from flask_restx import Resource
+from werkzeug.exceptions import HTTPException
 from services.session_service import get_current_session
 from services.notice_asset_service import get_notice_asset_by_id
+from utils.static_files import send_cached_file
 import os
 
 
@@ -47,14 +49,16 @@ class FileDownloadController(Resource):
             # 파일명 추출 (원본 파일명 사용)
             original_filename = asset.get("original_filename", "download")
 
-            # 파일 다운로드
-            return send_file(
+            # 파일 다운로드 (ETag/304, Range 요청으로 이어받기 지원)
+            return send_cached_file(
                 file_path,
-                as_attachment=True,
                 download_name=original_filename,
                 mimetype="application/octet-stream",
             )
 
+        except HTTPException:
+            # 만족할 수 없는 Range(416) 등은 Content-Range 헤더와 함께 그대로 응답
+            raise
         except Exception as e:
             current_app.logger.error(f"파일 다운로드 중 오류: {e}")
             return {
@@ -1,8 +1,9 @@
+from flask import Response
 from flask_restx import Resource, reqparse
 from services.session_service import get_current_session
 from utils.permission_decorator import require_permission
 from services.home_service import (
-    get_all_clubs,
+    get_all_clubs_json,
     get_club_by_id,
     # update_club_info,  # 주석처리 - deprecated
     # update_club_status,  # 주석처리 - deprecated
@@ -21,11 +22,10 @@ class ClubListController(Resource):
     def get(self):
         """모든 동아리 목록을 반환합니다"""
         try:
-            clubs_data = get_all_clubs()
-            return {
-                "count": len(clubs_data),
-                "clubs": clubs_data,
-            }, 200
+            # 카탈로그 캐시에 직렬화된 응답을 그대로 반환
+            return Response(
+                get_all_clubs_json(), status=200, mimetype="application/json"
+            )
         except ValueError as e:
             return {"status": "error", "message": str(e), "code": "400-01"}, 400
         except Exception as e:
@@ -1,6 +1,7 @@
-from flask import request
+from flask import Response, request, stream_with_context
 from flask_restx import Resource, Namespace
 from services.reservation_service import ReservationService
+from services.reservation_export_service import ReservationExportService
 from services.session_service import get_session_info
 from utils.permission_decorator import require_permission
 from models import UserSession
@@ -8,6 +9,14 @@ from models import UserSession
 reservation_ns = Namespace("reservations", description="예약 관리 API")
 
 
+def _parse_fields_arg():
+    """fields 쿼리 파라미터를 필드 목록으로 변환 (없으면 None)"""
+    fields = request.args.get("fields")
+    if not fields:
+        return None
+    return [field.strip() for field in fields.split(",") if field.strip()]
+
+
 @reservation_ns.route("")
 class ReservationController(Resource):
     @reservation_ns.doc("create_reservation")
@@ -108,6 +117,21 @@ class ReservationController(Resource):
         "예약 상태 필터 (CONFIRMED: 확정, CLEANING_PHOTO_REJECT: 청소 사진 거절, CLEANING_DONE: 청소 완료, CANCELLED: 취소)",
         type=str,
     )
+    @reservation_ns.param(
+        "cursor",
+        "다음 페이지 커서 (이전 응답의 next_cursor)",
+        type=str,
+    )
+    @reservation_ns.param(
+        "limit",
+        "페이지 크기 (기본 50, 최대 200)",
+        type=int,
+    )
+    @reservation_ns.param(
+        "fields",
+        "응답에 포함할 필드 (쉼표 구분, 예: id,date,start_time,end_time,room,user.name)",
+        type=str,
+    )
     @reservation_ns.response(200, "성공")
     @reservation_ns.response(400, "잘못된 요청")
     @reservation_ns.response(500, "서버 오류")
@@ -132,10 +156,17 @@ class ReservationController(Resource):
             user_id = session_info["user"]["user_id"]
 
             reservations = ReservationService.get_user_reservations(
-                user_id=user_id, mine=mine, status_filter=status_filter
+                user_id=user_id,
+                mine=mine,
+                status_filter=status_filter,
+                cursor=request.args.get("cursor"),
+                limit=request.args.get("limit", type=int),
+                fields=_parse_fields_arg(),
             )
 
             return reservations, 200
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}, 400
         except Exception as e:
             return {
                 "status": "error",
@@ -234,6 +265,101 @@ class ReservationDetailController(Resource):
             }, 500
 
 
+@reservation_ns.route("/recurring")
+class RecurringReservationController(Resource):
+    @reservation_ns.doc("create_recurring_reservations")
+    @reservation_ns.response(200, "검사 완료 (생성된 예약 없음)")
+    @reservation_ns.response(201, "정기 예약 생성 성공")
+    @reservation_ns.response(400, "잘못된 요청")
+    @reservation_ns.response(500, "서버 오류")
+    @require_permission("reservations.create")
+    def post(self):
+        """
+        정기 예약 신청 (매주 반복)
+
+        요청 예시:
+        {
+            "club_id": 1, "user_id": 1, "room_id": 2,
+            "start_date": "2025-03-03", "end_date": "2025-06-20",
+            "weekdays": ["MON", "WED"], "start_time": "18:00", "end_time": "20:00",
+            "interval_weeks": 1, "exceptions": ["2025-05-05"],
+            "note": "정기 연습", "dry_run": true
+        }
+
+        충돌하는 날짜는 제외하고 나머지만 생성하며, 날짜별 결과(occurrences)를 반환합니다.
+        dry_run이 true면 아무것도 저장하지 않고 검사 결과만 반환합니다.
+        """
+        try:
+            data = request.get_json() or {}
+
+            required_fields = [
+                "club_id",
+                "user_id",
+                "room_id",
+                "start_date",
+                "end_date",
+                "weekdays",
+                "start_time",
+                "end_time",
+            ]
+            for field in required_fields:
+                if field not in data:
+                    return {
+                        "status": "error",
+                        "message": f"필수 필드 '{field}'가 누락되었습니다.",
+                    }, 400
+
+            if not isinstance(data["weekdays"], list):
+                return {
+                    "status": "error",
+                    "message": "weekdays는 배열이어야 합니다.",
+                }, 400
+
+            # 보안 검증: 세션 정보와 요청 데이터 일치 확인
+            session_info = get_session_info()
+            if not session_info:
+                return {
+                    "status": "error",
+                    "message": "로그인이 필요합니다.",
+                }, 401
+
+            if session_info["user"]["user_id"] != data["user_id"]:
+                return {
+                    "status": "error",
+                    "message": "세션의 사용자와 요청한 사용자가 일치하지 않습니다.",
+                }, 403
+
+            user_club_ids = [club["club_id"] for club in session_info["clubs"]]
+            if data["club_id"] not in user_club_ids:
+                return {
+                    "status": "error",
+                    "message": "해당 동아리의 멤버가 아닙니다.",
+                }, 403
+
+            result = ReservationService.create_recurring_reservations(
+                club_id=data["club_id"],
+                user_id=data["user_id"],
+                room_id=data["room_id"],
+                start_date=data["start_date"],
+                end_date=data["end_date"],
+                weekdays=data["weekdays"],
+                start_time=data["start_time"],
+                end_time=data["end_time"],
+                interval_weeks=data.get("interval_weeks", 1),
+                exceptions=data.get("exceptions"),
+                note=data.get("note"),
+                dry_run=bool(data.get("dry_run", False)),
+            )
+            return result, 201 if result["summary"]["created"] else 200
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}, 400
+        except Exception as e:
+            return {
+                "status": "error",
+                "message": f"정기 예약 생성 중 오류가 발생했습니다: {str(e)}",
+            }, 500
+
+
 @reservation_ns.route("/integration")
 class IntegrationReservationController(Resource):
     @reservation_ns.doc("get_all_reservations_integration")
@@ -257,7 +383,23 @@ class IntegrationReservationController(Resource):
         "종료 날짜 필터 (YYYY-MM-DD)",
         type=str,
     )
+    @reservation_ns.param(
+        "cursor",
+        "다음 페이지 커서 (이전 응답의 next_cursor)",
+        type=str,
+    )
+    @reservation_ns.param(
+        "limit",
+        "페이지 크기 (기본 50, 최대 200)",
+        type=int,
+    )
+    @reservation_ns.param(
+        "fields",
+        "응답에 포함할 필드 (쉼표 구분, 예: id,date,start_time,end_time,room,user.name)",
+        type=str,
+    )
     @reservation_ns.response(200, "성공")
+    @reservation_ns.response(400, "잘못된 요청")
     @reservation_ns.response(401, "로그인 필요")
     @reservation_ns.response(500, "서버 오류")
     def get(self):
@@ -285,11 +427,81 @@ class IntegrationReservationController(Resource):
                 club_id=club_id,
                 date_from=date_from,
                 date_to=date_to,
+                cursor=request.args.get("cursor"),
+                limit=request.args.get("limit", type=int),
+                fields=_parse_fields_arg(),
             )
 
             return reservations, 200
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}, 400
         except Exception as e:
             return {
                 "status": "error",
                 "message": f"예약 목록 조회 중 오류가 발생했습니다: {str(e)}",
             }, 500
+
+
+@reservation_ns.route("/integration/export")
+class IntegrationReservationExportController(Resource):
+    @reservation_ns.doc("export_reservations_csv")
+    @reservation_ns.param(
+        "status",
+        "예약 상태 필터 (쉼표 구분)",
+        type=str,
+    )
+    @reservation_ns.param(
+        "club_id",
+        "동아리 ID 필터",
+        type=int,
+    )
+    @reservation_ns.param(
+        "date_from",
+        "시작 날짜 필터 (YYYY-MM-DD)",
+        type=str,
+    )
+    @reservation_ns.param(
+        "date_to",
+        "종료 날짜 필터 (YYYY-MM-DD)",
+        type=str,
+    )
+    @reservation_ns.produces(["text/csv"])
+    @reservation_ns.response(200, "CSV 파일")
+    @reservation_ns.response(400, "잘못된 요청")
+    @reservation_ns.response(500, "서버 오류")
+    @require_permission("reservations.export")
+    def get(self):
+        """예약/청소 현황 CSV 내보내기 (관리자용)"""
+        try:
+            status_filter = request.args.get("status")
+            if status_filter:
+                status_filter = [s.strip() for s in status_filter.split(",")]
+
+            date_from = request.args.get("date_from")
+            date_to = request.args.get("date_to")
+
+            chunks = ReservationExportService.export_reservations_csv(
+                status_filter=status_filter,
+                club_id=request.args.get("club_id", type=int),
+                date_from=date_from,
+                date_to=date_to,
+            )
+
+            # 파일 이름은 검증된 날짜로만 생성 (요청 값을 헤더에 그대로 넣지 않음)
+            filename = ReservationExportService.export_filename(date_from, date_to)
+            # 행을 모두 만든 뒤 응답하지 않고, 생성되는 대로 전송
+            return Response(
+                stream_with_context(chunks),
+                mimetype="text/csv",
+                headers={
+                    "Content-Disposition": f'attachment; filename="{filename}"',
+                    "Cache-Control": "no-store",
+                },
+            )
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}, 400
+        except Exception as e:
+            return {
+                "status": "error",
+                "message": f"예약 내보내기 중 오류가 발생했습니다: {str(e)}",
+            }, 500
@@ -23,6 +23,55 @@ class RoomListController(Resource):
             }, 500
 
 
+@room_ns.route("/availability")
+class RoomsAvailabilityController(Resource):
+    @room_ns.doc("get_rooms_availability")
+    @room_ns.param("date_from", "조회 시작 날짜 (YYYY-MM-DD)", required=True)
+    @room_ns.param("date_to", "조회 종료 날짜 (YYYY-MM-DD, 기본값: date_from)")
+    @room_ns.param("room_ids", "공간 ID 목록 (쉼표 구분, 기본값: 전체 공간)")
+    @room_ns.response(200, "성공")
+    @room_ns.response(400, "잘못된 요청")
+    @room_ns.response(500, "서버 오류")
+    @require_permission("rooms.availability")
+    def get(self):
+        """여러 공간/날짜의 30분 단위 가용시간 일괄 조회"""
+        try:
+            date_from = request.args.get("date_from")
+            if not date_from:
+                return {
+                    "status": "error",
+                    "message": "date_from 파라미터가 필요합니다.",
+                }, 400
+            date_to = request.args.get("date_to") or date_from
+
+            room_ids = None
+            room_ids_param = request.args.get("room_ids")
+            if room_ids_param:
+                try:
+                    room_ids = [
+                        int(room_id)
+                        for room_id in room_ids_param.split(",")
+                        if room_id.strip()
+                    ]
+                except ValueError:
+                    return {
+                        "status": "error",
+                        "message": "room_ids는 쉼표로 구분된 숫자여야 합니다.",
+                    }, 400
+
+            availability = RoomService.get_rooms_availability(
+                date_from, date_to, room_ids
+            )
+            return availability, 200
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}, 400
+        except Exception as e:
+            return {
+                "status": "error",
+                "message": f"가용시간 조회 중 오류가 발생했습니다: {str(e)}",
+            }, 500
+
+
 @room_ns.route("/<int:room_id>/availability")
 class RoomAvailabilityController(Resource):
     @room_ns.doc("get_room_availability")
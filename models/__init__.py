@@ -19,7 +19,11 @@ from .notice_asset import NoticeAsset
 from .banner import Banner
 from .room import Room
 from .reservation import Reservation
+from .room_day import RoomDay
+from .club_daily_usage import ClubDailyUsage
 from .cleaning_photo import CleaningPhoto
+from .image_job import ImageJob
+from .stored_asset import StoredAsset
 
 __all__ = [
     "db",
@@ -39,5 +43,9 @@ __all__ = [
     "Banner",
     "Room",
     "Reservation",
+    "RoomDay",
+    "ClubDailyUsage",
     "CleaningPhoto",
+    "ImageJob",
+    "StoredAsset",
 ]
@@ -11,6 +11,8 @@ class Banner(db.Model):
     club_id = db.Column(db.BigInteger, db.ForeignKey("clubs.id"), nullable=False)
     user_id = db.Column(db.BigInteger, db.ForeignKey("users.id"), nullable=False)
     file_path = db.Column(db.String(255), nullable=False)
+    # 크기별 이미지 변형 URL (변환 완료 후 저장)
+    image_variants = db.Column(db.JSON, nullable=True)
     position = db.Column(
         db.Enum("TOP", "BOTTOM", name="banner_position"),
         nullable=False,
@@ -12,6 +12,8 @@ class CleaningPhoto(db.Model):
         db.BigInteger, db.ForeignKey("reservations.id"), nullable=False
     )
     file_url = db.Column(db.Text, nullable=False)
+    # 크기별 이미지 변형 URL (변환 완료 후 저장)
+    image_variants = db.Column(db.JSON, nullable=True)
     note = db.Column(db.Text, nullable=True)
     created_at = db.Column(db.DateTime, nullable=False, default=get_kst_utcnow)
 
@@ -24,6 +24,9 @@ class Club(db.Model):
     recruitment_finish = db.Column(db.Date, nullable=True)
     logo_image = db.Column(db.Text, nullable=True)
     introduction_image = db.Column(db.Text, nullable=True)
+    # 크기별 이미지 변형 URL (변환 완료 후 저장)
+    logo_image_variants = db.Column(db.JSON, nullable=True)
+    introduction_image_variants = db.Column(db.JSON, nullable=True)
     club_room = db.Column(db.Text, nullable=True)
     created_at = db.Column(db.DateTime, nullable=False, default=get_kst_utcnow)
     updated_at = db.Column(
@@ -0,0 +1,28 @@
+from utils.time_utils import get_kst_utcnow
+
+from . import db
+
+
+class ClubDailyUsage(db.Model):
+    """
+    동아리/날짜별 공간 사용량 집계
+
+    예약 생성/취소/상태 변경 시 같은 트랜잭션에서 갱신되며, 일간/주간 사용 시간은
+    예약 목록을 다시 계산하지 않고 이 테이블에서 조회합니다.
+    """
+
+    __tablename__ = "club_daily_usage"
+
+    club_id = db.Column(db.BigInteger, db.ForeignKey("clubs.id"), primary_key=True)
+    date = db.Column(db.Date, primary_key=True)
+    # 사용한 30분 슬롯 수 (모든 공간 합계)
+    used_slots = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=get_kst_utcnow,
+        onupdate=get_kst_utcnow,
+    )
+
+    def __repr__(self):
+        return f"<ClubDailyUsage {self.club_id}:{self.date} {self.used_slots}>"
@@ -0,0 +1,48 @@
+from utils.time_utils import get_kst_utcnow
+
+from . import db
+
+
+class ImageJob(db.Model):
+    """
+    업로드 이미지 WebP 변환 작업
+
+    업로드 요청은 원본 파일을 저장하고 즉시 응답하며, 변환은 워커 풀에서 처리됩니다.
+    변환이 끝나면 대상 행(배너/동아리/공지 첨부/청소 사진)의 이미지 URL을 원본에서
+    변환본으로 교체합니다.
+    """
+
+    __tablename__ = "image_jobs"
+
+    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    # 변환 결과를 반영할 대상 (BANNER, CLUB_LOGO, CLUB_INTRODUCTION, NOTICE_ASSET, CLEANING_PHOTO)
+    target_type = db.Column(db.String(30), nullable=False)
+    target_id = db.Column(db.BigInteger, nullable=False)
+    # 원본 파일 (변환 전까지 대상 행이 가리키는 URL)
+    source_path = db.Column(db.String(500), nullable=False)
+    source_url = db.Column(db.String(255), nullable=False)
+    # 변환 결과 파일
+    output_path = db.Column(db.String(500), nullable=False)
+    output_url = db.Column(db.String(255), nullable=False)
+    status = db.Column(
+        db.Enum("PENDING", "PROCESSING", "DONE", "FAILED", "CANCELLED"),
+        nullable=False,
+        default="PENDING",
+    )
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=get_kst_utcnow)
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=get_kst_utcnow,
+        onupdate=get_kst_utcnow,
+    )
+
+    # 재시도 대상 조회용 인덱스
+    __table_args__ = (
+        db.Index("idx_image_jobs_status_updated", "status", "updated_at"),
+    )
+
+    def __repr__(self):
+        return f"<ImageJob {self.id} {self.target_type}:{self.target_id} {self.status}>"
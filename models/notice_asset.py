@@ -13,6 +13,8 @@ class NoticeAsset(db.Model):
     )
     asset_type = db.Column(db.Enum("IMAGE", "FILE", name="asset_type"), nullable=False)
     file_url = db.Column(db.String(255), nullable=False)
+    # 크기별 이미지 변형 URL (IMAGE 타입, 변환 완료 후 저장)
+    image_variants = db.Column(db.JSON, nullable=True)
     original_filename = db.Column(db.String(255), nullable=True)  # 원본 파일명 저장
     created_at = db.Column(db.DateTime, nullable=False, default=get_kst_utcnow)
 
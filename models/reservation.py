@@ -30,6 +30,13 @@ class Reservation(db.Model):
         onupdate=get_kst_utcnow,
     )
 
+    # 공간/날짜별 예약 충돌 검사용 인덱스
+    __table_args__ = (
+        db.Index("idx_reservations_room_date_status", "room_id", "date", "status"),
+        # 예약 목록 최신순 커서 페이지네이션용 인덱스
+        db.Index("idx_reservations_date_start_id", "date", "start_time", "id"),
+    )
+
     # 관계 설정
     club = db.relationship("Club", backref="reservations")
     user = db.relationship("User", backref="reservations")
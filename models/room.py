@@ -1,4 +1,6 @@
-from datetime import datetime
+from datetime import datetime, time
+from sqlalchemy.orm import validates
+from utils.reservation_slots import SLOT_MINUTES
 from utils.time_utils import get_kst_utcnow
 
 from . import db
@@ -12,6 +14,14 @@ class Room(db.Model):
     location = db.Column(db.String(255), nullable=True)
     description = db.Column(db.Text, nullable=True)
     max_daily_hours = db.Column(db.Integer, nullable=False, default=6)
+    # 운영 시간 (가용시간 조회 시 이 범위 안의 30분 슬롯만 예약 가능으로 표시)
+    # close_time이 00:00(utils.reservation_slots.END_OF_DAY)이면 24:00까지 운영
+    open_time = db.Column(
+        db.Time, nullable=False, default=time(9, 0), server_default="09:00:00"
+    )
+    close_time = db.Column(
+        db.Time, nullable=False, default=time(22, 0), server_default="22:00:00"
+    )
     created_at = db.Column(db.DateTime, nullable=False, default=get_kst_utcnow)
     updated_at = db.Column(
         db.DateTime,
@@ -23,5 +33,14 @@ class Room(db.Model):
     # 관계 설정
     reservations = db.relationship("Reservation", back_populates="room")
 
+    @validates("open_time", "close_time")
+    def validate_operating_time(self, key, value):
+        """운영 시간은 30분 단위만 허용 (운영 종료 00:00은 24:00)"""
+        if value is None:
+            return value
+        if value.second or value.microsecond or value.minute % SLOT_MINUTES:
+            raise ValueError(f"{key}는 {SLOT_MINUTES}분 단위여야 합니다: {value}")
+        return value
+
     def __repr__(self):
         return f"<Room {self.name}>"
@@ -0,0 +1,21 @@
+from utils.time_utils import get_kst_utcnow
+
+from . import db
+
+
+class RoomDay(db.Model):
+    """
+    공간-날짜 단위 잠금 행
+
+    예약 생성 시 이 행을 SELECT ... FOR UPDATE로 잠가, 같은 공간/날짜의 예약 충돌 검사와
+    생성이 동시에 실행되지 않도록 직렬화합니다.
+    """
+
+    __tablename__ = "room_days"
+
+    room_id = db.Column(db.BigInteger, db.ForeignKey("rooms.id"), primary_key=True)
+    date = db.Column(db.Date, primary_key=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=get_kst_utcnow)
+
+    def __repr__(self):
+        return f"<RoomDay {self.room_id}:{self.date}>"
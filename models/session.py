@@ -17,6 +17,11 @@ class UserSession(db.Model):
     expires_at = db.Column(db.DateTime, nullable=False)
     is_active = db.Column(db.Boolean, nullable=False, default=True)
 
+    # 만료 세션 정리 작업의 배치 조회용 인덱스
+    __table_args__ = (
+        db.Index("idx_user_sessions_active_expires", "is_active", "expires_at"),
+    )
+
     # 관계 설정
     user = db.relationship("User", backref="sessions")
 
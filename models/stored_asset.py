@@ -0,0 +1,50 @@
+from utils.time_utils import get_kst_utcnow
+
+from . import db
+
+
+class StoredAsset(db.Model):
+    """
+    내용 주소 기반 업로드 이미지 저장소 항목
+
+    같은 내용(SHA-256)의 이미지는 네임스페이스(banners/clubs/notices/reservations)마다
+    한 번만 저장/변환하고, 이미지를 가리키는 행 수를 ref_count로 관리합니다.
+    마지막 참조가 해제되면 원본/변환본 파일과 함께 삭제됩니다.
+    """
+
+    __tablename__ = "stored_assets"
+
+    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    namespace = db.Column(db.String(20), nullable=False)
+    content_hash = db.Column(db.String(64), nullable=False)
+    size_bytes = db.Column(db.BigInteger, nullable=False)
+    # 업로드 원본 (변환 전까지 참조 행이 가리키는 URL)
+    source_path = db.Column(db.String(500), nullable=False)
+    source_url = db.Column(db.String(255), nullable=False)
+    # 변환 결과 파일과 크기별 변형 URL (READY 이후 사용)
+    file_path = db.Column(db.String(500), nullable=False)
+    file_url = db.Column(db.String(255), nullable=False)
+    image_variants = db.Column(db.JSON, nullable=True)
+    status = db.Column(
+        db.Enum("PENDING", "READY", name="stored_asset_status"),
+        nullable=False,
+        default="PENDING",
+    )
+    ref_count = db.Column(db.Integer, nullable=False, default=1)
+    created_at = db.Column(db.DateTime, nullable=False, default=get_kst_utcnow)
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=get_kst_utcnow,
+        onupdate=get_kst_utcnow,
+    )
+
+    __table_args__ = (
+        db.UniqueConstraint(
+            "namespace", "content_hash", name="uq_stored_assets_namespace_hash"
+        ),
+        db.Index("idx_stored_assets_file_path", "file_path"),
+    )
+
+    def __repr__(self):
+        return f"<StoredAsset {self.namespace}:{self.content_hash[:12]} refs={self.ref_count}>"
@@ -25,6 +25,10 @@ def health_check():
     except Exception as e:
         db_status = f"error: {str(e)}"
 
+    # 비밀번호 해시/이미지 변환 워커 풀 상태 (대기열 길이 등)
+    from utils.password_hasher import password_hasher
+    from utils.image_worker import image_worker
+
     # 서버 시간 (KST)
     kst = pytz.timezone("Asia/Seoul")
     server_time = datetime.now(kst)
@@ -34,6 +38,8 @@ def health_check():
             "status": "healthy",
             "message": "ClubU Backend API is running",
             "database": db_status,
+            "password_hashing": password_hasher.metrics(),
+            "image_processing": image_worker.metrics(),
             "server_time": {
                 "iso": server_time.isoformat(),
                 "formatted": server_time.strftime("%Y-%m-%d %H:%M:%S %Z"),
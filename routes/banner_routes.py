@@ -7,6 +7,7 @@ from controllers.banner_controller import (
     BannerAllController,
     BannerClubsController,
 )
+from utils.upload_stream import DEFAULT_IMAGE_FILE_MAX_BYTES, upload_limit
 
 # 네임스페이스 등록
 banner_ns = Namespace("banners", description="배너 관리 API")
@@ -119,6 +120,9 @@ banner_clubs_response_model = banner_ns.model(
 class BannerResource(BannerController):
     """배너 관리 리소스"""
 
+    @upload_limit(
+        "IMAGE_MAX_FILE_BYTES", DEFAULT_IMAGE_FILE_MAX_BYTES, single_file=True
+    )
     @banner_ns.doc(
         "create_banner", consumes=["multipart/form-data"], security="sessionAuth"
     )
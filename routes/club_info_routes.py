@@ -5,6 +5,7 @@ from controllers.club_info_controller import (
     ClubLogoImageController,
     ClubIntroductionImageController,
 )
+from utils.upload_stream import DEFAULT_IMAGE_FILE_MAX_BYTES, upload_limit
 
 # 네임스페이스 등록
 club_info_ns = Namespace("club-info", description="동아리 정보 수정 API")
@@ -42,6 +43,9 @@ introduction_image_parser.add_argument(
 class ClubLogoImageResource(ClubLogoImageController):
     """동아리 로고 이미지 관리 리소스"""
 
+    @upload_limit(
+        "IMAGE_MAX_FILE_BYTES", DEFAULT_IMAGE_FILE_MAX_BYTES, single_file=True
+    )
     @club_info_ns.expect(logo_image_parser)
     @club_info_ns.doc("upload_club_logo", consumes=["multipart/form-data"])
     def put(self, club_id):
@@ -59,6 +63,9 @@ class ClubLogoImageResource(ClubLogoImageController):
 class ClubIntroductionImageResource(ClubIntroductionImageController):
     """동아리 소개글 이미지 관리 리소스"""
 
+    @upload_limit(
+        "IMAGE_MAX_FILE_BYTES", DEFAULT_IMAGE_FILE_MAX_BYTES, single_file=True
+    )
     @club_info_ns.expect(introduction_image_parser)
     @club_info_ns.doc(
         "upload_club_introduction_image", consumes=["multipart/form-data"]
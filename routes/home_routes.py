@@ -359,24 +359,14 @@ class OpenClubsResource(ClubListController):
 
     def get(self):
         """모집 중인 동아리 목록을 반환합니다"""
-        from services.home_service import get_open_clubs
+        from flask import Response
+        from services.home_service import get_open_clubs_json
 
         try:
-            clubs_data = get_open_clubs()
-
-            # 모집 중인 동아리가 없는 경우
-            if not clubs_data:
-                return {
-                    "count": 0,
-                    "clubs": [],
-                    "message": "모집 중인 동아리가 없습니다",
-                }, 200
-
-            # 모집 중인 동아리가 있는 경우
-            return {
-                "count": len(clubs_data),
-                "clubs": clubs_data,
-            }, 200
+            # 카탈로그 캐시에 직렬화된 응답을 그대로 반환
+            return Response(
+                get_open_clubs_json(), status=200, mimetype="application/json"
+            )
 
         except ValueError as e:
             return {"status": "error", "message": str(e), "code": "400-01"}, 400
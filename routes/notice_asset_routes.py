@@ -3,6 +3,11 @@ from werkzeug.datastructures import FileStorage
 from controllers.notice_image_controller import NoticeImageController
 from controllers.notice_file_controller import NoticeFileController
 from controllers.notice_asset_controller import NoticeAssetController
+from utils.upload_stream import (
+    DEFAULT_IMAGE_FILE_MAX_BYTES,
+    DEFAULT_NOTICE_FILE_MAX_BYTES,
+    upload_limit,
+)
 
 # 네임스페이스 생성
 notice_asset_ns = Namespace(
@@ -51,6 +56,7 @@ file_parser.add_argument(
 class NoticeImageResource(NoticeImageController):
     """공지사항 이미지 관리 리소스"""
 
+    @upload_limit("IMAGE_MAX_FILE_BYTES", DEFAULT_IMAGE_FILE_MAX_BYTES)
     @notice_asset_ns.expect(image_parser)
     @notice_asset_ns.doc("upload_notice_images", consumes=["multipart/form-data"])
     @notice_asset_ns.response(200, "이미지들 업로드 성공")
@@ -81,6 +87,7 @@ class NoticeImageResource(NoticeImageController):
 class NoticeFileResource(NoticeFileController):
     """공지사항 파일 관리 리소스"""
 
+    @upload_limit("NOTICE_FILE_MAX_BYTES", DEFAULT_NOTICE_FILE_MAX_BYTES)
     @notice_asset_ns.expect(file_parser)
     @notice_asset_ns.doc("upload_notice_files", consumes=["multipart/form-data"])
     @notice_asset_ns.response(200, "파일들 업로드 성공")
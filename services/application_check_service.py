@@ -223,6 +223,11 @@ def register_club_member(
 
         db.session.commit()
 
+        # 권한 캐시 삭제
+        from services.permission_service import permission_service
+
+        permission_service.clear_user_cache(user_id)
+
         # 등록된 회원 정보 반환
         member_info = (
             db.session.query(ClubMember, User, Club, Role)
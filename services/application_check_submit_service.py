@@ -7,6 +7,7 @@ from models import (
     User,
     Club,
 )
+from services.club_service import get_club_recruitment_status
 from utils.time_utils import get_kst_now_naive
 
 
@@ -62,8 +63,8 @@ def submit_application(club_id: int, user_id: int, answers_data: list[dict]):
         if not club:
             raise ValueError("존재하지 않는 동아리입니다")
 
-        # 모집 상태 확인
-        if club.recruitment_status == "CLOSED":
+        # 모집 상태 확인 (모집 기간을 반영한 실제 상태)
+        if get_club_recruitment_status(club) == "CLOSED":
             raise ValueError("모집이 마감된 동아리입니다")
 
         user = User.query.get(user_id)
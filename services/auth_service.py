@@ -1,7 +1,8 @@
 import re
 from datetime import datetime
-from werkzeug.security import generate_password_hash, check_password_hash
+from flask import current_app
 from models import db, User, Role, ClubMember
+from utils.password_hasher import PasswordHashBusyError, password_hasher
 from utils.time_utils import get_kst_now_naive
 
 
@@ -90,7 +91,7 @@ def create_user(user_data):
         new_user = User(
             name=user_data["username"],  # username을 name으로 사용
             email=user_data["email"],
-            password=generate_password_hash(user_data["password"]),
+            password=password_hasher.hash(user_data["password"]),
             student_id=user_data["student_id"],  # 실제 학번
             department_id=user_data["department_id"],  # 사용자가 선택한 학과
             phone_number=normalized_phone,  # 정규화된 전화번호 (숫자만)
@@ -131,6 +132,10 @@ def create_user(user_data):
             ),
         }
 
+    except PasswordHashBusyError:
+        # 해시 대기열 초과는 그대로 전달 (503 처리용)
+        db.session.rollback()
+        raise
     except Exception as e:
         db.session.rollback()
         raise Exception(f"사용자 생성 중 오류 발생: {str(e)}")
@@ -143,9 +148,20 @@ def authenticate_user(email, password):
         if not user:
             raise ValueError("이메일 또는 비밀번호가 올바르지 않습니다.")
 
-        if not check_password_hash(user.password, password):
+        if not password_hasher.verify(user.password, password):
             raise ValueError("이메일 또는 비밀번호가 올바르지 않습니다.")
 
+        # 해시 방식/비용이 변경된 경우 새 방식으로 재해시 (실패해도 로그인은 진행)
+        if password_hasher.needs_rehash(user.password):
+            try:
+                user.password = password_hasher.hash(password)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                current_app.logger.exception(
+                    f"비밀번호 재해시 중 오류 발생: user_id={user.id}"
+                )
+
         return {
             "user_id": user.id,
             "name": user.name,
@@ -153,8 +169,8 @@ def authenticate_user(email, password):
             "created_at": user.created_at.isoformat() if user.created_at else None,
         }
 
-    except ValueError:
-        # ValueError는 그대로 전달 (401 처리용)
+    except (ValueError, PasswordHashBusyError):
+        # ValueError는 그대로 전달 (401 처리용), 해시 대기열 초과는 503 처리용
         raise
     except Exception as e:
         raise Exception(f"사용자 인증 중 오류 발생: {str(e)}")
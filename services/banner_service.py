@@ -2,6 +2,7 @@ from datetime import datetime, date
 from typing import List, Dict, Any
 from models import Banner, Club, ClubCategory, ClubMember, Role, db
 from utils.image_utils import delete_banner_image, save_banner_image
+from services.image_job_service import enqueue_image_job
 
 
 def create_banner(club_id, user_id, banner_data, image_file):
@@ -19,30 +20,35 @@ def create_banner(club_id, user_id, banner_data, image_file):
             current_app.logger.error(f"Club not found: {club_id}")
             raise ValueError("해당 동아리를 찾을 수 없습니다")
 
-        # 이미지 저장 및 최적화
-        current_app.logger.info(f"Saving banner image for club_id: {club_id}")
-        image_info = save_banner_image(image_file, club_id)
-
-        # 날짜 변환
+        # 날짜 변환 (입력 검증은 이미지 저장 전에 끝내 저장소에 참조를 남기지 않음)
         start_date = datetime.strptime(banner_data["start_date"], "%Y-%m-%d").date()
         end_date = datetime.strptime(banner_data["end_date"], "%Y-%m-%d").date()
+        title = banner_data["title"]
+
+        # 이미지 저장 및 최적화 (실패 시 아래 rollback으로 참조 수 증가도 취소됨)
+        current_app.logger.info(f"Saving banner image for club_id: {club_id}")
+        image_info = save_banner_image(image_file, club_id)
 
         # 배너 생성
         new_banner = Banner(
             club_id=club_id,
             user_id=user_id,
             file_path=image_info["file_path"],
+            image_variants=image_info["image_variants"],
             position=banner_data.get("position", "TOP"),
             status="WAITING",
             start_date=start_date,
             end_date=end_date,
-            title=banner_data["title"],
+            title=title,
             description=banner_data.get("description", ""),
         )
 
         db.session.add(new_banner)
         db.session.commit()
 
+        # WebP 변환은 백그라운드에서 처리 (완료되면 file_path가 변환본으로 교체됨)
+        image_job = enqueue_image_job("BANNER", new_banner.id, image_info)
+
         current_app.logger.info(f"Banner created successfully: {new_banner.id}")
 
         return {
@@ -57,6 +63,7 @@ def create_banner(club_id, user_id, banner_data, image_file):
             "end_date": new_banner.end_date.isoformat(),
             "title": new_banner.title,
             "description": new_banner.description,
+            "image_job": image_job,
         }
 
     except Exception as e:
@@ -117,6 +124,8 @@ def get_banners(status=None, position=None):
                 "categoryName": category.name,
                 "file_path": banner.file_path,
                 "clublogoImageUrl": club.logo_image,
+                "image_variants": banner.image_variants,
+                "clublogoImageVariants": club.logo_image_variants,
                 "position": banner.position,
                 "status": banner.status,
                 "uploaded_at": banner.uploaded_at.isoformat(),
@@ -161,6 +170,8 @@ def get_all_banners(status=None, position=None):
                 "categoryName": category.name,
                 "file_path": banner.file_path,
                 "clublogoImageUrl": club.logo_image,
+                "image_variants": banner.image_variants,
+                "clublogoImageVariants": club.logo_image_variants,
                 "position": banner.position,
                 "status": banner.status,
                 "uploaded_at": banner.uploaded_at.isoformat(),
@@ -201,6 +212,8 @@ def get_banner_by_id(banner_id):
             "categoryName": category.name,
             "file_path": banner.file_path,
             "clublogoImageUrl": club.logo_image,
+            "image_variants": banner.image_variants,
+            "clublogoImageVariants": club.logo_image_variants,
             "position": banner.position,
             "status": banner.status,
             "uploaded_at": banner.uploaded_at.isoformat(),
@@ -349,6 +362,8 @@ def get_banners_by_clubs(club_ids: List[int], user_id: int) -> Dict[str, Any]:
                     "categoryName": category.name,
                     "file_path": banner.file_path,
                     "clublogoImageUrl": club.logo_image,
+                    "image_variants": banner.image_variants,
+                    "clublogoImageVariants": club.logo_image_variants,
                     "position": banner.position,
                     "status": banner.status,
                     "uploaded_at": banner.uploaded_at.isoformat(),
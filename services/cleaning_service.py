@@ -2,6 +2,8 @@ from datetime import datetime
 from typing import List, Dict, Optional
 from sqlalchemy import and_
 from models import db, Reservation, CleaningPhoto, ClubMember
+from services.reservation_service import ReservationService
+from services.image_job_service import enqueue_image_job
 from utils.image_utils import save_cleaning_photo, delete_cleaning_photo
 from utils.time_utils import get_kst_now
 import os
@@ -118,6 +120,7 @@ class CleaningService:
         cleaning_photo = CleaningPhoto(
             reservation_id=reservation_id,
             file_url=file_url,
+            image_variants=image_info["image_variants"],
             note=note,
         )
 
@@ -128,12 +131,16 @@ class CleaningService:
 
         db.session.commit()
 
+        # WebP 변환은 백그라운드에서 처리 (완료되면 file_url이 변환본으로 교체됨)
+        image_job = enqueue_image_job("CLEANING_PHOTO", cleaning_photo.id, image_info)
+
         return {
             "id": cleaning_photo.id,
             "reservation_id": cleaning_photo.reservation_id,
             "file_url": cleaning_photo.file_url,
             "note": cleaning_photo.note,
             "created_at": cleaning_photo.created_at.isoformat(),
+            "image_job": image_job,
         }
 
     @staticmethod
@@ -268,10 +275,10 @@ class CleaningService:
 
         # 예약 상태 및 관리자 메모 업데이트
         if action == "approve":
-            reservation.status = "CLEANING_DONE"
+            ReservationService.change_status(reservation, "CLEANING_DONE")
             message = "청소 사진이 승인되었습니다."
         else:  # reject
-            reservation.status = "CLEANING_PHOTO_REJECT"
+            ReservationService.change_status(reservation, "CLEANING_PHOTO_REJECT")
             # is_photo_submitted는 True로 유지 (재제출 없음)
             message = "청소 사진이 반려되었습니다."
 
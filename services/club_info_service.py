@@ -1,5 +1,8 @@
-from models import Club, ClubMember, db
+from models import Club, db
+from services.permission_service import permission_service
+from utils.catalog_cache import invalidate_club_catalog
 from utils.image_utils import save_club_image, delete_club_image
+from services.image_job_service import enqueue_image_job
 
 
 def update_club_introduction(club_id, introduction):
@@ -11,6 +14,7 @@ def update_club_introduction(club_id, introduction):
 
         club.introduction = introduction
         db.session.commit()
+        invalidate_club_catalog()
 
         return {
             "id": club.id,
@@ -33,6 +37,7 @@ def delete_club_introduction(club_id):
 
         club.introduction = None
         db.session.commit()
+        invalidate_club_catalog()
 
         return {
             "id": club.id,
@@ -53,21 +58,28 @@ def update_club_logo_image(club_id, image_file):
         if not club:
             raise ValueError("해당 동아리를 찾을 수 없습니다")
 
-        # 기존 이미지 삭제
+        # 새 이미지 저장 (같은 이미지면 기존 변환본 재사용)
+        image_info = save_club_image(image_file, club_id, "logo")
+
+        # 기존 이미지 삭제 (새 이미지 저장 후 참조를 해제해야 같은 이미지 재업로드 시 재사용됨)
         if club.logo_image:
             old_file_path = club.logo_image.replace("/clubs/", "clubs/")
             delete_club_image(old_file_path)
 
-        # 새 이미지 저장
-        image_info = save_club_image(image_file, club_id, "logo")
         club.logo_image = image_info["file_path"]
+        club.logo_image_variants = image_info["image_variants"]
         db.session.commit()
+        invalidate_club_catalog()
+
+        # WebP 변환은 백그라운드에서 처리 (완료되면 logo_image이 변환본으로 교체됨)
+        image_job = enqueue_image_job("CLUB_LOGO", club.id, image_info)
 
         return {
             "id": club.id,
             "name": club.name,
             "logo_image": club.logo_image,
             "updated_at": club.updated_at.isoformat(),
+            "image_job": image_job,
         }
 
     except Exception as e:
@@ -88,7 +100,9 @@ def delete_club_logo_image(club_id):
             delete_club_image(old_file_path)
 
         club.logo_image = None
+        club.logo_image_variants = None
         db.session.commit()
+        invalidate_club_catalog()
 
         return {
             "id": club.id,
@@ -109,21 +123,28 @@ def update_club_introduction_image(club_id, image_file):
         if not club:
             raise ValueError("해당 동아리를 찾을 수 없습니다")
 
-        # 기존 이미지 삭제
+        # 새 이미지 저장 (같은 이미지면 기존 변환본 재사용)
+        image_info = save_club_image(image_file, club_id, "introduction")
+
+        # 기존 이미지 삭제 (새 이미지 저장 후 참조를 해제해야 같은 이미지 재업로드 시 재사용됨)
         if club.introduction_image:
             old_file_path = club.introduction_image.replace("/clubs/", "clubs/")
             delete_club_image(old_file_path)
 
-        # 새 이미지 저장
-        image_info = save_club_image(image_file, club_id, "introduction")
         club.introduction_image = image_info["file_path"]
+        club.introduction_image_variants = image_info["image_variants"]
         db.session.commit()
+        invalidate_club_catalog()
+
+        # WebP 변환은 백그라운드에서 처리 (완료되면 introduction_image이 변환본으로 교체됨)
+        image_job = enqueue_image_job("CLUB_INTRODUCTION", club.id, image_info)
 
         return {
             "id": club.id,
             "name": club.name,
             "introduction_image": club.introduction_image,
             "updated_at": club.updated_at.isoformat(),
+            "image_job": image_job,
         }
 
     except Exception as e:
@@ -144,7 +165,9 @@ def delete_club_introduction_image(club_id):
             delete_club_image(old_file_path)
 
         club.introduction_image = None
+        club.introduction_image_variants = None
         db.session.commit()
+        invalidate_club_catalog()
 
         return {
             "id": club.id,
@@ -161,12 +184,8 @@ def delete_club_introduction_image(club_id):
 def check_club_president_permission(user_id, club_id):
     """사용자가 해당 동아리의 회장인지 확인"""
     try:
-        # 동아리 회장 권한 확인
-        club_member = ClubMember.query.filter_by(
-            user_id=user_id, club_id=club_id, role_id=4  # CLUB_PRESIDENT
-        ).first()
-
-        if not club_member:
+        # 동아리 회장 권한 확인 (현재 요청의 인증 정보가 있으면 DB 조회 생략)
+        if not permission_service.has_role(user_id, "CLUB_PRESIDENT", club_id):
             raise ValueError("동아리 회장 권한이 필요합니다")
 
         return True
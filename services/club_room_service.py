@@ -1,7 +1,14 @@
 from datetime import datetime, date, time, timedelta
 from typing import List, Dict, Optional
+from flask import current_app
 from sqlalchemy import and_, or_
+from sqlalchemy.orm import joinedload
 from models import db, Room, Reservation, Club, User
+from services.reservation_service import (
+    ACTIVE_RESERVATION_STATUSES,
+    ReservationService,
+)
+from utils.reservation_slots import interval_mask, slot_count, slot_hours
 
 
 class ClubRoomService:
@@ -21,85 +28,60 @@ class ClubRoomService:
         if not club:
             raise ValueError(f"ID {club_id}에 해당하는 동아리를 찾을 수 없습니다.")
 
-        # 해당 날짜의 동아리 예약 조회
-        reservations = Reservation.query.filter(
-            and_(
-                Reservation.club_id == club_id,
-                Reservation.date == target_date_obj,
-                Reservation.status != "CANCELLED",
-            )
-        ).all()
-
         # 해당 주의 시작일과 종료일 계산 (월요일부터 일요일까지)
         week_start = target_date_obj - timedelta(days=target_date_obj.weekday())
         week_end = week_start + timedelta(days=6)
 
-        # 해당 주의 모든 예약 조회
-        week_reservations = Reservation.query.filter(
-            and_(
-                Reservation.club_id == club_id,
-                Reservation.date >= week_start,
-                Reservation.date <= week_end,
-                Reservation.status != "CANCELLED",
+        # 사용 시간 합계는 동아리/날짜별 사용량 집계에서 조회
+        # (집계 행이 없는 날짜는 사용량 재검증 작업이 예약 기준으로 생성)
+        usage_slots = ReservationService.get_club_usage_slots(
+            club_id, week_start, week_end
+        )
+        daily_used_hours = slot_hours(usage_slots.get(target_date_obj, 0))
+        weekly_used_hours = slot_hours(sum(usage_slots.values()))
+
+        # 해당 주의 예약 목록 조회 (응답의 예약 상세 목록용, 그날 예약은 이 중에서 선택)
+        week_reservations = (
+            Reservation.query.options(joinedload(Reservation.room))
+            .filter(
+                and_(
+                    Reservation.club_id == club_id,
+                    Reservation.date >= week_start,
+                    Reservation.date <= week_end,
+                    Reservation.status.in_(ACTIVE_RESERVATION_STATUSES),
+                )
             )
-        ).all()
+            .order_by(Reservation.date, Reservation.start_time)
+            .all()
+        )
 
-        # 그날 사용한 시간 계산
-        daily_used_hours = 0
         daily_reservation_details = []
-
-        for reservation in reservations:
-            # 시간 차이 계산
-            start_datetime = datetime.combine(reservation.date, reservation.start_time)
-            end_datetime = datetime.combine(reservation.date, reservation.end_time)
-            duration = end_datetime - start_datetime
-            used_hours = duration.total_seconds() / 3600  # 시간 단위로 변환
-
-            daily_used_hours += used_hours
-
-            daily_reservation_details.append(
-                {
-                    "id": reservation.id,
-                    "room_name": (
-                        reservation.room.name if reservation.room else "알 수 없음"
-                    ),
-                    "start_time": reservation.start_time.strftime("%H:%M"),
-                    "end_time": reservation.end_time.strftime("%H:%M"),
-                    "duration_hours": round(used_hours, 1),
-                    "status": reservation.status,
-                }
-            )
-
-        # 그주 사용한 시간 계산
-        weekly_used_hours = 0
         weekly_reservation_details = []
 
         for reservation in week_reservations:
-            # 시간 차이 계산
-            start_datetime = datetime.combine(reservation.date, reservation.start_time)
-            end_datetime = datetime.combine(reservation.date, reservation.end_time)
-            duration = end_datetime - start_datetime
-            used_hours = duration.total_seconds() / 3600  # 시간 단위로 변환
-
-            weekly_used_hours += used_hours
-
-            weekly_reservation_details.append(
-                {
-                    "id": reservation.id,
-                    "date": reservation.date.strftime("%Y-%m-%d"),
-                    "room_name": (
-                        reservation.room.name if reservation.room else "알 수 없음"
-                    ),
-                    "start_time": reservation.start_time.strftime("%H:%M"),
-                    "end_time": reservation.end_time.strftime("%H:%M"),
-                    "duration_hours": round(used_hours, 1),
-                    "status": reservation.status,
-                }
+            used_hours = slot_hours(
+                slot_count(interval_mask(reservation.start_time, reservation.end_time))
             )
-
-        # 제한 시간 설정
-        max_daily_hours = 6
-        max_weekly_hours = 20  # 주간 최대 사용 시간
+            detail = {
+                "id": reservation.id,
+                "room_name": (
+                    reservation.room.name if reservation.room else "알 수 없음"
+                ),
+                "start_time": reservation.start_time.strftime("%H:%M"),
+                "end_time": reservation.end_time.strftime("%H:%M"),
+                "duration_hours": round(used_hours, 1),
+                "status": reservation.status,
+            }
+
+            if reservation.date == target_date_obj:
+                daily_reservation_details.append(dict(detail))
+
+            detail["date"] = reservation.date.strftime("%Y-%m-%d")
+            weekly_reservation_details.append(detail)
+
+        # 제한 시간 설정 (동아리 정책)
+        max_daily_hours = current_app.config.get("CLUB_MAX_DAILY_HOURS", 6)
+        max_weekly_hours = current_app.config.get("CLUB_MAX_WEEKLY_HOURS", 20)
 
         daily_remaining_hours = max(0, max_daily_hours - daily_used_hours)
         weekly_remaining_hours = max(0, max_weekly_hours - weekly_used_hours)
@@ -1,18 +1,26 @@
 """
 동아리 관련 서비스
 모집 기간 관리 및 D-day 계산
+
+모집 상태(OPEN/CLOSED) 전이는 스케줄러가 apply_recruitment_transitions로 DB에 반영하고,
+조회 API는 get_effective_recruitment_status로 모집 기간을 메모리에서 반영하여
+DB 쓰기 없이도 자정 직후부터 올바른 상태를 반환합니다.
 """
 
-from datetime import date
+from datetime import datetime, time
+from sqlalchemy import func, or_
 from models import db, Club
+from utils.catalog_cache import invalidate_club_catalog
+from utils.time_utils import get_kst_today
 
 
-def calculate_recruitment_d_day(recruitment_finish):
+def calculate_recruitment_d_day(recruitment_finish, today=None):
     """
     모집 마감일까지의 D-day 계산
 
     Args:
         recruitment_finish: 모집 마감일 (date 객체 또는 None)
+        today: 기준 날짜 (None이면 오늘, KST)
 
     Returns:
         int: D-day 값
@@ -24,39 +32,90 @@ def calculate_recruitment_d_day(recruitment_finish):
     if recruitment_finish is None:
         return None
 
-    today = date.today()
+    if today is None:
+        today = get_kst_today()
     delta = (recruitment_finish - today).days
     return delta
 
 
-def close_expired_recruitments():
-    """recruitment_finish가 지났거나, recruitment_start가 오늘보다 이전인 동아리를 자동으로 CLOSED로 변경"""
+def get_effective_recruitment_status(
+    recruitment_status,
+    recruitment_start,
+    recruitment_finish,
+    updated_at=None,
+    today=None,
+):
+    """
+    저장된 모집 상태에 모집 기간을 반영한 실제 모집 상태 계산 (DB 변경 없음)
+
+    스케줄러 전이 규칙(apply_recruitment_transitions)과 동일한 규칙을 사용합니다.
+    - OPEN이지만 모집 기간 밖이거나 기간이 없으면 CLOSED
+    - CLOSED이지만 모집 기간 안이고, 오늘이 모집 시작일이거나
+      모집 시작일 이후 수동으로 변경된 적이 없으면 OPEN
+
+    Args:
+        recruitment_status: DB에 저장된 모집 상태 ("OPEN" 또는 "CLOSED")
+        recruitment_start: 모집 시작일 (date 또는 None)
+        recruitment_finish: 모집 마감일 (date 또는 None)
+        updated_at: 동아리 정보 마지막 수정 시각 (naive KST datetime 또는 None)
+        today: 기준 날짜 (None이면 오늘, KST)
+
+    Returns:
+        str: "OPEN" 또는 "CLOSED"
+    """
+    if today is None:
+        today = get_kst_today()
+
+    in_period = (
+        recruitment_start is not None
+        and recruitment_finish is not None
+        and recruitment_start <= today <= recruitment_finish
+    )
+
+    if recruitment_status == "OPEN":
+        return "OPEN" if in_period else "CLOSED"
+
+    if in_period and (
+        recruitment_start == today
+        or updated_at is None
+        or updated_at < datetime.combine(recruitment_start, time.min)
+    ):
+        return "OPEN"
+
+    return "CLOSED"
+
+
+def get_club_recruitment_status(club, today=None):
+    """Club 객체의 실제 모집 상태 계산 (get_effective_recruitment_status 래퍼)"""
+    return get_effective_recruitment_status(
+        club.recruitment_status,
+        club.recruitment_start,
+        club.recruitment_finish,
+        club.updated_at,
+        today=today,
+    )
+
+
+def close_expired_recruitments(today=None):
+    """recruitment_finish가 지났거나, recruitment_start가 오늘보다 이후인 동아리를 자동으로 CLOSED로 변경"""
     try:
-        today = date.today()
-        from sqlalchemy import or_, and_
+        if today is None:
+            today = get_kst_today()
 
-        # 모집 마감일이 지났거나, 모집 시작일이 아직 안 된 경우, 또는 모집기간이 없는 동아리 조회
-        expired_clubs = Club.query.filter(
+        # 모집 마감일이 지났거나, 모집 시작일이 아직 안 된 경우, 또는 모집기간이 없는 동아리를 한 번에 변경
+        closed_count = Club.query.filter(
             Club.recruitment_status == "OPEN",
             or_(
                 Club.recruitment_finish < today,  # 모집 마감일이 지난 경우
-                and_(
-                    Club.recruitment_start.isnot(None),
-                    today
-                    < Club.recruitment_start,  # 모집 시작일이 아직 안 된 경우 (오늘이 모집 시작일보다 이전)
-                ),
+                Club.recruitment_start > today,  # 모집 시작일이 아직 안 된 경우
                 Club.recruitment_start.is_(None),  # 모집 시작일이 없는 경우
                 Club.recruitment_finish.is_(None),  # 모집 마감일이 없는 경우
             ),
-        ).all()
-
-        closed_count = 0
-        for club in expired_clubs:
-            club.recruitment_status = "CLOSED"
-            closed_count += 1
+        ).update({"recruitment_status": "CLOSED"}, synchronize_session=False)
 
         if closed_count > 0:
             db.session.commit()
+            invalidate_club_catalog()
 
         return closed_count
     except Exception as e:
@@ -64,28 +123,51 @@ def close_expired_recruitments():
         raise Exception(f"모집 기간 만료 처리 중 오류 발생: {e}")
 
 
-def open_started_recruitments():
-    """recruitment_start가 오늘이 되는 순간 동아리를 자동으로 OPEN으로 변경"""
+def open_started_recruitments(today=None):
+    """모집 기간이 시작된 동아리를 자동으로 OPEN으로 변경
+
+    모집 시작일 당일이거나, 모집 시작일 이후 수동으로 상태가 변경된 적이 없는 경우에만
+    OPEN으로 변경합니다. (스케줄러가 자정 실행을 놓친 경우에도 다음 실행에서 복구)
+    """
     try:
-        today = date.today()
-        from sqlalchemy import and_, or_
+        if today is None:
+            today = get_kst_today()
 
-        # 모집 시작일이 오늘이고, 모집 마감일이 지나지 않았으며, 모집기간이 모두 설정된 동아리 조회
-        started_clubs = Club.query.filter(
+        # 모집 기간이 모두 설정되어 있고, 오늘이 모집 기간 안인 동아리를 한 번에 변경
+        opened_count = Club.query.filter(
             Club.recruitment_status == "CLOSED",
-            Club.recruitment_start == today,  # 모집 시작일이 오늘인 경우
-            Club.recruitment_finish >= today,  # 모집 마감일이 오늘이거나 이후인 경우
-        ).all()
-
-        opened_count = 0
-        for club in started_clubs:
-            club.recruitment_status = "OPEN"
-            opened_count += 1
+            Club.recruitment_start <= today,
+            Club.recruitment_finish >= today,
+            or_(
+                Club.recruitment_start == today,  # 모집 시작일이 오늘인 경우
+                func.date(Club.updated_at) < Club.recruitment_start,
+            ),
+        ).update({"recruitment_status": "OPEN"}, synchronize_session=False)
 
         if opened_count > 0:
             db.session.commit()
+            invalidate_club_catalog()
 
         return opened_count
     except Exception as e:
         db.session.rollback()
         raise Exception(f"모집 시작 처리 중 오류 발생: {e}")
+
+
+def apply_recruitment_transitions(today=None):
+    """
+    모집 상태 전이 엔진 (스케줄러 전용)
+
+    조회 API는 get_effective_recruitment_status로 상태를 계산하므로,
+    이 함수는 DB에 저장된 상태를 실제 상태와 맞추는 역할만 합니다.
+
+    Returns:
+        dict: {"opened": OPEN으로 변경된 수, "closed": CLOSED로 변경된 수}
+    """
+    if today is None:
+        today = get_kst_today()
+
+    opened_count = open_started_recruitments(today)
+    closed_count = close_expired_recruitments(today)
+
+    return {"opened": opened_count, "closed": closed_count}
@@ -1,18 +1,17 @@
 from models import db, Club, ClubCategory, ClubApplicationQuestion, ClubMember
 from services.club_service import (
     calculate_recruitment_d_day,
-    close_expired_recruitments,
-    open_started_recruitments,
+    get_club_recruitment_status,
 )
+from utils.catalog_cache import catalog_cache, invalidate_club_catalog
+from utils.time_utils import get_kst_today
 
 
 def get_all_clubs():
     """모든 동아리 정보를 카테고리와 함께 조회"""
     try:
-        # 모집 시작일이 된 동아리 자동 OPEN 처리
-        open_started_recruitments()
-        # 만료된 모집 기간 자동 CLOSED 처리
-        close_expired_recruitments()
+        # 모집 상태는 DB를 변경하지 않고 모집 기간으로 계산 (상태 전이는 스케줄러 담당)
+        today = get_kst_today()
 
         # 동아리와 카테고리 정보를 함께 조회
         clubs = (
@@ -31,7 +30,7 @@ def get_all_clubs():
                 "name": club.name,
                 "activity_summary": club.activity_summary,
                 "category": {"id": category.id, "name": category.name},
-                "recruitment_status": club.recruitment_status,
+                "recruitment_status": get_club_recruitment_status(club, today),
                 "president_name": club.president_name,
                 "contact": club.contact,
                 "current_generation": club.current_generation,
@@ -47,10 +46,12 @@ def get_all_clubs():
                     else None
                 ),
                 "recruitment_d_day": calculate_recruitment_d_day(
-                    club.recruitment_finish
+                    club.recruitment_finish, today
                 ),
                 "logo_image": club.logo_image,
+                "logo_image_variants": club.logo_image_variants,
                 "introduction_image": club.introduction_image,
+                "introduction_image_variants": club.introduction_image_variants,
                 "club_room": club.club_room,
                 "created_at": (
                     club.created_at.isoformat() if club.created_at else None
@@ -67,13 +68,20 @@ def get_all_clubs():
         raise Exception(f"동아리 목록 조회 중 오류 발생: {str(e)}")
 
 
+def get_all_clubs_json():
+    """모든 동아리 목록 응답을 직렬화된 JSON bytes로 조회 (카탈로그 캐시 사용)"""
+
+    def build():
+        clubs_data = get_all_clubs()
+        return {"count": len(clubs_data), "clubs": clubs_data}
+
+    return catalog_cache.get_or_build("clubs.all", build)
+
+
 def get_club_by_id(club_id):
     """특정 동아리의 상세 정보를 조회"""
     try:
-        # 모집 시작일이 된 동아리 자동 OPEN 처리
-        open_started_recruitments()
-        # 만료된 모집 기간 자동 CLOSED 처리
-        close_expired_recruitments()
+        today = get_kst_today()
 
         club_data = (
             db.session.query(Club, ClubCategory)
@@ -93,7 +101,7 @@ def get_club_by_id(club_id):
             "name": club.name,
             "activity_summary": club.activity_summary,
             "category": {"id": category.id, "name": category.name},
-            "recruitment_status": club.recruitment_status,
+            "recruitment_status": get_club_recruitment_status(club, today),
             "president_name": club.president_name,
             "contact": club.contact,
             "current_generation": club.current_generation,
@@ -104,9 +112,13 @@ def get_club_by_id(club_id):
             "recruitment_finish": (
                 club.recruitment_finish.isoformat() if club.recruitment_finish else None
             ),
-            "recruitment_d_day": calculate_recruitment_d_day(club.recruitment_finish),
+            "recruitment_d_day": calculate_recruitment_d_day(
+                club.recruitment_finish, today
+            ),
             "logo_image": club.logo_image,
+            "logo_image_variants": club.logo_image_variants,
             "introduction_image": club.introduction_image,
+            "introduction_image_variants": club.introduction_image_variants,
             "club_room": club.club_room,
             "created_at": (club.created_at.isoformat() if club.created_at else None),
             "updated_at": (club.updated_at.isoformat() if club.updated_at else None),
@@ -240,6 +252,7 @@ def bulk_update_club_info(club_id, update_data):
                         setattr(club, field, value)
 
             db.session.commit()
+            invalidate_club_catalog()
             return get_club_by_id(club_id)
 
         except Exception as e:
@@ -468,18 +481,19 @@ def bulk_update_questions(club_id, questions_data):
 def get_open_clubs():
     """모집 중인 동아리 정보를 카테고리와 함께 조회"""
     try:
-        # 모집 시작일이 된 동아리 자동 OPEN 처리
-        open_started_recruitments()
-        # 만료된 모집 기간 자동 CLOSED 처리
-        close_expired_recruitments()
-
-        # 모집 중인 동아리와 카테고리 정보를 함께 조회
-        clubs = (
-            db.session.query(Club, ClubCategory)
-            .join(ClubCategory, Club.category_id == ClubCategory.id)
-            .filter(Club.recruitment_status == "OPEN")
-            .all()
-        )
+        today = get_kst_today()
+
+        # 동아리와 카테고리 정보를 함께 조회한 뒤, 실제 모집 상태가 OPEN인 동아리만 선택
+        # (모집 시작일 당일 자정 직후처럼 DB 상태가 아직 전이되지 않은 경우도 포함)
+        clubs = [
+            (club, category)
+            for club, category in (
+                db.session.query(Club, ClubCategory)
+                .join(ClubCategory, Club.category_id == ClubCategory.id)
+                .all()
+            )
+            if get_club_recruitment_status(club, today) == "OPEN"
+        ]
 
         if not clubs:
             return []  # 빈 리스트 반환 (에러가 아님)
@@ -492,7 +506,7 @@ def get_open_clubs():
                 "category": {"id": category.id, "name": category.name},
                 "activity_summary": club.activity_summary,
                 "introduction": club.introduction,
-                "recruitment_status": club.recruitment_status,
+                "recruitment_status": get_club_recruitment_status(club, today),
                 "current_generation": club.current_generation,
                 "president_name": club.president_name,
                 "contact": club.contact,
@@ -507,10 +521,12 @@ def get_open_clubs():
                     else None
                 ),
                 "recruitment_d_day": calculate_recruitment_d_day(
-                    club.recruitment_finish
+                    club.recruitment_finish, today
                 ),
                 "logo_image": club.logo_image,
+                "logo_image_variants": club.logo_image_variants,
                 "introduction_image": club.introduction_image,
+                "introduction_image_variants": club.introduction_image_variants,
                 "club_room": club.club_room,
                 "created_at": (
                     club.created_at.strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -531,6 +547,25 @@ def get_open_clubs():
         raise Exception(f"모집 중인 동아리 목록 조회 중 오류 발생: {str(e)}")
 
 
+def get_open_clubs_json():
+    """모집 중인 동아리 목록 응답을 직렬화된 JSON bytes로 조회 (카탈로그 캐시 사용)"""
+
+    def build():
+        clubs_data = get_open_clubs()
+
+        # 모집 중인 동아리가 없는 경우
+        if not clubs_data:
+            return {
+                "count": 0,
+                "clubs": [],
+                "message": "모집 중인 동아리가 없습니다",
+            }
+
+        return {"count": len(clubs_data), "clubs": clubs_data}
+
+    return catalog_cache.get_or_build("clubs.open", build)
+
+
 def get_club_members(club_id):
     """동아리원 목록 조회"""
     try:
@@ -0,0 +1,272 @@
+import logging
+import os
+from datetime import timedelta
+from typing import Dict, Optional
+from flask import current_app
+from models import db, Banner, Club, NoticeAsset, CleaningPhoto, ImageJob
+from utils import asset_store
+from utils.catalog_cache import invalidate_club_catalog
+from utils.image_utils import convert_image, remove_image_variants
+from utils.image_worker import image_worker
+from utils.time_utils import get_kst_utcnow
+
+logger = logging.getLogger(__name__)
+
+# 변환 결과를 반영할 대상 모델, 이미지 URL 컬럼, 크기별 변형 URL 컬럼
+IMAGE_JOB_TARGETS = {
+    "BANNER": (Banner, "file_path", "image_variants"),
+    "CLUB_LOGO": (Club, "logo_image", "logo_image_variants"),
+    "CLUB_INTRODUCTION": (Club, "introduction_image", "introduction_image_variants"),
+    "NOTICE_ASSET": (NoticeAsset, "file_url", "image_variants"),
+    "CLEANING_PHOTO": (CleaningPhoto, "file_url", "image_variants"),
+}
+
+# 대기열에 들어가지 못했거나 유실된 작업을 다시 제출하기까지의 대기 시간
+IMAGE_JOB_RETRY_DELAY_SECONDS = 60
+# PROCESSING 상태로 이 시간 이상 남은 작업은 워커가 중단된 것으로 보고 다시 처리
+IMAGE_JOB_STALE_SECONDS = 600
+# 한 번에 다시 제출하는 최대 작업 수
+IMAGE_JOB_RETRY_BATCH_SIZE = 100
+
+
+def enqueue_image_job(target_type: str, target_id: int, image_info: Dict) -> Dict:
+    """
+    이미지 변환 작업 등록 및 워커 풀에 제출
+
+    대상 행이 원본 URL로 저장(커밋)된 뒤 호출해야 합니다.
+    워커 풀이 가득 찬 경우 작업은 PENDING으로 남아 재시도 스케줄러가 처리합니다.
+    저장소에 같은 내용의 변환본이 이미 있으면(conversion이 None) 작업을 만들지 않습니다.
+    """
+    if target_type not in IMAGE_JOB_TARGETS:
+        raise ValueError(f"유효하지 않은 이미지 변환 대상입니다: {target_type}")
+
+    conversion = image_info["conversion"]
+    if conversion is None:
+        return {"id": None, "status": "DONE"}
+
+    job = ImageJob(
+        target_type=target_type,
+        target_id=target_id,
+        source_path=conversion["source_path"],
+        source_url=conversion["source_url"],
+        output_path=conversion["output_path"],
+        output_url=conversion["output_url"],
+        status="PENDING",
+    )
+    db.session.add(job)
+    db.session.commit()
+
+    if not image_worker.submit(process_image_job, job.id):
+        current_app.logger.warning(
+            f"이미지 변환 대기열이 가득 차 작업 {job.id}을(를) 나중에 처리합니다."
+        )
+
+    return {"id": job.id, "status": job.status}
+
+
+def process_image_job(job_id: int) -> Optional[str]:
+    """
+    이미지 변환 작업 실행 (워커 스레드에서 호출)
+
+    1. PENDING 작업을 PROCESSING으로 선점 (중복 제출된 작업은 건너뜀)
+    2. 원본을 WebP로 변환 (같은 내용이 다른 작업에서 이미 변환되었으면 변환본 재사용)
+    3. 대상 행이 아직 원본 URL을 가리킬 때만 변환본 URL로 교체하고 작업을 DONE으로 변경 (한 트랜잭션)
+    4. 커밋 후 같은 원본을 기다리는 작업이 없으면 원본 파일 삭제
+
+    Returns:
+        최종 작업 상태 (선점하지 못한 경우 None)
+    """
+    claimed = ImageJob.query.filter(
+        ImageJob.id == job_id, ImageJob.status == "PENDING"
+    ).update(
+        {
+            ImageJob.status: "PROCESSING",
+            ImageJob.attempts: ImageJob.attempts + 1,
+            ImageJob.updated_at: get_kst_utcnow(),
+        },
+        synchronize_session=False,
+    )
+    db.session.commit()
+    if not claimed:
+        return None
+
+    job = db.session.get(ImageJob, job_id)
+    model, column_name, variants_column_name = IMAGE_JOB_TARGETS[job.target_type]
+    column = getattr(model, column_name)
+
+    # 내용 주소 저장소 이미지 (저장소 도입 전에 등록된 작업은 None)
+    asset = asset_store.find_by_file_path(job.output_path)
+    asset_key = (asset.namespace, asset.content_hash) if asset is not None else None
+
+    try:
+        # 변환 전에 이미지가 교체/삭제되었으면 변환하지 않음
+        still_referenced = (
+            db.session.query(model.id)
+            .filter(model.id == job.target_id, column == job.source_url)
+            .first()
+        )
+        if not still_referenced:
+            return _finish_cancelled(job, remove_files=asset is None)
+        if asset is None and not os.path.exists(job.source_path):
+            return _finish_cancelled(job)
+
+        if asset is not None and asset.status == "READY":
+            variants = asset.image_variants
+        else:
+            variants = _to_variant_urls(
+                convert_image(job.source_path, job.output_path), job.output_url
+            )
+            if asset is not None and not asset_store.mark_ready(asset.id, variants):
+                # 변환 중 마지막 참조가 해제되어 저장소 항목이 삭제된 경우
+                # (그 사이 같은 내용이 다시 등록되지 않았을 때만 변환본 삭제)
+                asset_store.remove_files_after_transaction(*asset_key)
+                return _finish_cancelled(job, remove_files=False)
+            # 대상 행 교체와 관계없이 변환본은 같은 내용의 다른 업로드가 재사용
+            db.session.commit()
+
+        swapped = (
+            db.session.query(model)
+            .filter(model.id == job.target_id, column == job.source_url)
+            .update(
+                {column: job.output_url, variants_column_name: variants},
+                synchronize_session=False,
+            )
+        )
+        if not swapped:
+            return _finish_cancelled(job, remove_files=asset is None)
+
+        job.status = "DONE"
+        job.last_error = None
+        db.session.commit()
+
+    except Exception as e:
+        db.session.rollback()
+        max_attempts = current_app.config.get("IMAGE_JOB_MAX_ATTEMPTS", 3)
+        job.status = "FAILED" if job.attempts >= max_attempts else "PENDING"
+        job.last_error = str(e)
+        db.session.commit()
+        logger.warning(
+            f"이미지 변환 작업 {job.id} 실패 ({job.attempts}/{max_attempts}회): {e}"
+        )
+        return job.status
+
+    if asset is None:
+        _remove_file(job.source_path)
+    else:
+        _requeue_failed_jobs(job)
+        if not _has_waiting_jobs(job):
+            asset_store.remove_source_if_converted(*asset_key, job.source_path)
+    if model is Club:
+        invalidate_club_catalog()
+    return job.status
+
+
+def retry_image_jobs() -> Dict:
+    """
+    대기열에 들어가지 못했거나 실패 후 재시도 대기 중인 작업을 다시 제출
+
+    워커가 중단되어 PROCESSING으로 남은 작업은 PENDING으로 되돌립니다.
+    """
+    now = get_kst_utcnow()
+
+    recovered = ImageJob.query.filter(
+        ImageJob.status == "PROCESSING",
+        ImageJob.updated_at < now - timedelta(seconds=IMAGE_JOB_STALE_SECONDS),
+    ).update(
+        {ImageJob.status: "PENDING", ImageJob.updated_at: now},
+        synchronize_session=False,
+    )
+    db.session.commit()
+
+    job_ids = [
+        job_id
+        for (job_id,) in db.session.query(ImageJob.id)
+        .filter(
+            ImageJob.status == "PENDING",
+            ImageJob.updated_at
+            < now - timedelta(seconds=IMAGE_JOB_RETRY_DELAY_SECONDS),
+        )
+        .order_by(ImageJob.id)
+        .limit(IMAGE_JOB_RETRY_BATCH_SIZE)
+    ]
+
+    submitted = 0
+    for job_id in job_ids:
+        if not image_worker.submit(process_image_job, job_id):
+            break
+        submitted += 1
+
+    return {"recovered": recovered, "submitted": submitted}
+
+
+def _to_variant_urls(variants: Dict, output_url: str) -> Dict:
+    """변형 파일 경로를 서빙 URL로 변환 (변형은 변환본과 같은 디렉토리에 저장됨)"""
+    url_dir = output_url.rsplit("/", 1)[0]
+    return {
+        name: {
+            key: (
+                f"{url_dir}/{os.path.basename(value)}"
+                if key in ("webp", "avif")
+                else value
+            )
+            for key, value in variant.items()
+        }
+        for name, variant in variants.items()
+    }
+
+
+def _requeue_failed_jobs(job: ImageJob):
+    """
+    같은 원본의 실패한 작업을 다시 PENDING으로 변경
+
+    변환 중에 같은 내용이 다시 업로드되면 여러 작업이 같은 원본을 공유합니다.
+    먼저 실패한 작업도 변환본을 재사용해 URL을 교체할 수 있도록 재시도 스케줄러에 맡깁니다.
+    """
+    ImageJob.query.filter(
+        ImageJob.source_path == job.source_path, ImageJob.status == "FAILED"
+    ).update({ImageJob.status: "PENDING"}, synchronize_session=False)
+    db.session.commit()
+
+
+def _has_waiting_jobs(job: ImageJob) -> bool:
+    """같은 원본을 가리키는 다른 작업이 남아 있는지 확인 (남아 있으면 원본을 지우지 않음)"""
+    return (
+        db.session.query(ImageJob.id)
+        .filter(
+            ImageJob.source_path == job.source_path,
+            ImageJob.id != job.id,
+            ImageJob.status.in_(("PENDING", "PROCESSING")),
+        )
+        .first()
+        is not None
+    )
+
+
+def _finish_cancelled(job: ImageJob, remove_files: bool = True) -> str:
+    """
+    이미지가 교체/삭제된 작업 종료
+
+    저장소 도입 전 작업은 더 이상 참조되지 않는 원본/변환본을 삭제하고,
+    저장소 이미지 파일은 참조 수가 0이 될 때 삭제되므로 그대로 둡니다.
+    """
+    db.session.rollback()
+    job.status = "CANCELLED"
+    db.session.commit()
+    if remove_files:
+        _remove_file(job.source_path)
+        _remove_converted(job.output_path)
+    return job.status
+
+
+def _remove_converted(output_path: str):
+    """변환본과 크기별 변형 파일 삭제"""
+    remove_image_variants(output_path)
+    _remove_file(output_path)
+
+
+def _remove_file(path: str):
+    try:
+        if path and os.path.exists(path):
+            os.remove(path)
+    except OSError as e:
+        logger.warning(f"파일 삭제 실패: {path} ({e})")
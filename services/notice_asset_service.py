@@ -4,6 +4,7 @@ from utils.image_utils import (
     save_notice_file,
     delete_notice_asset,
 )
+from services.image_job_service import enqueue_image_job
 
 
 def create_notice_asset(notice_id, asset_type, file):
@@ -27,12 +28,18 @@ def create_notice_asset(notice_id, asset_type, file):
             notices_id=notice_id,
             asset_type=asset_type,
             file_url=result["file_path"],
+            image_variants=result.get("image_variants"),
             original_filename=result.get("original_filename"),
         )
 
         db.session.add(notice_asset)
         db.session.commit()
 
+        # 이미지 WebP 변환은 백그라운드에서 처리 (완료되면 file_url이 변환본으로 교체됨)
+        image_job = None
+        if asset_type == "IMAGE":
+            image_job = enqueue_image_job("NOTICE_ASSET", notice_asset.id, result)
+
         return {
             "id": notice_asset.id,
             "notice_id": notice_id,
@@ -40,6 +47,7 @@ def create_notice_asset(notice_id, asset_type, file):
             "file_url": result["file_path"],
             "original_filename": notice_asset.original_filename,
             "created_at": notice_asset.created_at.isoformat(),
+            "image_job": image_job,
         }
 
     except Exception as e:
@@ -58,6 +66,7 @@ def get_notice_assets(notice_id):
                 "notice_id": asset.notices_id,
                 "asset_type": asset.asset_type,
                 "file_url": asset.file_url,
+                "image_variants": asset.image_variants,
                 "original_filename": asset.original_filename,
                 "created_at": asset.created_at.isoformat(),
             }
@@ -85,6 +94,7 @@ def get_notice_asset_by_id(asset_id):
             "notice_id": asset.notices_id,
             "asset_type": asset.asset_type,
             "file_url": asset.file_url,
+            "image_variants": asset.image_variants,
             "file_path": file_path,  # 실제 파일 시스템 경로
             "original_filename": asset.original_filename,
             "created_at": asset.created_at.isoformat(),
@@ -147,10 +157,6 @@ def update_notice_asset(asset_id, asset_type, file):
         if not asset:
             raise ValueError("존재하지 않는 첨부파일입니다")
 
-        # 기존 파일 삭제
-        old_file_path = asset.file_url.lstrip("/")
-        delete_notice_asset(old_file_path)
-
         # 새 파일 저장
         if asset_type == "IMAGE":
             result = save_notice_image(file, asset.notices_id)
@@ -159,11 +165,20 @@ def update_notice_asset(asset_id, asset_type, file):
         else:
             raise ValueError("유효하지 않은 첨부파일 타입입니다")
 
+        # 기존 파일 삭제 (새 파일 저장 후 참조를 해제해야 같은 이미지 재업로드 시 재사용됨)
+        old_file_path = asset.file_url.lstrip("/")
+        delete_notice_asset(old_file_path)
+
         # DB 업데이트
         asset.asset_type = asset_type
         asset.file_url = result["file_path"]
+        asset.image_variants = result.get("image_variants")
         db.session.commit()
 
+        image_job = None
+        if asset_type == "IMAGE":
+            image_job = enqueue_image_job("NOTICE_ASSET", asset.id, result)
+
         return {
             "id": asset.id,
             "notice_id": asset.notices_id,
@@ -171,6 +186,7 @@ def update_notice_asset(asset_id, asset_type, file):
             "file_url": asset.file_url,
             "original_filename": asset.original_filename,
             "created_at": asset.created_at.isoformat(),
+            "image_job": image_job,
         }
 
     except Exception as e:
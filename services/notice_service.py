@@ -1,3 +1,4 @@
+from sqlalchemy.orm import selectinload
 from models import Club, Notice, NoticeAsset, db
 
 
@@ -46,26 +47,17 @@ def get_club_notices(club_id):
         if not club:
             raise ValueError("해당 동아리를 찾을 수 없습니다")
 
+        # 첨부파일은 목록 전체에 대해 IN 쿼리 한 번으로 함께 조회
         notices = (
-            Notice.query.filter_by(club_id=club_id, status="POSTED")
+            Notice.query.options(selectinload(Notice.assets))
+            .filter_by(club_id=club_id, status="POSTED")
             .order_by(Notice.posted_at.desc())
             .all()
         )
 
         result = []
         for notice in notices:
-            # 각 공지의 첨부파일 조회
-            assets = NoticeAsset.query.filter_by(notices_id=notice.id).all()
-            attachments = [
-                {
-                    "id": asset.id,
-                    "asset_type": asset.asset_type,
-                    "file_url": asset.file_url,
-                    "original_filename": asset.original_filename,
-                    "created_at": asset.created_at.isoformat(),
-                }
-                for asset in assets
-            ]
+            attachments = _serialize_attachments(notice.assets)
 
             result.append(
                 {
@@ -91,9 +83,11 @@ def get_club_notices(club_id):
 def get_all_notices():
     """전체 공지 목록 조회 (첨부파일 포함)"""
     try:
+        # 첨부파일은 목록 전체에 대해 IN 쿼리 한 번으로 함께 조회
         notices = (
             db.session.query(Notice, Club)
             .join(Club, Notice.club_id == Club.id)
+            .options(selectinload(Notice.assets))
             .filter(Notice.status == "POSTED")
             .order_by(Notice.posted_at.desc())
             .all()
@@ -101,18 +95,7 @@ def get_all_notices():
 
         result = []
         for notice, club in notices:
-            # 각 공지의 첨부파일 조회
-            assets = NoticeAsset.query.filter_by(notices_id=notice.id).all()
-            attachments = [
-                {
-                    "id": asset.id,
-                    "asset_type": asset.asset_type,
-                    "file_url": asset.file_url,
-                    "original_filename": asset.original_filename,
-                    "created_at": asset.created_at.isoformat(),
-                }
-                for asset in assets
-            ]
+            attachments = _serialize_attachments(notice.assets)
 
             result.append(
                 {
@@ -157,16 +140,7 @@ def get_notice_by_id(notice_id):
 
         # 첨부파일 조회
         assets = NoticeAsset.query.filter_by(notices_id=notice_id).all()
-        attachments = [
-            {
-                "id": asset.id,
-                "asset_type": asset.asset_type,
-                "file_url": asset.file_url,
-                "original_filename": asset.original_filename,
-                "created_at": asset.created_at.isoformat(),
-            }
-            for asset in assets
-        ]
+        attachments = _serialize_attachments(assets)
 
         return {
             "id": notice.id,
@@ -242,3 +216,18 @@ def delete_notice(notice_id, club_id=None):
     except Exception as e:
         db.session.rollback()
         raise Exception(f"공지 삭제 중 오류 발생: {e}")
+
+
+def _serialize_attachments(assets):
+    """공지 첨부파일 응답 형식 변환 (id 순)"""
+    return [
+        {
+            "id": asset.id,
+            "asset_type": asset.asset_type,
+            "file_url": asset.file_url,
+            "image_variants": asset.image_variants,
+            "original_filename": asset.original_filename,
+            "created_at": asset.created_at.isoformat(),
+        }
+        for asset in sorted(assets, key=lambda asset: asset.id)
+    ]
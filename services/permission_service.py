@@ -6,18 +6,56 @@
 from typing import Set, Optional, Dict, Any
 from flask import current_app
 from models import db, User, ClubMember, Role
+from utils.cache import MemoryBackend, get_cache
 from config.permission_policy import (
     get_permission_policy,
+    get_compiled_permission,
+    roles_to_mask,
     ROLE_HIERARCHY,
     CLUB_SCOPED_PERMISSIONS,
 )
 
 
+# 권한 캐시 유지 시간 (초) - 권한 변경 시에는 즉시 무효화되며, TTL은 안전장치
+MEMBERSHIPS_CACHE_TTL = 300
+# 워커별로 캐시할 최대 사용자 수
+MEMBERSHIPS_CACHE_MAX_ENTRIES = 4096
+
+
+class PermissionResult(dict):
+    """
+    권한 검사 결과
+
+    "message"는 실제로 조회될 때(주로 권한 거부 응답을 만들 때)만 생성합니다.
+    """
+
+    def __missing__(self, key):
+        if key != "message":
+            raise KeyError(key)
+
+        user_roles = self["user_roles"]
+        required_roles = self["required_roles"]
+        if self["has_permission"]:
+            message = f'권한 확인됨: {", ".join(user_roles & required_roles)}'
+        else:
+            message = f'권한 부족. 필요: {", ".join(required_roles)}, 현재: {", ".join(user_roles) if user_roles else "없음"}'
+        self["message"] = message
+        return message
+
+
 class PermissionService:
     """권한 검사 서비스"""
 
     def __init__(self):
-        self._user_roles_cache = {}  # 간단한 메모리 캐시
+        # 사용자별 멤버십 맵 TTL/LRU 캐시 (공유 백엔드 설정 시 워커 간 무효화 전파)
+        self._memberships_cache = get_cache(
+            "permission.memberships",
+            ttl=MEMBERSHIPS_CACHE_TTL,
+            max_entries=MEMBERSHIPS_CACHE_MAX_ENTRIES,
+        )
+        # (user_id, club_id) -> (멤버십 맵, 역할 비트마스크)
+        # 멤버십 맵 객체가 바뀌면(캐시 무효화 후 재조회) 비트마스크도 다시 계산
+        self._role_mask_cache = MemoryBackend(max_entries=MEMBERSHIPS_CACHE_MAX_ENTRIES)
 
     def check_permission(
         self,
@@ -36,114 +74,202 @@ class PermissionService:
         Returns:
             Dict with keys: has_permission, message, user_id, user_roles, required_roles, club_id
         """
-        try:
-            # 1. 권한 정책 조회
-            policy = get_permission_policy(permission_key)
-            if not policy:
-                # 권한 정책이 없는 경우 기본 'STUDENT' 권한 필요
-                required_roles = {"STUDENT"}
-            else:
-                required_roles = policy["allowed_roles"]
-                # 빈 집합인 경우 기본 'STUDENT' 권한 필요
-                if not required_roles:
-                    required_roles = {"STUDENT"}
-
-            # 2. club 스코프 필수 권한인데 club_id가 없는 경우 즉시 거절
-            if permission_key in CLUB_SCOPED_PERMISSIONS and club_id is None:
-                return {
-                    "has_permission": False,
-                    "message": "club_id가 필요합니다",
-                    "user_id": user_id,
-                    "user_roles": set(),
-                    "required_roles": required_roles,
-                    "club_id": club_id,
-                }
+        return self.check_permissions([permission_key], user_id, club_id)[
+            permission_key
+        ]
 
-            # 3. 사용자 ID 확인
-            if user_id is None:
-                from services.session_service import get_current_user
+    def check_permissions(
+        self,
+        permission_keys,
+        user_id: Optional[int] = None,
+        club_id: Optional[int] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 권한 일괄 검사
+
+        사용자와 역할은 한 번만 조회하고, 같은 역할 비트마스크로 모든 권한 키를 검사합니다.
+
+        Args:
+            permission_keys: 권한 키 목록
+            user_id: 사용자 ID (None이면 현재 세션 사용자)
+            club_id: 동아리 ID (특정 동아리 컨텍스트에서 권한 검사)
 
-                current_user = get_current_user()
-                if not current_user:
-                    return {
+        Returns:
+            {권한 키: check_permission과 같은 형식의 결과} (입력 순서 유지)
+        """
+        results = {}
+        # 사용자/역할은 club 스코프 검사를 통과한 첫 권한 키에서 한 번만 조회
+        user_context = None
+
+        for permission_key in permission_keys:
+            try:
+                # 1. 사전 컴파일된 권한 정책 조회 (정책이 없으면 기본 'STUDENT' 권한)
+                required_mask, required_roles = get_compiled_permission(permission_key)
+
+                # 2. club 스코프 필수 권한인데 club_id가 없는 경우 즉시 거절
+                if permission_key in CLUB_SCOPED_PERMISSIONS and club_id is None:
+                    results[permission_key] = {
+                        "has_permission": False,
+                        "message": "club_id가 필요합니다",
+                        "user_id": user_id,
+                        "user_roles": set(),
+                        "required_roles": required_roles,
+                        "club_id": club_id,
+                    }
+                    continue
+
+                # 3. 사용자 및 권한 조회 (동아리 컨텍스트 고려)
+                if user_context is None:
+                    user_context = self._resolve_user_context(user_id, club_id)
+                checked_user_id, user_roles, user_mask = user_context
+
+                if checked_user_id is None:
+                    results[permission_key] = {
                         "has_permission": False,
                         "message": "로그인이 필요합니다",
                         "user_id": None,
                         "user_roles": set(),
                         "required_roles": required_roles,
                     }
-                user_id = current_user.id
-
-            # 4. 사용자 권한 조회 (동아리 컨텍스트 고려)
-            if club_id is not None:
-                # 특정 동아리 컨텍스트에서 권한 검사
-                user_roles = self.get_user_roles_in_club(user_id, club_id)
-            else:
-                # 전역 권한 검사
-                user_roles = self.get_user_roles(user_id)
-
-            # 5. 권한 검사
-            has_permission = bool(user_roles.intersection(required_roles))
-
-            if has_permission:
-                message = (
-                    f'권한 확인됨: {", ".join(user_roles.intersection(required_roles))}'
+                    continue
+
+                # 4. 권한 검사 (비트마스크 AND, 메시지는 필요할 때만 생성)
+                results[permission_key] = PermissionResult(
+                    has_permission=bool(user_mask & required_mask),
+                    user_id=checked_user_id,
+                    user_roles=user_roles,
+                    required_roles=required_roles,
+                    club_id=club_id,
                 )
-            else:
-                message = f'권한 부족. 필요: {", ".join(required_roles)}, 현재: {", ".join(user_roles) if user_roles else "없음"}'
-
-            return {
-                "has_permission": has_permission,
-                "message": message,
-                "user_id": user_id,
-                "user_roles": user_roles,
-                "required_roles": required_roles,
-                "club_id": club_id,
-            }
 
-        except Exception as e:
-            current_app.logger.exception(f"권한 검사 중 오류 발생: {permission_key}")
-            return {
-                "has_permission": False,
-                "message": f"권한 검사 중 오류 발생: {str(e)}",
-                "user_id": user_id,
-                "user_roles": set(),
-                "required_roles": set(),
-                "club_id": club_id,
-            }
+            except Exception as e:
+                current_app.logger.exception(
+                    f"권한 검사 중 오류 발생: {permission_key}"
+                )
+                results[permission_key] = {
+                    "has_permission": False,
+                    "message": f"권한 검사 중 오류 발생: {str(e)}",
+                    "user_id": user_id,
+                    "user_roles": set(),
+                    "required_roles": set(),
+                    "club_id": club_id,
+                }
 
-    def get_user_roles(self, user_id: int) -> Set[str]:
+        return results
+
+    def _resolve_user_context(self, user_id: Optional[int], club_id: Optional[int]):
         """
-        사용자의 모든 권한 조회 (전역 + 클럽별)
+        권한 검사 대상 사용자와 역할 조회
+
+        Returns:
+            (사용자 ID, 역할명 frozenset, 역할 비트마스크) - 로그인하지 않은 경우 사용자 ID는 None
+        """
+        if user_id is None:
+            from services.session_service import get_current_user
+
+            current_user = get_current_user()
+            if not current_user:
+                return None, frozenset(), 0
+            user_id = current_user.id
+
+        user_roles, user_mask = self.get_user_role_mask(user_id, club_id)
+        return user_id, user_roles, user_mask
+
+    def get_user_memberships(self, user_id: int) -> Dict[Optional[int], Set[str]]:
+        """
+        사용자의 전체 멤버십 맵 조회 (전역 + 모든 동아리)
+
+        한 번의 쿼리로 모든 멤버십을 조회하여 사용자별로 캐시하므로,
+        캐시된 사용자의 전역/동아리 권한 검사는 DB 조회 없이 처리됩니다.
 
         Args:
             user_id: 사용자 ID
 
         Returns:
-            사용자가 가진 모든 역할명의 집합
+            {club_id(전역 역할은 None): {역할명, ...}}
         """
-        try:
-            # 캐시 확인
-            cache_key = f"user_roles_{user_id}"
-            if cache_key in self._user_roles_cache:
-                return self._user_roles_cache[cache_key]
-
-            # DB에서 사용자 권한 조회
-            memberships = (
-                db.session.query(ClubMember, Role)
-                .join(Role, ClubMember.role_id == Role.id)
-                .filter(ClubMember.user_id == user_id)
-                .all()
+        # 현재 요청에서 이미 조회된 사용자면 DB 조회 생략
+        request_memberships = self._get_request_memberships(user_id)
+        if request_memberships is not None:
+            return request_memberships
+
+        # 캐시 확인
+        cache_key = f"memberships_{user_id}"
+        cached_memberships = self._memberships_cache.get(cache_key)
+        if cached_memberships is not None:
+            return cached_memberships
+
+        # DB에서 사용자 멤버십 조회
+        rows = (
+            db.session.query(ClubMember, Role)
+            .join(Role, ClubMember.role_id == Role.id)
+            .filter(ClubMember.user_id == user_id)
+            .all()
+        )
+
+        memberships = {}
+        for membership, role in rows:
+            memberships.setdefault(membership.club_id, set()).add(role.role_name)
+
+        # 캐시 저장
+        self._memberships_cache.set(cache_key, memberships)
+
+        return memberships
+
+    def get_cached_memberships(
+        self, user_id: int
+    ) -> Optional[Dict[Optional[int], Set[str]]]:
+        """캐시된 멤버십 맵 조회 (DB 조회 없음, 캐시에 없으면 None)"""
+        return self._memberships_cache.get(f"memberships_{user_id}")
+
+    def cache_user_memberships(
+        self, user_id: int, memberships: Dict[Optional[int], Set[str]]
+    ):
+        """다른 경로에서 이미 조회한 멤버십 맵을 캐시에 저장"""
+        self._memberships_cache.set(f"memberships_{user_id}", memberships)
+
+    def get_user_role_mask(self, user_id: int, club_id: Optional[int] = None):
+        """
+        사용자 역할 집합과 비트마스크 조회
+
+        Args:
+            user_id: 사용자 ID
+            club_id: 동아리 ID (None이면 전역 + 모든 동아리 권한, 있으면 전역 + 해당 동아리 권한)
+
+        Returns:
+            (역할명 frozenset, 역할 비트마스크)
+        """
+        memberships = self.get_user_memberships(user_id)
+
+        cache_key = (user_id, club_id)
+        cached = self._role_mask_cache.get(cache_key)
+        if cached is not None and cached[0] is memberships:
+            return cached[1], cached[2]
+
+        if club_id is not None:
+            user_roles = frozenset(
+                memberships.get(None, set()) | memberships.get(club_id, set())
             )
+        else:
+            user_roles = frozenset().union(*memberships.values())
 
-            user_roles = set()
-            for membership, role in memberships:
-                user_roles.add(role.role_name)
+        user_mask = roles_to_mask(user_roles)
+        self._role_mask_cache.set(cache_key, (memberships, user_roles, user_mask))
+        return user_roles, user_mask
 
-            # 캐시 저장 (간단한 메모리 캐시, 실제로는 Redis 등 사용 권장)
-            self._user_roles_cache[cache_key] = user_roles
+    def get_user_roles(self, user_id: int) -> Set[str]:
+        """
+        사용자의 모든 권한 조회 (전역 + 클럽별)
+
+        Args:
+            user_id: 사용자 ID
 
-            return user_roles
+        Returns:
+            사용자가 가진 모든 역할명의 집합
+        """
+        try:
+            memberships = self.get_user_memberships(user_id)
+            return set().union(*memberships.values())
 
         except Exception as e:
             current_app.logger.exception(
@@ -163,28 +289,8 @@ class PermissionService:
             해당 클럽에서의 역할명 집합
         """
         try:
-            memberships = (
-                db.session.query(ClubMember, Role)
-                .join(Role, ClubMember.role_id == Role.id)
-                .filter(ClubMember.user_id == user_id, ClubMember.club_id == club_id)
-                .all()
-            )
-
-            club_roles = {role.role_name for _, role in memberships}
-
-            # 디버깅 로그 추가
-            if not club_roles:
-                current_app.logger.warning(
-                    f"클럽 권한 조회 결과 없음: user_id={user_id}, club_id={club_id}, "
-                    f"조회된 멤버십 수: {len(memberships)}"
-                )
-            else:
-                current_app.logger.debug(
-                    f"클럽 권한 조회 성공: user_id={user_id}, club_id={club_id}, "
-                    f"권한: {club_roles}"
-                )
-
-            return club_roles
+            memberships = self.get_user_memberships(user_id)
+            return set(memberships.get(club_id, set()))
 
         except Exception as e:
             current_app.logger.exception(
@@ -204,19 +310,12 @@ class PermissionService:
             해당 동아리에서 유효한 모든 권한 (전역 + 동아리별)
         """
         try:
-            # 1. 전역 권한 조회
-            global_roles = self.get_user_global_roles(user_id)
+            memberships = self.get_user_memberships(user_id)
+            all_roles = memberships.get(None, set()) | memberships.get(club_id, set())
 
-            # 2. 해당 동아리 권한 조회
-            club_roles = self.get_user_club_roles(user_id, club_id)
-
-            # 3. 전역 권한과 동아리 권한 합치기
-            all_roles = global_roles.union(club_roles)
-
-            # 디버깅 로그 추가
             current_app.logger.debug(
                 f"동아리 컨텍스트 권한 조회: user_id={user_id}, club_id={club_id}, "
-                f"전역 권한: {global_roles}, 동아리 권한: {club_roles}, 합계: {all_roles}"
+                f"권한: {all_roles}"
             )
 
             return all_roles
@@ -238,14 +337,8 @@ class PermissionService:
             전역 역할명 집합
         """
         try:
-            memberships = (
-                db.session.query(ClubMember, Role)
-                .join(Role, ClubMember.role_id == Role.id)
-                .filter(ClubMember.user_id == user_id, ClubMember.club_id.is_(None))
-                .all()
-            )
-
-            return {role.role_name for _, role in memberships}
+            memberships = self.get_user_memberships(user_id)
+            return set(memberships.get(None, set()))
 
         except Exception as e:
             current_app.logger.exception(
@@ -295,14 +388,30 @@ class PermissionService:
 
         return bool(user_roles.intersection(role_names))
 
+    def _get_request_memberships(
+        self, user_id: int
+    ) -> Optional[Dict[Optional[int], Set[str]]]:
+        """
+        현재 요청의 인증 정보(get_current_identity)에 포함된 멤버십 맵 조회
+
+        Returns:
+            {club_id: {역할명}} (현재 로그인 사용자가 아니거나 아직 조회되지 않았으면 None)
+        """
+        from services.session_service import get_request_identity
+
+        identity = get_request_identity()
+        if identity and identity["user"].id == user_id:
+            return identity["memberships"]
+        return None
+
     def clear_user_cache(self, user_id: int):
-        """사용자 권한 캐시 삭제"""
-        cache_key = f"user_roles_{user_id}"
-        self._user_roles_cache.pop(cache_key, None)
+        """사용자 권한 캐시 삭제 (모든 워커에 전파)"""
+        cache_key = f"memberships_{user_id}"
+        self._memberships_cache.delete(cache_key)
 
     def clear_all_cache(self):
-        """모든 권한 캐시 삭제"""
-        self._user_roles_cache.clear()
+        """모든 권한 캐시 삭제 (모든 워커에 전파)"""
+        self._memberships_cache.clear()
 
     def get_permission_info(self, permission_key: str) -> Dict[str, Any]:
         """
@@ -0,0 +1,217 @@
+import csv
+import io
+from datetime import date, datetime
+from typing import Iterator, List, Optional
+from sqlalchemy import func, select
+from models import db, Reservation, Club, Room, User, CleaningPhoto
+
+# 한 번에 DB에서 가져와 CSV로 변환하는 행 수
+EXPORT_CHUNK_SIZE = 1000
+
+EXPORT_HEADER = [
+    "예약ID",
+    "날짜",
+    "시작 시간",
+    "종료 시간",
+    "이용 시간(시간)",
+    "동아리ID",
+    "동아리",
+    "공간ID",
+    "공간",
+    "신청자",
+    "예약 상태",
+    "청소 사진 수",
+    "청소 사진 제출 시각",
+    "청소 승인 상태",
+    "메모",
+    "관리자 메모",
+    "신청 시각",
+]
+
+# 스프레드시트에서 수식으로 해석되는 값의 시작 문자
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class ReservationExportService:
+    @staticmethod
+    def export_reservations_csv(
+        status_filter: Optional[List[str]] = None,
+        club_id: Optional[int] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        """
+        예약/청소 현황 CSV 내보내기 (관리자용)
+
+        서버 측 커서로 chunk_size개씩 읽어 CSV 문자열 조각을 순서대로 생성하므로,
+        예약 수와 관계없이 메모리 사용량이 일정합니다.
+        필터 형식 오류는 스트리밍 시작 전에 ValueError로 발생합니다.
+        """
+        statement = ReservationExportService._build_export_query(
+            status_filter, club_id, date_from, date_to
+        )
+        return ReservationExportService._stream_csv(statement, chunk_size)
+
+    @staticmethod
+    def export_filename(
+        date_from: Optional[str] = None, date_to: Optional[str] = None
+    ) -> str:
+        """
+        내보내기 파일 이름 (Content-Disposition용)
+
+        요청 값을 그대로 쓰지 않고 검증한 날짜로 만들어 헤더에 따옴표/개행이 들어가지 않도록 합니다.
+        """
+        date_from_obj = _parse_date_filter("date_from", date_from)
+        date_to_obj = _parse_date_filter("date_to", date_to)
+        return "reservations_{}_{}.csv".format(
+            date_from_obj.isoformat() if date_from_obj else "all",
+            date_to_obj.isoformat() if date_to_obj else "all",
+        )
+
+    @staticmethod
+    def _build_export_query(status_filter, club_id, date_from, date_to):
+        """예약 + 동아리/공간/신청자 + 청소 사진 집계를 한 번에 조회하는 쿼리"""
+        photo_summary = (
+            select(
+                CleaningPhoto.reservation_id,
+                func.count(CleaningPhoto.id).label("photo_count"),
+                func.min(CleaningPhoto.created_at).label("submitted_at"),
+            )
+            .group_by(CleaningPhoto.reservation_id)
+            .subquery()
+        )
+
+        statement = (
+            select(
+                Reservation.id,
+                Reservation.date,
+                Reservation.start_time,
+                Reservation.end_time,
+                Reservation.club_id,
+                Club.name.label("club_name"),
+                Reservation.room_id,
+                Room.name.label("room_name"),
+                User.name.label("user_name"),
+                Reservation.status,
+                Reservation.is_photo_submitted,
+                photo_summary.c.photo_count,
+                photo_summary.c.submitted_at,
+                Reservation.note,
+                Reservation.admin_note,
+                Reservation.created_at,
+            )
+            .outerjoin(Club, Club.id == Reservation.club_id)
+            .outerjoin(Room, Room.id == Reservation.room_id)
+            .outerjoin(User, User.id == Reservation.user_id)
+            .outerjoin(photo_summary, photo_summary.c.reservation_id == Reservation.id)
+        )
+
+        if status_filter:
+            statement = statement.where(Reservation.status.in_(status_filter))
+
+        if club_id:
+            statement = statement.where(Reservation.club_id == club_id)
+
+        date_from_obj = _parse_date_filter("date_from", date_from)
+        if date_from_obj:
+            statement = statement.where(Reservation.date >= date_from_obj)
+
+        date_to_obj = _parse_date_filter("date_to", date_to)
+        if date_to_obj:
+            statement = statement.where(Reservation.date <= date_to_obj)
+
+        return statement.order_by(
+            Reservation.date, Reservation.start_time, Reservation.id
+        )
+
+    @staticmethod
+    def _stream_csv(statement, chunk_size: int) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        # 엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 추가
+        buffer.write("\ufeff")
+        writer.writerow(EXPORT_HEADER)
+        yield ReservationExportService._drain(buffer)
+
+        # yield_per: 서버 측 커서(stream_results)로 chunk_size개씩만 메모리에 유지
+        result = db.session.execute(statement.execution_options(yield_per=chunk_size))
+        try:
+            for rows in result.partitions():
+                writer.writerows(
+                    ReservationExportService._to_csv_row(row) for row in rows
+                )
+                yield ReservationExportService._drain(buffer)
+        finally:
+            result.close()
+
+    @staticmethod
+    def _drain(buffer: io.StringIO) -> str:
+        """버퍼에 쌓인 CSV 문자열을 꺼내고 버퍼를 비움"""
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return chunk
+
+    @staticmethod
+    def _to_csv_row(row) -> list:
+        return [
+            row.id,
+            row.date.strftime("%Y-%m-%d"),
+            row.start_time.strftime("%H:%M"),
+            row.end_time.strftime("%H:%M"),
+            f"{_duration_hours(row.start_time, row.end_time):g}",
+            row.club_id,
+            _escape_cell(row.club_name or "알 수 없음"),
+            row.room_id,
+            _escape_cell(row.room_name or "알 수 없음"),
+            _escape_cell(row.user_name or "알 수 없음"),
+            row.status,
+            row.photo_count or 0,
+            row.submitted_at.isoformat() if row.submitted_at else "",
+            cleaning_approval_status(row.status, row.is_photo_submitted),
+            _escape_cell(row.note),
+            _escape_cell(row.admin_note),
+            row.created_at.isoformat(),
+        ]
+
+
+def cleaning_approval_status(status: str, is_photo_submitted: bool) -> str:
+    """예약 상태로부터 청소 사진 승인 상태 계산"""
+    if status == "CLEANING_DONE":
+        return "APPROVED"
+    if status == "CLEANING_PHOTO_REJECT":
+        return "REJECTED"
+    if is_photo_submitted:
+        return "PENDING"
+    return "NOT_SUBMITTED"
+
+
+def _parse_date_filter(name: str, value: Optional[str]) -> Optional[date]:
+    """날짜 필터(YYYY-MM-DD) 파싱 (값이 없으면 None)"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError(
+            f"{name} 형식이 올바르지 않습니다. YYYY-MM-DD 형식을 사용하세요."
+        )
+
+
+def _duration_hours(start_time, end_time) -> float:
+    """이용 시간 (시간 단위, 소수점 첫째 자리)"""
+    delta = datetime.combine(date.min, end_time) - datetime.combine(
+        date.min, start_time
+    )
+    return round(delta.total_seconds() / 3600, 1)
+
+
+def _escape_cell(value: Optional[str]) -> str:
+    """스프레드시트 수식 실행을 막기 위해 수식 시작 문자 앞에 ' 추가"""
+    if not value:
+        return ""
+    if value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
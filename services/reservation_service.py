@@ -1,9 +1,48 @@
 from datetime import datetime, date, time, timedelta
 from typing import List, Dict, Optional
-from sqlalchemy import and_, or_
-from models import db, Room, Reservation, Club, User
+from sqlalchemy import and_, insert, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+from flask import current_app
+from models import db, Room, RoomDay, Reservation, Club, User, ClubDailyUsage
+from utils.pagination import decode_cursor, encode_cursor
+from utils.reservation_slots import interval_mask, slot_count, slot_hours
 from utils.time_utils import get_kst_now
 
+# 정기 예약 한 번에 생성할 수 있는 최대 횟수
+MAX_RECURRING_OCCURRENCES = 100
+# 정기 예약 요일 이름 (datetime.weekday() 순서)
+WEEKDAY_NAMES = ("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN")
+
+# 공간을 점유하는 예약 상태 (취소된 예약 제외)
+ACTIVE_RESERVATION_STATUSES = ("CONFIRMED", "CLEANING_PHOTO_REJECT", "CLEANING_DONE")
+
+# 예약 목록 페이지 크기
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# 예약 목록 fields 선택자로 고를 수 있는 필드
+RELATION_FIELDS = {
+    "club": ("id", "name"),
+    "user": ("id", "name", "email", "phone_number", "student_id"),
+    "room": ("id", "name", "location"),
+}
+LIST_FIELDS = (
+    "id",
+    "club",
+    "user",
+    "room",
+    "date",
+    "start_time",
+    "end_time",
+    "status",
+    "note",
+    "admin_note",
+    "created_at",
+    "updated_at",
+)
+INTEGRATION_FIELDS = LIST_FIELDS[:8] + ("is_photo_submitted",) + LIST_FIELDS[8:]
+
 
 class ReservationService:
     @staticmethod
@@ -17,6 +56,40 @@ class ReservationService:
         note: Optional[str] = None,
     ) -> Dict:
         """동아리별 대관 신청"""
+        slot = {
+            "room_id": room_id,
+            "date": date,
+            "start_time": start_time,
+            "end_time": end_time,
+        }
+        return ReservationService._create_slots(club_id, user_id, [slot], note)[0]
+
+    @staticmethod
+    def create_reservations_with_slots(
+        club_id: int,
+        user_id: int,
+        slots: List[Dict],
+        note: Optional[str] = None,
+    ) -> List[Dict]:
+        """다중 예약 생성 (slots 형태, 모든 슬롯이 한 트랜잭션으로 생성되거나 전부 실패)"""
+        for slot in slots:
+            if not all(
+                [
+                    slot.get("room_id"),
+                    slot.get("date"),
+                    slot.get("start_time"),
+                    slot.get("end_time"),
+                ]
+            ):
+                raise ValueError(
+                    "각 슬롯에는 room_id, date, start_time, end_time이 필요합니다."
+                )
+
+        return ReservationService._create_slots(club_id, user_id, slots, note)
+
+    @staticmethod
+    def _parse_slot(date: str, start_time: str, end_time: str):
+        """예약 슬롯의 날짜/시간 파싱 및 검증 -> (date, start_time, end_time)"""
         try:
             # 날짜와 시간 파싱
             date_obj = datetime.strptime(date, "%Y-%m-%d").date()
@@ -45,6 +118,237 @@ class ReservationService:
         if end_time_obj.minute not in (0, 30):
             raise ValueError("예약 종료 시간은 30분 단위(00, 30)여야 합니다.")
 
+        return date_obj, start_time_obj, end_time_obj
+
+    @staticmethod
+    def create_recurring_reservations(
+        club_id: int,
+        user_id: int,
+        room_id: int,
+        start_date: str,
+        end_date: str,
+        weekdays: List,
+        start_time: str,
+        end_time: str,
+        interval_weeks: int = 1,
+        exceptions: Optional[List[str]] = None,
+        note: Optional[str] = None,
+        dry_run: bool = False,
+    ) -> Dict:
+        """
+        정기 예약 생성 (매주 반복)
+
+        반복 규칙을 날짜별 예약으로 펼친 뒤 한 번에 검사하여, 충돌하지 않는 예약만 일괄 생성합니다.
+        dry_run이면 검사 결과만 반환하고 아무것도 저장하지 않습니다.
+
+        Args:
+            weekdays: 반복 요일 목록 (0=월 ~ 6=일 또는 "MON" ~ "SUN")
+            interval_weeks: 반복 주기 (1이면 매주, 2면 격주)
+            exceptions: 제외할 날짜 목록 (YYYY-MM-DD)
+
+        Returns:
+            dict: occurrences(날짜별 결과), summary(건수 요약), dry_run
+        """
+        # 결과의 rooms[room_id] 조회와 슬롯 검사가 같은 정수 키를 쓰도록 먼저 변환
+        if isinstance(room_id, bool):
+            raise ValueError("room_id는 정수여야 합니다.")
+        try:
+            room_id = int(room_id)
+        except (TypeError, ValueError):
+            raise ValueError("room_id는 정수여야 합니다.")
+
+        occurrence_dates = ReservationService._expand_weekly_rule(
+            start_date, end_date, weekdays, interval_weeks, exceptions or []
+        )
+        slots = [
+            {
+                "room_id": room_id,
+                "date": occurrence_date.strftime("%Y-%m-%d"),
+                "start_time": start_time,
+                "end_time": end_time,
+            }
+            for occurrence_date in occurrence_dates
+        ]
+
+        club, user, rooms, outcomes = ReservationService._book_slots(
+            club_id, user_id, slots, note, partial=True, dry_run=dry_run
+        )
+
+        occurrences = []
+        for reservation, error in outcomes:
+            occurrence = {
+                "date": reservation.date.strftime("%Y-%m-%d"),
+                "start_time": reservation.start_time.strftime("%H:%M"),
+                "end_time": reservation.end_time.strftime("%H:%M"),
+            }
+            if error:
+                occurrence["result"] = "CONFLICT"
+                occurrence["reason"] = error
+            elif dry_run:
+                occurrence["result"] = "AVAILABLE"
+            else:
+                occurrence["result"] = "CREATED"
+                occurrence["reservation_id"] = reservation.id
+            occurrences.append(occurrence)
+
+        conflicts = sum(1 for _, error in outcomes if error)
+        return {
+            "club": {"id": club.id, "name": club.name},
+            "room": {"id": rooms[room_id].id, "name": rooms[room_id].name},
+            "dry_run": dry_run,
+            "summary": {
+                "total": len(outcomes),
+                "created": 0 if dry_run else len(outcomes) - conflicts,
+                "available": len(outcomes) - conflicts,
+                "conflicts": conflicts,
+            },
+            "occurrences": occurrences,
+        }
+
+    @staticmethod
+    def _expand_weekly_rule(
+        start_date: str,
+        end_date: str,
+        weekdays: List,
+        interval_weeks: int,
+        exceptions: List[str],
+    ) -> List[date]:
+        """매주 반복 규칙을 날짜 목록으로 펼침"""
+        try:
+            start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
+            end_date_obj = datetime.strptime(end_date, "%Y-%m-%d").date()
+            exception_dates = {
+                datetime.strptime(value, "%Y-%m-%d").date() for value in exceptions
+            }
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"날짜 형식이 올바르지 않습니다: {str(e)}")
+
+        if start_date_obj > end_date_obj:
+            raise ValueError("start_date는 end_date보다 늦을 수 없습니다.")
+
+        # bool은 int의 하위 타입이므로 따로 거절 (true가 매주/월요일로 해석되지 않도록)
+        if (
+            isinstance(interval_weeks, bool)
+            or not isinstance(interval_weeks, int)
+            or interval_weeks < 1
+        ):
+            raise ValueError("interval_weeks는 1 이상의 정수여야 합니다.")
+
+        if not isinstance(weekdays, (list, tuple)):
+            raise ValueError("반복 요일(weekdays)은 목록이어야 합니다.")
+
+        weekday_set = set()
+        for weekday in weekdays:
+            if isinstance(weekday, str) and weekday.upper() in WEEKDAY_NAMES:
+                weekday_set.add(WEEKDAY_NAMES.index(weekday.upper()))
+            elif (
+                isinstance(weekday, int)
+                and not isinstance(weekday, bool)
+                and 0 <= weekday <= 6
+            ):
+                weekday_set.add(weekday)
+            else:
+                raise ValueError(
+                    f"요일은 0(월)~6(일) 또는 {', '.join(WEEKDAY_NAMES)} 중 하나여야 합니다: {weekday}"
+                )
+        if not weekday_set:
+            raise ValueError("반복 요일(weekdays)이 필요합니다.")
+
+        # 반복 주기는 시작일이 속한 주(월요일)를 기준으로 계산
+        first_week_start = start_date_obj - timedelta(days=start_date_obj.weekday())
+        occurrence_dates = []
+        current = start_date_obj
+        while current <= end_date_obj:
+            week_index = (current - first_week_start).days // 7
+            if (
+                current.weekday() in weekday_set
+                and week_index % interval_weeks == 0
+                and current not in exception_dates
+            ):
+                occurrence_dates.append(current)
+            current += timedelta(days=1)
+
+        if not occurrence_dates:
+            raise ValueError("반복 규칙에 해당하는 날짜가 없습니다.")
+        if len(occurrence_dates) > MAX_RECURRING_OCCURRENCES:
+            raise ValueError(
+                f"정기 예약은 한 번에 최대 {MAX_RECURRING_OCCURRENCES}회까지 신청할 수 있습니다."
+            )
+        return occurrence_dates
+
+    @staticmethod
+    def _create_slots(
+        club_id: int, user_id: int, slots: List[Dict], note: Optional[str]
+    ) -> List[Dict]:
+        """예약 슬롯 일괄 생성 (하나라도 실패하면 전부 롤백)"""
+        club, user, rooms, outcomes = ReservationService._book_slots(
+            club_id, user_id, slots, note
+        )
+        return [
+            {
+                "id": reservation.id,
+                "club": {"id": club.id, "name": club.name},
+                "user": {"id": user.id, "name": user.name},
+                "room": {
+                    "id": rooms[reservation.room_id].id,
+                    "name": rooms[reservation.room_id].name,
+                    "location": rooms[reservation.room_id].location,
+                },
+                "date": reservation.date.strftime("%Y-%m-%d"),
+                "start_time": reservation.start_time.strftime("%H:%M"),
+                "end_time": reservation.end_time.strftime("%H:%M"),
+                "duration_hours": round(
+                    slot_hours(
+                        slot_count(
+                            interval_mask(reservation.start_time, reservation.end_time)
+                        )
+                    ),
+                    1,
+                ),
+                "status": reservation.status,
+                "note": note,
+                "created_at": reservation.created_at.isoformat(),
+            }
+            for reservation, _ in outcomes
+        ]
+
+    @staticmethod
+    def _book_slots(
+        club_id: int,
+        user_id: int,
+        slots: List[Dict],
+        note: Optional[str],
+        partial: bool = False,
+        dry_run: bool = False,
+    ):
+        """
+        예약 슬롯 일괄 검사 및 생성
+
+        1. 모든 슬롯의 형식을 먼저 검증
+        2. 관련 공간/날짜를 한 번에 잠그고, 기존 예약을 한 번의 쿼리로 조회
+        3. 기존 예약 및 요청 슬롯끼리의 충돌, 일일 사용 시간을 비트맵으로 검사
+        4. 한 번의 다중 행 INSERT + 생성된 id 조회 + 커밋
+
+        Args:
+            partial: False면 하나라도 실패 시 전부 롤백(ValueError), True면 실패한 슬롯만 제외
+            dry_run: True면 검사만 하고 저장하지 않음
+
+        Returns:
+            (club, user, {room_id: Room}, [(Reservation, 실패 사유 또는 None), ...])
+        """
+        if not slots:
+            raise ValueError("예약할 슬롯이 없습니다.")
+
+        # 1. 슬롯 형식 검증
+        parsed_slots = []
+        for slot in slots:
+            date_obj, start_time_obj, end_time_obj = ReservationService._parse_slot(
+                slot["date"], slot["start_time"], slot["end_time"]
+            )
+            parsed_slots.append(
+                (int(slot["room_id"]), date_obj, start_time_obj, end_time_obj)
+            )
+
         # 해당 동아리, 사용자, 공간이 존재하는지 확인
         club = Club.query.get(club_id)
         if not club:
@@ -54,151 +358,352 @@ class ReservationService:
         if not user:
             raise ValueError(f"ID {user_id}에 해당하는 사용자를 찾을 수 없습니다.")
 
-        room = Room.query.get(room_id)
-        if not room:
-            raise ValueError(f"ID {room_id}에 해당하는 공간을 찾을 수 없습니다.")
+        room_ids = {room_id for room_id, _, _, _ in parsed_slots}
+        rooms = {room.id: room for room in Room.query.filter(Room.id.in_(room_ids))}
+        for room_id, _, _, _ in parsed_slots:
+            if room_id not in rooms:
+                raise ValueError(f"ID {room_id}에 해당하는 공간을 찾을 수 없습니다.")
 
-        # 중복 예약 확인
-        existing_reservation = Reservation.query.filter(
-            and_(
-                Reservation.room_id == room_id,
-                Reservation.date == date_obj,
-                or_(
-                    and_(
-                        Reservation.start_time <= start_time_obj,
-                        Reservation.end_time > start_time_obj,
-                    ),
-                    and_(
-                        Reservation.start_time < end_time_obj,
-                        Reservation.end_time >= end_time_obj,
-                    ),
-                    and_(
-                        Reservation.start_time >= start_time_obj,
-                        Reservation.end_time <= end_time_obj,
-                    ),
-                ),
-                Reservation.status != "CANCELLED",
+        dates = {date_obj for _, date_obj, _, _ in parsed_slots}
+        try:
+            # 2. 공간/날짜 잠금 후 기존 예약 현황 조회
+            ReservationService._lock_room_days(
+                {(room_id, date_obj) for room_id, date_obj, _, _ in parsed_slots}
             )
-        ).first()
+            room_masks = ReservationService._get_occupancy(room_ids, dates)
+            # 동아리 사용량 집계 행도 잠가 다른 공간의 동시 예약과 일일 제한 검사를 직렬화
+            usages = ReservationService._lock_club_usage(club_id, dates)
+
+            # 3. 충돌 및 일일 사용 시간 검사 (검사한 슬롯은 비트맵/사용량에 누적)
+            club_max_daily_hours = current_app.config.get("CLUB_MAX_DAILY_HOURS", 6)
+            outcomes = []
+            for room_id, date_obj, start_time_obj, end_time_obj in parsed_slots:
+                reservation = Reservation(
+                    club_id=club_id,
+                    user_id=user_id,
+                    room_id=room_id,
+                    date=date_obj,
+                    start_time=start_time_obj,
+                    end_time=end_time_obj,
+                    status="CONFIRMED",
+                    note=note,
+                )
+                new_mask = interval_mask(start_time_obj, end_time_obj)
+                room_key = (room_id, date_obj)
 
-        if existing_reservation:
-            raise ValueError("해당 시간대에 이미 예약이 있습니다.")
+                # 일일 최대 사용 시간 제한 (공간 설정과 동아리 정책 중 작은 값)
+                max_daily_hours = min(
+                    rooms[room_id].max_daily_hours, club_max_daily_hours
+                )
+                usage = usages[date_obj]
+                total_used_hours = slot_hours(usage.used_slots)
+                new_hours = slot_hours(slot_count(new_mask))
+
+                error = None
+                if room_masks.get(room_key, 0) & new_mask:
+                    error = "해당 시간대에 이미 예약이 있습니다."
+                elif total_used_hours + new_hours > max_daily_hours:
+                    error = f"일일 최대 사용 시간({max_daily_hours:g}시간)을 초과합니다. 현재 사용: {total_used_hours:.1f}시간, 신청: {new_hours:.1f}시간"
+
+                if error:
+                    if not partial:
+                        raise ValueError(error)
+                    outcomes.append((reservation, error))
+                    continue
+
+                room_masks[room_key] = room_masks.get(room_key, 0) | new_mask
+                usage.used_slots += slot_count(new_mask)
+                outcomes.append((reservation, None))
+
+            # 4. 일괄 생성 (dry_run이면 잠금/사용량 변경까지 모두 되돌림)
+            if dry_run:
+                db.session.rollback()
+            else:
+                ReservationService._insert_reservations(
+                    [reservation for reservation, error in outcomes if not error]
+                )
+                db.session.commit()
 
-        # 동아리 일일 사용 시간 제한 확인
-        club_reservations = Reservation.query.filter(
-            and_(
-                Reservation.club_id == club_id,
-                Reservation.date == date_obj,
-                Reservation.status != "CANCELLED",
-            )
-        ).all()
-
-        # 기존 예약 시간 계산
-        total_used_hours = 0
-        for reservation in club_reservations:
-            start_datetime = datetime.combine(reservation.date, reservation.start_time)
-            end_datetime = datetime.combine(reservation.date, reservation.end_time)
-            duration = end_datetime - start_datetime
-            total_used_hours += duration.total_seconds() / 3600
-
-        # 새 예약 시간 계산
-        new_start_datetime = datetime.combine(date_obj, start_time_obj)
-        new_end_datetime = datetime.combine(date_obj, end_time_obj)
-        new_duration = new_end_datetime - new_start_datetime
-        new_hours = new_duration.total_seconds() / 3600
-
-        # 일일 최대 사용 시간 제한 (6시간)
-        max_daily_hours = 6
-        if total_used_hours + new_hours > max_daily_hours:
-            raise ValueError(
-                f"일일 최대 사용 시간({max_daily_hours}시간)을 초과합니다. 현재 사용: {total_used_hours:.1f}시간, 신청: {new_hours:.1f}시간"
-            )
+        except Exception:
+            # 생성 중인 예약 롤백 및 공간/날짜 잠금 해제
+            db.session.rollback()
+            raise
 
-        # 예약 생성
-        reservation = Reservation(
-            club_id=club_id,
-            user_id=user_id,
-            room_id=room_id,
-            date=date_obj,
-            start_time=start_time_obj,
-            end_time=end_time_obj,
-            status="CONFIRMED",
-            note=note,
-        )
+        return club, user, rooms, outcomes
 
-        db.session.add(reservation)
-        db.session.commit()
+    @staticmethod
+    def _insert_reservations(reservations: List[Reservation]) -> None:
+        """
+        예약을 한 번의 다중 행 INSERT로 저장하고, 생성된 id/created_at을 한 번의 SELECT로 채움
+
+        예약 객체는 세션에 추가하지 않으므로 커밋 후 행마다 다시 조회하지 않습니다.
+        공간/날짜가 잠겨 있고 활성 예약끼리는 겹치지 않으므로
+        (공간, 날짜, 시작 시각)으로 방금 생성한 행을 찾을 수 있습니다.
+        """
+        if not reservations:
+            return
+
+        columns = (
+            "club_id",
+            "user_id",
+            "room_id",
+            "date",
+            "start_time",
+            "end_time",
+            "status",
+            "note",
+        )
+        db.session.execute(
+            insert(Reservation).values(
+                [
+                    {column: getattr(reservation, column) for column in columns}
+                    for reservation in reservations
+                ]
+            )
+        )
 
-        return {
-            "id": reservation.id,
-            "club": {"id": club.id, "name": club.name},
-            "user": {"id": user.id, "name": user.name},
-            "room": {"id": room.id, "name": room.name, "location": room.location},
-            "date": date,
-            "start_time": start_time,
-            "end_time": end_time,
-            "duration_hours": round(new_hours, 1),
-            "status": reservation.status,
-            "note": note,
-            "created_at": reservation.created_at.isoformat(),
+        by_slot = {
+            (reservation.room_id, reservation.date, reservation.start_time): reservation
+            for reservation in reservations
         }
+        rows = db.session.query(
+            Reservation.id,
+            Reservation.room_id,
+            Reservation.date,
+            Reservation.start_time,
+            Reservation.created_at,
+        ).filter(
+            Reservation.club_id == reservations[0].club_id,
+            Reservation.room_id.in_({room_id for room_id, _, _ in by_slot}),
+            Reservation.date.in_({date_obj for _, date_obj, _ in by_slot}),
+            Reservation.status == "CONFIRMED",
+        )
+        for row in rows:
+            reservation = by_slot.get((row.room_id, row.date, row.start_time))
+            if reservation is not None:
+                reservation.id = row.id
+                reservation.created_at = row.created_at
 
     @staticmethod
-    def create_reservations_with_slots(
-        club_id: int,
-        user_id: int,
-        slots: List[Dict],
-        note: Optional[str] = None,
-    ) -> List[Dict]:
-        """다중 예약 생성 (slots 형태)"""
-        try:
-            # 해당 동아리와 사용자가 존재하는지 확인
-            club = Club.query.get(club_id)
-            if not club:
-                raise ValueError(f"ID {club_id}에 해당하는 동아리를 찾을 수 없습니다.")
+    def _lock_room_days(room_days) -> None:
+        """
+        공간/날짜 잠금 행들을 SELECT ... FOR UPDATE로 잠금 (없으면 생성)
+        같은 공간/날짜의 예약 생성은 트랜잭션이 끝날 때까지 직렬화됩니다.
+
+        Args:
+            room_days: {(room_id, date), ...}
+        """
+        room_ids = {room_id for room_id, _ in room_days}
+        dates = {date_obj for _, date_obj in room_days}
+
+        def lock():
+            # 교착 상태를 피하기 위해 항상 같은 순서로 잠금
+            return {
+                (room_day.room_id, room_day.date)
+                for room_day in RoomDay.query.filter(
+                    RoomDay.room_id.in_(room_ids), RoomDay.date.in_(dates)
+                )
+                .order_by(RoomDay.room_id, RoomDay.date)
+                .with_for_update()
+            }
+
+        missing = room_days - lock()
+        if missing:
+            try:
+                with db.session.begin_nested():
+                    db.session.add_all(
+                        RoomDay(room_id=room_id, date=date_obj)
+                        for room_id, date_obj in sorted(missing)
+                    )
+            except IntegrityError:
+                # 다른 요청이 먼저 생성한 경우 해당 행을 잠금
+                pass
+            lock()
 
-            user = User.query.get(user_id)
-            if not user:
-                raise ValueError(f"ID {user_id}에 해당하는 사용자를 찾을 수 없습니다.")
+    @staticmethod
+    def _get_occupancy(room_ids, dates) -> Dict:
+        """
+        날짜별 공간 예약 비트맵 조회 (한 번의 쿼리)
+
+        Returns:
+            {(room_id, date): 공간 예약 슬롯 비트맵}
+        """
+        rows = (
+            db.session.query(
+                Reservation.room_id,
+                Reservation.date,
+                Reservation.start_time,
+                Reservation.end_time,
+            )
+            .filter(
+                Reservation.room_id.in_(room_ids),
+                Reservation.date.in_(dates),
+                Reservation.status.in_(ACTIVE_RESERVATION_STATUSES),
+            )
+            .all()
+        )
 
-            created_reservations = []
+        room_masks = {}
+        for row in rows:
+            room_key = (row.room_id, row.date)
+            room_masks[room_key] = room_masks.get(room_key, 0) | interval_mask(
+                row.start_time, row.end_time
+            )
+        return room_masks
 
-            # 각 슬롯에 대해 예약 생성
-            for slot in slots:
-                room_id = slot.get("room_id")
-                date = slot.get("date")
-                start_time = slot.get("start_time")
-                end_time = slot.get("end_time")
+    @staticmethod
+    def _lock_club_usage(club_id: int, dates) -> Dict:
+        """
+        동아리/날짜별 사용량 집계 행을 SELECT ... FOR UPDATE로 잠금 (없으면 생성)
+        새로 만드는 행은 기존 예약으로부터 사용량을 계산해 초기화합니다.
+
+        Returns:
+            {date: ClubDailyUsage}
+        """
+
+        def lock():
+            return {
+                usage.date: usage
+                for usage in ClubDailyUsage.query.filter(
+                    ClubDailyUsage.club_id == club_id,
+                    ClubDailyUsage.date.in_(dates),
+                )
+                .order_by(ClubDailyUsage.date)
+                .with_for_update()
+            }
 
-                if not all([room_id, date, start_time, end_time]):
-                    raise ValueError(
-                        "각 슬롯에는 room_id, date, start_time, end_time이 필요합니다."
+        usages = lock()
+        missing = set(dates) - set(usages)
+        if missing:
+            used_slots = ReservationService._count_club_slots(club_id, missing)
+            try:
+                with db.session.begin_nested():
+                    db.session.add_all(
+                        ClubDailyUsage(
+                            club_id=club_id,
+                            date=date_obj,
+                            used_slots=used_slots.get(date_obj, 0),
+                        )
+                        for date_obj in sorted(missing)
                     )
+            except IntegrityError:
+                # 다른 요청이 먼저 생성한 경우 해당 행을 잠금
+                pass
+            usages = lock()
+        return usages
 
-                # 개별 예약 생성
-                reservation = ReservationService.create_reservation(
-                    club_id=club_id,
-                    user_id=user_id,
-                    room_id=room_id,
-                    date=date,
-                    start_time=start_time,
-                    end_time=end_time,
-                    note=note,
-                )
-                created_reservations.append(reservation)
+    @staticmethod
+    def _count_club_slots(club_id: int, dates) -> Dict:
+        """예약으로부터 동아리의 날짜별 사용 슬롯 수 계산 -> {date: 슬롯 수}"""
+        rows = (
+            db.session.query(
+                Reservation.date, Reservation.start_time, Reservation.end_time
+            )
+            .filter(
+                Reservation.club_id == club_id,
+                Reservation.date.in_(dates),
+                Reservation.status.in_(ACTIVE_RESERVATION_STATUSES),
+            )
+            .all()
+        )
 
-            return created_reservations
+        used_slots = {}
+        for row in rows:
+            used_slots[row.date] = used_slots.get(row.date, 0) + slot_count(
+                interval_mask(row.start_time, row.end_time)
+            )
+        return used_slots
 
-        except Exception as e:
-            # 오류 발생 시 생성된 예약들을 롤백
-            db.session.rollback()
-            raise e
+    @staticmethod
+    def change_status(reservation: Reservation, status: str) -> None:
+        """
+        예약 상태 변경 (커밋하지 않음)
+        공간 점유 여부가 바뀌는 경우(취소 등) 동아리 사용량 집계도 같은 트랜잭션에서 갱신합니다.
+        """
+        was_active = reservation.status in ACTIVE_RESERVATION_STATUSES
+        is_active = status in ACTIVE_RESERVATION_STATUSES
+
+        if was_active != is_active:
+            # 상태 변경 전에 잠가야 새로 생성되는 집계 행이 변경 전 상태로 초기화됨
+            usage = ReservationService._lock_club_usage(
+                reservation.club_id, {reservation.date}
+            )[reservation.date]
+            slots = slot_count(
+                interval_mask(reservation.start_time, reservation.end_time)
+            )
+            usage.used_slots += slots if is_active else -slots
+
+        reservation.status = status
+
+    @staticmethod
+    def reconcile_club_usage(date_from: date) -> Dict:
+        """
+        date_from 이후 동아리 사용량 집계를 예약 기준으로 재계산 (집계 행이 없으면 생성)
+        (동아리, 날짜)마다 집계 행을 잠근 뒤 다시 계산하므로 동시에 들어오는 예약과 충돌하지 않습니다.
+
+        Returns:
+            dict: checked(확인한 집계 수), corrected(값이 달라 수정한 집계 수)
+        """
+        reservation_keys = (
+            db.session.query(Reservation.club_id, Reservation.date)
+            .filter(
+                Reservation.date >= date_from,
+                Reservation.status.in_(ACTIVE_RESERVATION_STATUSES),
+            )
+            .distinct()
+        )
+        usage_keys = db.session.query(
+            ClubDailyUsage.club_id, ClubDailyUsage.date
+        ).filter(ClubDailyUsage.date >= date_from)
+        keys = sorted({(row[0], row[1]) for row in reservation_keys.union(usage_keys)})
+
+        corrected = 0
+        for club_id, date_obj in keys:
+            try:
+                usage = ReservationService._lock_club_usage(club_id, {date_obj})[
+                    date_obj
+                ]
+                used_slots = ReservationService._count_club_slots(
+                    club_id, {date_obj}
+                ).get(date_obj, 0)
+                if usage.used_slots != used_slots:
+                    usage.used_slots = used_slots
+                    corrected += 1
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+
+        return {"checked": len(keys), "corrected": corrected}
+
+    @staticmethod
+    def get_club_usage_slots(club_id: int, date_from: date, date_to: date) -> Dict:
+        """동아리의 기간 내 날짜별 사용 슬롯 수 (집계 테이블 조회) -> {date: 슬롯 수}"""
+        return {
+            usage.date: usage.used_slots
+            for usage in ClubDailyUsage.query.filter(
+                ClubDailyUsage.club_id == club_id,
+                ClubDailyUsage.date.between(date_from, date_to),
+            )
+        }
 
     @staticmethod
     def get_user_reservations(
-        user_id: int, mine: bool = True, status_filter: Optional[List[str]] = None
-    ) -> List[Dict]:
-        """사용자(나, 동아리) 대관 신청 목록 조회"""
+        user_id: int,
+        mine: bool = True,
+        status_filter: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict:
+        """
+        사용자(나, 동아리) 대관 신청 목록 조회
+
+        최신순 (date, start_time, id) 커서 기반으로 limit개씩 조회합니다.
+
+        Returns:
+            dict: reservations, next_cursor (다음 페이지가 없으면 None)
+        """
         query = Reservation.query
 
         if mine:
@@ -219,44 +724,9 @@ class ReservationService:
         if status_filter:
             query = query.filter(Reservation.status.in_(status_filter))
 
-        reservations = query.order_by(
-            Reservation.date.desc(), Reservation.start_time.desc()
-        ).all()
-
-        return [
-            {
-                "id": reservation.id,
-                "club": {
-                    "id": reservation.club.id if reservation.club else None,
-                    "name": reservation.club.name if reservation.club else "알 수 없음",
-                },
-                "user": {
-                    "id": reservation.user.id if reservation.user else None,
-                    "name": reservation.user.name if reservation.user else "알 수 없음",
-                    "email": reservation.user.email if reservation.user else None,
-                    "phone_number": (
-                        reservation.user.phone_number if reservation.user else None
-                    ),
-                    "student_id": (
-                        reservation.user.student_id if reservation.user else None
-                    ),
-                },
-                "room": {
-                    "id": reservation.room.id if reservation.room else None,
-                    "name": reservation.room.name if reservation.room else "알 수 없음",
-                    "location": reservation.room.location if reservation.room else None,
-                },
-                "date": reservation.date.strftime("%Y-%m-%d"),
-                "start_time": reservation.start_time.strftime("%H:%M"),
-                "end_time": reservation.end_time.strftime("%H:%M"),
-                "status": reservation.status,
-                "note": reservation.note,
-                "admin_note": reservation.admin_note,
-                "created_at": reservation.created_at.isoformat(),
-                "updated_at": reservation.updated_at.isoformat(),
-            }
-            for reservation in reservations
-        ]
+        return ReservationService._paginate_reservations(
+            query, cursor, limit, fields, LIST_FIELDS
+        )
 
     @staticmethod
     def get_reservation_detail(reservation_id: int, user_id: int) -> Dict:
@@ -348,7 +818,7 @@ class ReservationService:
             raise ValueError("이미 취소된 예약입니다.")
 
         # 예약 취소 (실제로는 삭제하지 않고 상태만 변경)
-        reservation.status = "CANCELLED"
+        ReservationService.change_status(reservation, "CANCELLED")
         db.session.commit()
 
         return {
@@ -364,8 +834,18 @@ class ReservationService:
         club_id: Optional[int] = None,
         date_from: Optional[str] = None,
         date_to: Optional[str] = None,
-    ) -> List[Dict]:
-        """통합 예약 목록 조회 (모든 동아리)"""
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict:
+        """
+        통합 예약 목록 조회 (모든 동아리)
+
+        최신순 (date, start_time, id) 커서 기반으로 limit개씩 조회합니다.
+
+        Returns:
+            dict: reservations, next_cursor (다음 페이지가 없으면 None)
+        """
         try:
             query = Reservation.query
 
@@ -396,54 +876,132 @@ class ReservationService:
                         "date_to 형식이 올바르지 않습니다. YYYY-MM-DD 형식을 사용하세요."
                     )
 
-            # 최신순으로 정렬
-            reservations = query.order_by(
-                Reservation.date.desc(), Reservation.start_time.desc()
-            ).all()
-
-            return [
-                {
-                    "id": reservation.id,
-                    "club": {
-                        "id": reservation.club.id if reservation.club else None,
-                        "name": (
-                            reservation.club.name if reservation.club else "알 수 없음"
-                        ),
-                    },
-                    "user": {
-                        "id": reservation.user.id if reservation.user else None,
-                        "name": (
-                            reservation.user.name if reservation.user else "알 수 없음"
-                        ),
-                        "email": reservation.user.email if reservation.user else None,
-                        "phone_number": (
-                            reservation.user.phone_number if reservation.user else None
-                        ),
-                        "student_id": (
-                            reservation.user.student_id if reservation.user else None
-                        ),
-                    },
-                    "room": {
-                        "id": reservation.room.id if reservation.room else None,
-                        "name": (
-                            reservation.room.name if reservation.room else "알 수 없음"
-                        ),
-                        "location": (
-                            reservation.room.location if reservation.room else None
-                        ),
-                    },
-                    "date": reservation.date.strftime("%Y-%m-%d"),
-                    "start_time": reservation.start_time.strftime("%H:%M"),
-                    "end_time": reservation.end_time.strftime("%H:%M"),
-                    "status": reservation.status,
-                    "is_photo_submitted": reservation.is_photo_submitted,
-                    "note": reservation.note,
-                    "admin_note": reservation.admin_note,
-                    "created_at": reservation.created_at.isoformat(),
-                    "updated_at": reservation.updated_at.isoformat(),
-                }
-                for reservation in reservations
-            ]
+            return ReservationService._paginate_reservations(
+                query, cursor, limit, fields, INTEGRATION_FIELDS
+            )
 
+        except ValueError:
+            raise
         except Exception as e:
             raise Exception(f"통합 예약 목록 조회 중 오류가 발생했습니다: {str(e)}")
+
+    @staticmethod
+    def _paginate_reservations(
+        query,
+        cursor: Optional[str],
+        limit: Optional[int],
+        fields: Optional[List[str]],
+        available_fields: tuple,
+    ) -> Dict:
+        """
+        예약 목록 커서 페이지네이션
+
+        - (date, start_time, id) 내림차순 키셋 조건으로 OFFSET 없이 다음 페이지 조회
+        - 선택한 필드에 필요한 club/user/room만 한 번의 JOIN으로 함께 조회
+        """
+        if limit is None:
+            limit = DEFAULT_PAGE_SIZE
+        if not isinstance(limit, int) or not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit은 1~{MAX_PAGE_SIZE} 사이의 정수여야 합니다.")
+
+        selected = ReservationService._parse_fields(fields, available_fields)
+        for relation in ("club", "user", "room"):
+            if relation in selected:
+                query = query.options(joinedload(getattr(Reservation, relation)))
+
+        if cursor:
+            cursor_date, cursor_start_time, cursor_id = decode_cursor(cursor)
+            query = query.filter(
+                or_(
+                    Reservation.date < cursor_date,
+                    and_(
+                        Reservation.date == cursor_date,
+                        or_(
+                            Reservation.start_time < cursor_start_time,
+                            and_(
+                                Reservation.start_time == cursor_start_time,
+                                Reservation.id < cursor_id,
+                            ),
+                        ),
+                    ),
+                )
+            )
+
+        # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+        reservations = (
+            query.order_by(
+                Reservation.date.desc(),
+                Reservation.start_time.desc(),
+                Reservation.id.desc(),
+            )
+            .limit(limit + 1)
+            .all()
+        )
+
+        next_cursor = None
+        if len(reservations) > limit:
+            reservations = reservations[:limit]
+            last = reservations[-1]
+            next_cursor = encode_cursor(last.date, last.start_time, last.id)
+
+        return {
+            "reservations": [
+                ReservationService._serialize_reservation(reservation, selected)
+                for reservation in reservations
+            ],
+            "next_cursor": next_cursor,
+        }
+
+    @staticmethod
+    def _parse_fields(fields: Optional[List[str]], available_fields: tuple) -> Dict:
+        """
+        fields 선택자 해석
+
+        "user"처럼 그룹 전체 또는 "user.name"처럼 하위 필드만 선택할 수 있습니다.
+
+        Returns:
+            {필드: None(전체) 또는 하위 필드 집합}
+        """
+        if not fields:
+            return {field: None for field in available_fields}
+
+        selected = {}
+        for field in fields:
+            name, _, sub_field = field.partition(".")
+            if name not in available_fields or (
+                sub_field and sub_field not in RELATION_FIELDS.get(name, ())
+            ):
+                raise ValueError(f"지원하지 않는 필드입니다: {field}")
+            if not sub_field:
+                selected[name] = None
+            elif name not in selected or selected[name] is not None:
+                selected.setdefault(name, set()).add(sub_field)
+        return selected
+
+    @staticmethod
+    def _serialize_reservation(reservation: Reservation, selected: Dict) -> Dict:
+        """선택한 필드만 예약 정보로 변환"""
+        result = {}
+        for name, sub_fields in selected.items():
+            if name in RELATION_FIELDS:
+                related = getattr(reservation, name)
+                result[name] = {
+                    sub_field: (
+                        getattr(related, sub_field)
+                        if related
+                        else ("알 수 없음" if sub_field == "name" else None)
+                    )
+                    for sub_field in RELATION_FIELDS[name]
+                    if sub_fields is None or sub_field in sub_fields
+                }
+                continue
+
+            value = getattr(reservation, name)
+            if name == "date":
+                value = value.strftime("%Y-%m-%d")
+            elif name in ("start_time", "end_time"):
+                value = value.strftime("%H:%M")
+            elif name in ("created_at", "updated_at"):
+                value = value.isoformat()
+            result[name] = value
+        return result
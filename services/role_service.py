@@ -1,4 +1,5 @@
 from models import db, Role, User, Club, ClubMember
+from services.permission_service import permission_service
 
 
 def create_role(name, description=None):
@@ -82,6 +83,9 @@ def assign_role_to_user_in_club(user_id, club_id, role_id):
 
         db.session.commit()
 
+        # 권한 캐시 삭제
+        permission_service.clear_user_cache(user_id)
+
         return {
             "user_id": user.id,
             "user_name": user.name,
@@ -136,6 +140,9 @@ def remove_user_role_from_club(user_id, club_id):
         db.session.delete(membership)
         db.session.commit()
 
+        # 권한 캐시 삭제
+        permission_service.clear_user_cache(user_id)
+
         return {
             "user_id": membership.user.id,
             "user_name": membership.user.name,
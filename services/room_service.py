@@ -2,6 +2,19 @@ from datetime import datetime, date, time, timedelta
 from typing import List, Dict, Optional
 from sqlalchemy import and_, or_
 from models import db, Room, Reservation, Club, User
+from services.reservation_service import ACTIVE_RESERVATION_STATUSES
+from utils.reservation_slots import (
+    SLOT_MINUTES,
+    close_time_to_str,
+    interval_mask,
+    mask_to_ranges,
+    operating_mask,
+    operating_slots,
+    slot_to_str,
+)
+
+# 가용시간 일괄 조회 시 최대 조회 기간 (일)
+MAX_AVAILABILITY_DAYS = 31
 
 
 class RoomService:
@@ -16,6 +29,8 @@ class RoomService:
                 "location": room.location,
                 "description": room.description,
                 "max_daily_hours": room.max_daily_hours,
+                "open_time": room.open_time.strftime("%H:%M"),
+                "close_time": close_time_to_str(room.close_time),
                 "created_at": room.created_at.isoformat() if room.created_at else None,
                 "updated_at": room.updated_at.isoformat() if room.updated_at else None,
             }
@@ -38,69 +53,170 @@ class RoomService:
         if not room:
             raise ValueError(f"ID {room_id}에 해당하는 공간을 찾을 수 없습니다.")
 
-        # 해당 날짜의 예약 조회
-        reservations = Reservation.query.filter(
-            and_(
-                Reservation.room_id == room_id,
-                Reservation.date == target_date_obj,
-                Reservation.status != "CANCELLED",  # 취소된 예약은 제외
-            )
-        ).all()
+        grid, booked = RoomService._build_occupancy_grid(
+            [room_id], target_date_obj, target_date_obj
+        )
+        booked_mask = grid.get((room_id, target_date_obj), 0)
 
         # 예약된 시간대 정리
-        booked_slots = []
-        for reservation in reservations:
-            booked_slots.append(
-                {
-                    "start_time": reservation.start_time.strftime("%H:%M"),
-                    "end_time": reservation.end_time.strftime("%H:%M"),
-                    "club_name": (
-                        reservation.club.name if reservation.club else "알 수 없음"
-                    ),
-                    "status": reservation.status,
-                }
-            )
+        booked_slots = [
+            {
+                "start_time": reservation.start_time.strftime("%H:%M"),
+                "end_time": reservation.end_time.strftime("%H:%M"),
+                "club_name": reservation.club_name or "알 수 없음",
+                "status": reservation.status,
+            }
+            for reservation in booked.get((room_id, target_date_obj), [])
+        ]
 
-        # 하루 24시간 중 사용 가능한 시간대 계산 (예: 09:00-22:00)
+        # 운영 시간 중 1시간 단위로 사용 가능한 시간대 계산 (예: 09:00-22:00)
         available_slots = []
-        start_hour = 9  # 오전 9시부터
-        end_hour = 22  # 오후 10시까지
-
-        for hour in range(start_hour, end_hour):
-            slot_start = time(hour, 0)
-            slot_end = time(hour + 1, 0)
-
-            # 해당 시간대에 예약이 있는지 확인
-            is_booked = False
-            for reservation in reservations:
-                if (
-                    reservation.start_time <= slot_start < reservation.end_time
-                    or reservation.start_time < slot_end <= reservation.end_time
-                    or (
-                        reservation.start_time <= slot_start
-                        and reservation.end_time >= slot_end
-                    )
-                ):
-                    is_booked = True
-                    break
-
-            if not is_booked:
+        hour_slots = 60 // SLOT_MINUTES
+        open_slot, close_slot = operating_slots(room.open_time, room.close_time)
+        for slot in range(open_slot, close_slot - hour_slots + 1, hour_slots):
+            hour_mask = ((1 << hour_slots) - 1) << slot
+            if not booked_mask & hour_mask:
                 available_slots.append(
                     {
-                        "start_time": slot_start.strftime("%H:%M"),
-                        "end_time": slot_end.strftime("%H:%M"),
+                        "start_time": slot_to_str(slot),
+                        "end_time": slot_to_str(slot + hour_slots),
                     }
                 )
 
         return {
-            "room": {
-                "id": room.id,
-                "name": room.name,
-                "location": room.location,
-                "description": room.description,
-                "max_daily_hours": room.max_daily_hours,
-            },
+            "room": RoomService._serialize_room_summary(room),
             "date": target_date,
             "available_slots": available_slots,
             "booked_slots": booked_slots,
         }
+
+    @staticmethod
+    def get_rooms_availability(
+        date_from: str, date_to: str, room_ids: Optional[List[int]] = None
+    ) -> Dict:
+        """
+        여러 공간 x 여러 날짜의 30분 단위 가용시간 조회
+
+        기간 내 예약을 한 번의 범위 쿼리로 조회하여 (공간, 날짜)별 슬롯 비트맵을 만든 뒤,
+        각 공간의 운영 시간 비트맵에서 예약된 슬롯을 제외해 가용 구간을 계산합니다.
+
+        Args:
+            date_from: 시작 날짜 (YYYY-MM-DD)
+            date_to: 종료 날짜 (YYYY-MM-DD, 포함)
+            room_ids: 공간 ID 목록 (None이면 전체 공간)
+        """
+        try:
+            date_from_obj = datetime.strptime(date_from, "%Y-%m-%d").date()
+            date_to_obj = datetime.strptime(date_to, "%Y-%m-%d").date()
+        except ValueError:
+            raise ValueError(
+                "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식을 사용해주세요."
+            )
+
+        if date_from_obj > date_to_obj:
+            raise ValueError("date_from은 date_to보다 늦을 수 없습니다.")
+
+        day_count = (date_to_obj - date_from_obj).days + 1
+        if day_count > MAX_AVAILABILITY_DAYS:
+            raise ValueError(
+                f"한 번에 최대 {MAX_AVAILABILITY_DAYS}일까지 조회할 수 있습니다."
+            )
+
+        query = Room.query
+        if room_ids:
+            query = query.filter(Room.id.in_(room_ids))
+        rooms = query.order_by(Room.id).all()
+
+        if room_ids:
+            missing = set(room_ids) - {room.id for room in rooms}
+            if missing:
+                raise ValueError(
+                    f"ID {min(missing)}에 해당하는 공간을 찾을 수 없습니다."
+                )
+
+        grid, _ = RoomService._build_occupancy_grid(
+            [room.id for room in rooms], date_from_obj, date_to_obj
+        )
+        dates = [date_from_obj + timedelta(days=i) for i in range(day_count)]
+
+        result_rooms = []
+        for room in rooms:
+            open_mask = operating_mask(room.open_time, room.close_time)
+            days = []
+            for day in dates:
+                booked_mask = grid.get((room.id, day), 0) & open_mask
+                days.append(
+                    {
+                        "date": day.strftime("%Y-%m-%d"),
+                        "available_slots": RoomService._mask_to_slots(
+                            open_mask & ~booked_mask
+                        ),
+                        "booked_slots": RoomService._mask_to_slots(booked_mask),
+                    }
+                )
+
+            room_data = RoomService._serialize_room_summary(room)
+            room_data["days"] = days
+            result_rooms.append(room_data)
+
+        return {
+            "date_from": date_from,
+            "date_to": date_to,
+            "slot_minutes": SLOT_MINUTES,
+            "rooms": result_rooms,
+        }
+
+    @staticmethod
+    def _build_occupancy_grid(room_ids: List[int], date_from: date, date_to: date):
+        """
+        기간 내 예약을 한 번의 범위 쿼리로 조회하여 점유 그리드 생성
+
+        Returns:
+            ({(room_id, date): 예약 슬롯 비트맵}, {(room_id, date): [예약 행, ...]})
+        """
+        rows = (
+            db.session.query(
+                Reservation.room_id,
+                Reservation.date,
+                Reservation.start_time,
+                Reservation.end_time,
+                Reservation.status,
+                Club.name.label("club_name"),
+            )
+            .outerjoin(Club, Reservation.club_id == Club.id)
+            .filter(
+                Reservation.room_id.in_(room_ids),
+                Reservation.date.between(date_from, date_to),
+                Reservation.status.in_(ACTIVE_RESERVATION_STATUSES),
+            )
+            .order_by(Reservation.start_time)
+            .all()
+        )
+
+        grid = {}
+        booked = {}
+        for row in rows:
+            key = (row.room_id, row.date)
+            grid[key] = grid.get(key, 0) | interval_mask(row.start_time, row.end_time)
+            booked.setdefault(key, []).append(row)
+        return grid, booked
+
+    @staticmethod
+    def _mask_to_slots(mask: int) -> List[Dict]:
+        """슬롯 비트맵을 연속 구간 목록으로 변환"""
+        return [
+            {"start_time": slot_to_str(start), "end_time": slot_to_str(end)}
+            for start, end in mask_to_ranges(mask)
+        ]
+
+    @staticmethod
+    def _serialize_room_summary(room: Room) -> Dict:
+        return {
+            "id": room.id,
+            "name": room.name,
+            "location": room.location,
+            "description": room.description,
+            "max_daily_hours": room.max_daily_hours,
+            "open_time": room.open_time.strftime("%H:%M"),
+            "close_time": close_time_to_str(room.close_time),
+        }
@@ -1,9 +1,30 @@
+import time
 import uuid
-from datetime import timedelta
-from flask import session
-from models import db, UserSession
+from datetime import datetime, timedelta
+from flask import current_app, g, has_app_context, session
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+from sqlalchemy import or_
+from models import db, ClubMember, Role, User, UserSession
+from utils.cache import MemoryBackend, cache_manager, get_cache
 from utils.time_utils import get_kst_now_naive
 
+# 활성 세션 조회 캐시 유지 시간 (초) - 폐기 epoch가 바뀌면 즉시 무효화되며, TTL은 안전장치
+SESSION_CACHE_TTL = 60
+# 워커별로 기억할 최대 폐기 세션 수
+REVOKED_SESSIONS_MAX_ENTRIES = 10000
+SESSION_TOKEN_SALT = "clubu-session-token"
+# 만료 세션 정리 작업의 배치 크기
+SESSION_CLEANUP_BATCH_SIZE = 1000
+# 비활성 세션 보관 기간 (일) - 이후 삭제
+SESSION_RETENTION_DAYS = 30
+
+# session_id -> (세션 정보 dict, 만료 시각 naive datetime, 캐시 시점의 폐기 epoch)
+_session_cache = get_cache("session", ttl=SESSION_CACHE_TTL)
+# 세션 폐기 epoch 카운터 (공유 백엔드 설정 시 모든 워커가 같은 값을 공유)
+_revocation_cache = get_cache("session.revocation")
+# 이 워커에서 폐기한 session_id 집합 (다른 워커의 폐기는 epoch 변경 후 DB 조회로 반영)
+_revoked_sessions = MemoryBackend(max_entries=REVOKED_SESSIONS_MAX_ENTRIES)
+
 
 def create_session(user_id, channel, device_id=None, expires_hours=24 * 30):
     """새로운 사용자 세션 생성 (쿠키에는 session_id만 저장)
@@ -33,6 +54,10 @@ def create_session(user_id, channel, device_id=None, expires_hours=24 * 30):
 
         # Flask 세션에는 session_id만 저장 (쿠키에 자동 저장됨)
         session["session_id"] = session_id
+        if _session_token_enabled():
+            session_data, _ = _cache_session(new_session)
+            session["session_token"] = _issue_session_token(session_data)
+        _reset_request_identity()
 
         result = {
             "session_id": session_id,
@@ -52,66 +77,303 @@ def create_session(user_id, channel, device_id=None, expires_hours=24 * 30):
 def get_current_session():
     """현재 Flask 세션에서 세션 정보 조회 (쿠키에서 session_id만 읽기)"""
     try:
-        session_id = session.get("session_id")
+        identity = get_current_identity()
+        if not identity:
+            return None
+
+        return dict(identity["session"])
+
+    except Exception as e:
+        raise Exception(f"현재 세션 조회 중 오류 발생: {str(e)}")
 
-        if not session_id:
+
+def get_current_user():
+    """현재 세션에서 사용자 정보 조회"""
+    try:
+        identity = get_current_identity()
+        if not identity:
             return None
 
-        # DB에서 세션 유효성 확인
-        db_session = UserSession.query.filter_by(
-            session_id=session_id, is_active=True
-        ).first()
+        return identity["user"]
+
+    except Exception as e:
+        raise Exception(f"현재 사용자 조회 중 오류 발생: {str(e)}")
+
+
+def get_current_identity():
+    """
+    현재 요청의 인증 정보 조회 (세션 + 사용자 + 권한)
+
+    요청당 한 번만 조회하여 flask.g에 저장하므로, 데코레이터/서비스/컨트롤러가
+    여러 번 호출해도 추가 DB 조회가 발생하지 않습니다.
+
+    Returns:
+        dict 또는 None:
+            - session: 세션 정보 dict
+            - user: User 객체
+            - memberships: {club_id(전역 역할은 None): {역할명, ...}}
+    """
+    if "identity" not in g:
+        g.identity = _resolve_identity()
+    return g.identity
+
+
+def get_request_identity():
+    """현재 요청에서 이미 조회된 인증 정보 반환 (조회하지 않음, 없으면 None)"""
+    if not has_app_context():
+        return None
+    return g.get("identity")
+
+
+def _reset_request_identity():
+    """로그인/로그아웃 시 현재 요청에 저장된 인증 정보 초기화"""
+    if has_app_context():
+        g.pop("identity", None)
+
 
-        if not db_session:
+def _resolve_identity():
+    """세션, 사용자, 권한을 한 번의 조인 쿼리로 조회"""
+    from services.permission_service import permission_service
+
+    session_id = session.get("session_id")
+    if not session_id:
+        return None
+
+    if _revoked_sessions.get(session_id):
+        clear_flask_session()
+        return None
+
+    # DB 조회 전에 epoch를 읽어 두어, 조회 이후의 폐기는 캐시된 항목에서 감지되도록 함
+    revocation_epoch = _get_revocation_epoch()
+
+    # 세션 캐시(또는 검증된 세션 토큰)가 있으면 사용자 + 권한만, 없으면 세션까지 함께 조회
+    cached = _load_session_token(session_id) or _load_cached_session(
+        session_id, revocation_epoch
+    )
+    if cached is not None:
+        session_data, expires_at_naive = cached
+        if get_kst_now_naive() > expires_at_naive:
+            deactivate_session(session_id)
             clear_flask_session()
             return None
 
-        # expires_at이 naive인 경우를 대비해 naive datetime으로 비교
-        current_time = get_kst_now_naive()
-        expires_at_naive = (
-            db_session.expires_at.replace(tzinfo=None)
-            if db_session.expires_at.tzinfo
-            else db_session.expires_at
+        # 권한 캐시도 있으면 사용자만 기본 키로 조회
+        cached_memberships = permission_service.get_cached_memberships(
+            session_data["user_id"]
         )
-        if current_time > expires_at_naive:
+        if cached_memberships is not None:
+            user = User.query.get(session_data["user_id"])
+            if not user:
+                clear_flask_session()
+                return None
+            return {
+                "session": session_data,
+                "user": user,
+                "memberships": cached_memberships,
+            }
+
+        rows = (
+            db.session.query(User, ClubMember.club_id, Role.role_name)
+            .outerjoin(ClubMember, ClubMember.user_id == User.id)
+            .outerjoin(Role, ClubMember.role_id == Role.id)
+            .filter(User.id == session_data["user_id"])
+            .all()
+        )
+        user_rows = [(row[0], row[1], row[2]) for row in rows]
+    else:
+        rows = (
+            db.session.query(UserSession, User, ClubMember.club_id, Role.role_name)
+            .join(User, UserSession.user_id == User.id)
+            .outerjoin(ClubMember, ClubMember.user_id == User.id)
+            .outerjoin(Role, ClubMember.role_id == Role.id)
+            .filter(UserSession.session_id == session_id, UserSession.is_active == True)
+            .all()
+        )
+        if not rows:
+            clear_flask_session()
+            return None
+
+        session_data, expires_at_naive = _cache_session(rows[0][0], revocation_epoch)
+        # expires_at이 naive인 경우를 대비해 naive datetime으로 비교
+        if get_kst_now_naive() > expires_at_naive:
             deactivate_session(session_id)
             clear_flask_session()
             return None
 
-        result = {
-            "session_id": db_session.session_id,
-            "user_id": db_session.user_id,
-            "channel": db_session.channel,
-            "device_id": db_session.device_id,
-            "expires_at": db_session.expires_at.isoformat(),
-        }
+        user_rows = [(row[1], row[2], row[3]) for row in rows]
+
+        # DB에서 활성 상태를 확인했으므로 현재 폐기 epoch로 토큰 재발급
+        if _session_token_enabled():
+            session["session_token"] = _issue_session_token(session_data)
+
+    if not user_rows:
+        clear_flask_session()
+        return None
+
+    memberships = {}
+    for _, club_id, role_name in user_rows:
+        if role_name is not None:
+            memberships.setdefault(club_id, set()).add(role_name)
+
+    user = user_rows[0][0]
+    permission_service.cache_user_memberships(user.id, memberships)
+
+    return {
+        "session": session_data,
+        "user": user,
+        "memberships": memberships,
+    }
+
+
+def _cache_session(db_session, revocation_epoch=None):
+    """활성 세션 정보를 캐시에 저장 -> (세션 정보 dict, 만료 시각 naive datetime)"""
+    expires_at_naive = (
+        db_session.expires_at.replace(tzinfo=None)
+        if db_session.expires_at.tzinfo
+        else db_session.expires_at
+    )
+    session_data = {
+        "session_id": db_session.session_id,
+        "user_id": db_session.user_id,
+        "channel": db_session.channel,
+        "device_id": db_session.device_id,
+        "expires_at": db_session.expires_at.isoformat(),
+    }
+
+    if _revocation_shared():
+        if revocation_epoch is None:
+            revocation_epoch = _get_revocation_epoch()
+        _session_cache.set(
+            db_session.session_id, (session_data, expires_at_naive, revocation_epoch)
+        )
+    return session_data, expires_at_naive
 
-        return result
 
-    except Exception as e:
-        raise Exception(f"현재 세션 조회 중 오류 발생: {str(e)}")
+def _load_cached_session(session_id, revocation_epoch):
+    """
+    캐시된 세션 정보 조회
 
+    캐시 이후 폐기 epoch가 바뀌었으면(다른 워커에서 세션이 비활성화되었을 수 있음)
+    캐시를 버리고 None을 반환하여 DB에서 활성 상태를 다시 확인하게 합니다.
 
-def get_current_user():
-    """현재 세션에서 사용자 정보 조회"""
-    try:
-        session_data = get_current_session()
-        if not session_data:
-            return None
+    Returns:
+        (세션 정보 dict, 만료 시각 naive datetime) 또는 None
+    """
+    if not _revocation_shared():
+        return None
 
-        from models import User
+    cached = _session_cache.get(session_id)
+    if cached is None:
+        return None
 
-        user = User.query.get(session_data["user_id"])
+    session_data, expires_at_naive, cached_epoch = cached
+    if cached_epoch != revocation_epoch:
+        _session_cache.delete(session_id)
+        return None
+    return session_data, expires_at_naive
 
-        return user
 
-    except Exception as e:
-        raise Exception(f"현재 사용자 조회 중 오류 발생: {str(e)}")
+def _revocation_shared():
+    """
+    세션 폐기가 모든 워커에 보이는지 여부
+
+    memory 캐시 백엔드의 폐기 epoch는 워커마다 따로 증가하므로, 워커가 여러 개
+    (WEB_CONCURRENCY > 1)이면 세션 캐시/세션 토큰을 사용하지 않고 매 요청 DB에서
+    활성 상태를 확인합니다.
+    """
+    if cache_manager.shared is not None:
+        return True
+    return not has_app_context() or current_app.config.get("WEB_CONCURRENCY", 1) <= 1
+
+
+def _session_token_enabled():
+    return (
+        has_app_context()
+        and current_app.config.get("SESSION_TOKEN_ENABLED", False)
+        and _revocation_shared()
+    )
+
+
+def _session_token_serializer():
+    return URLSafeTimedSerializer(current_app.secret_key, salt=SESSION_TOKEN_SALT)
+
+
+def _get_revocation_epoch():
+    """현재 세션 폐기 epoch (세션이 비활성화될 때마다 증가)"""
+    return _revocation_cache.get_counter("epoch")
+
+
+def _revoke_sessions(session_ids):
+    """비활성화된 세션을 폐기 집합에 추가하고 폐기 epoch 증가"""
+    if not session_ids:
+        return
+
+    for session_id in session_ids:
+        _session_cache.delete(session_id)
+        _revoked_sessions.set(session_id, True)
+    _revocation_cache.incr("epoch")
+
+
+def _issue_session_token(session_data):
+    """세션 정보와 현재 폐기 epoch를 서명한 세션 토큰 생성"""
+    payload = {
+        "sid": session_data["session_id"],
+        "uid": session_data["user_id"],
+        "ch": session_data["channel"],
+        "dev": session_data["device_id"],
+        "exp": session_data["expires_at"],
+        "ep": _get_revocation_epoch(),
+    }
+    return _session_token_serializer().dumps(payload)
+
+
+def _load_session_token(session_id):
+    """
+    쿠키의 세션 토큰 검증 (DB 조회 없음)
+
+    서명이 유효하고, 발급 이후 폐기 epoch가 바뀌지 않았으며, 갱신 주기가 지나지 않은
+    토큰만 신뢰합니다. 그 외에는 None을 반환하여 DB에서 세션을 다시 확인하게 합니다.
+
+    Returns:
+        (세션 정보 dict, 만료 시각 naive datetime) 또는 None
+    """
+    if not _session_token_enabled():
+        return None
+
+    token = session.get("session_token")
+    if not token:
+        return None
+
+    try:
+        payload, signed_at = _session_token_serializer().loads(
+            token, return_timestamp=True
+        )
+    except BadSignature:
+        return None
+
+    if payload.get("sid") != session_id:
+        return None
+    if payload.get("ep") != _get_revocation_epoch():
+        return None
+
+    refresh_seconds = current_app.config.get("SESSION_TOKEN_REFRESH_SECONDS", 300)
+    if time.time() - signed_at.timestamp() > refresh_seconds:
+        return None
+
+    session_data = {
+        "session_id": payload["sid"],
+        "user_id": payload["uid"],
+        "channel": payload["ch"],
+        "device_id": payload["dev"],
+        "expires_at": payload["exp"],
+    }
+    return session_data, datetime.fromisoformat(payload["exp"])
 
 
 def clear_flask_session():
     """Flask 세션 클리어 (쿠키에서 session_id만 삭제)"""
     session.clear()
+    _reset_request_identity()
 
 
 def validate_session(session_id):
@@ -158,6 +420,7 @@ def deactivate_session(session_id):
         if session_obj:
             session_obj.is_active = False
             db.session.commit()
+            _revoke_sessions([session_id])
         else:
             print("세션을 찾을 수 없습니다")
 
@@ -176,35 +439,114 @@ def deactivate_user_sessions(user_id, channel=None):
         if channel:
             query = query.filter_by(channel=channel)
 
-        query.update({"is_active": False})
+        # 캐시 무효화를 위해 비활성화할 세션 ID를 먼저 조회
+        session_ids = [
+            row.session_id for row in query.with_entities(UserSession.session_id)
+        ]
+
+        query.update({"is_active": False}, synchronize_session=False)
         db.session.commit()
 
+        _revoke_sessions(session_ids)
+
     except Exception as e:
         db.session.rollback()
         raise Exception(f"사용자 세션 비활성화 중 오류 발생: {str(e)}")
 
 
-def cleanup_expired_sessions():
-    """만료된 세션 정리"""
-    try:
-        # expires_at이 naive인 경우를 대비해 naive datetime으로 비교
-        current_time = get_kst_now_naive()
-        expired_sessions = UserSession.query.filter(
-            UserSession.expires_at < current_time, UserSession.is_active == True
-        ).all()
+def cleanup_expired_sessions(batch_size=SESSION_CLEANUP_BATCH_SIZE):
+    """만료된 세션 정리 (활성 상태인 만료 세션을 배치 단위로 비활성화)
 
-        for session_obj in expired_sessions:
-            session_obj.is_active = False
+    ORM 객체를 불러오지 않고 batch_size개씩 id만 조회한 뒤 set 기반 UPDATE를 수행하므로
+    테이블 크기와 관계없이 메모리 사용량이 일정합니다.
 
-        db.session.commit()
+    Returns:
+        비활성화된 세션 수
+    """
+    # expires_at이 naive인 경우를 대비해 naive datetime으로 비교
+    current_time = get_kst_now_naive()
+    return _update_sessions_in_batches(
+        (UserSession.is_active == True, UserSession.expires_at < current_time),
+        batch_size,
+        delete=False,
+    )
+
+
+def purge_inactive_sessions(
+    retention_days=SESSION_RETENTION_DAYS, batch_size=SESSION_CLEANUP_BATCH_SIZE
+):
+    """보관 기간이 지난 비활성 세션 삭제
+
+    만료 또는 로그아웃으로 비활성화된 세션 중 만료 시각이나 생성 시각이
+    retention_days일 이전인 세션을 배치 단위로 삭제합니다.
 
-        return len(expired_sessions)
+    Returns:
+        삭제된 세션 수
+    """
+    cutoff = get_kst_now_naive() - timedelta(days=retention_days)
+    return _update_sessions_in_batches(
+        (
+            UserSession.is_active == False,
+            or_(UserSession.expires_at < cutoff, UserSession.created_at < cutoff),
+        ),
+        batch_size,
+        delete=True,
+    )
+
+
+def _update_sessions_in_batches(conditions, batch_size, delete):
+    """조건에 맞는 세션을 batch_size개씩 비활성화(delete=False) 또는 삭제(delete=True)"""
+    total = 0
+    try:
+        while True:
+            session_ids = [
+                row.id
+                for row in db.session.query(UserSession.id)
+                .filter(*conditions)
+                .order_by(UserSession.id)
+                .limit(batch_size)
+            ]
+            if not session_ids:
+                break
+
+            query = UserSession.query.filter(UserSession.id.in_(session_ids))
+            if delete:
+                query.delete(synchronize_session=False)
+            else:
+                query.update({"is_active": False}, synchronize_session=False)
+            # 배치마다 커밋하여 잠금 유지 시간을 짧게 유지
+            db.session.commit()
+
+            total += len(session_ids)
+            if len(session_ids) < batch_size:
+                break
+
+        return total
 
     except Exception as e:
         db.session.rollback()
         raise Exception(f"만료된 세션 정리 중 오류 발생: {str(e)}")
 
 
+def cleanup_sessions(
+    retention_days=SESSION_RETENTION_DAYS, batch_size=SESSION_CLEANUP_BATCH_SIZE
+):
+    """만료 세션 비활성화 + 보관 기간이 지난 비활성 세션 삭제
+
+    Returns:
+        dict: deactivated(비활성화 수), purged(삭제 수), duration_ms(소요 시간)
+    """
+    started = time.perf_counter()
+    deactivated = cleanup_expired_sessions(batch_size)
+    purged = purge_inactive_sessions(retention_days, batch_size)
+
+    return {
+        "deactivated": deactivated,
+        "purged": purged,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
 def debug_session_info():
     """현재 세션 상태 디버깅 정보 출력"""
     try:
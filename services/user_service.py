@@ -1,5 +1,6 @@
 from models import db, User, Department, ClubMember, Club, ClubCategory, Role
 from models import Application, ApplicationAnswer, ClubApplicationQuestion
+from services.club_service import get_club_recruitment_status
 
 
 def get_user_profile(user_id):
@@ -63,7 +64,7 @@ def get_user_clubs(user_id):
                     "name": club.name,
                     "activity_summary": club.activity_summary,
                     "category": {"id": category.id, "name": category.name},
-                    "recruitment_status": club.recruitment_status,
+                    "recruitment_status": get_club_recruitment_status(club),
                     "current_generation": club.current_generation,
                     "president_name": club.president_name,
                     "contact": club.contact,
@@ -0,0 +1,48 @@
+"""
+공용 테스트 픽스처
+"""
+
+import pytest
+from flask import Flask
+from sqlalchemy import BigInteger, event
+from sqlalchemy.ext.compiler import compiles
+
+from models import db
+
+
+@compiles(BigInteger, "sqlite")
+def _compile_big_integer_sqlite(type_, compiler, **kw):
+    # sqlite는 INTEGER PRIMARY KEY만 자동 증가하므로 BigInteger를 INTEGER로 생성
+    return "INTEGER"
+
+
+@pytest.fixture
+def app():
+    """
+    인메모리 SQLite를 사용하는 테스트용 Flask 앱
+
+    테스트 모듈에서 같은 이름의 픽스처로 감싸 데이터와 설정을 추가합니다.
+    """
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    app.config["TESTING"] = True
+    db.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def query_log(app):
+    """실행된 SQL 문 기록"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
@@ -0,0 +1,115 @@
+"""
+캐시 백엔드 및 워커 간 무효화 전파 테스트
+"""
+
+import time
+
+from utils.cache import CacheManager, MemoryBackend, SQLiteBackend
+
+
+class TestMemoryBackend:
+    """메모리 캐시 TTL/LRU 테스트"""
+
+    def test_lru_eviction(self):
+        cache = MemoryBackend(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # a를 최근 사용으로 갱신
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_ttl_expiry(self):
+        cache = MemoryBackend()
+        cache.set("a", 1, ttl=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+
+    def test_counter_survives_lru_eviction(self):
+        cache = MemoryBackend(max_entries=1)
+        cache.incr("version")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.clear()
+
+        assert cache.get_counter("version") == 1
+
+
+class TestSharedCache:
+    """SQLite 공유 백엔드 테스트 (워커 2개를 CacheManager 2개로 흉내)"""
+
+    def make_worker(self, path):
+        manager = CacheManager()
+        manager.configure(backend="sqlite", path=path, sync_interval=0)
+        return manager
+
+    def test_value_shared_between_workers(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        worker_a = self.make_worker(path)
+        worker_b = self.make_worker(path)
+
+        worker_a.region("permission.user_roles").set("user_roles_1", {"STUDENT"})
+
+        assert worker_b.region("permission.user_roles").get("user_roles_1") == {
+            "STUDENT"
+        }
+
+    def test_invalidation_propagates(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        worker_a = self.make_worker(path)
+        worker_b = self.make_worker(path)
+        region_a = worker_a.region("permission.user_roles")
+        region_b = worker_b.region("permission.user_roles")
+
+        region_a.set("user_roles_1", {"STUDENT"})
+        assert region_b.get("user_roles_1") == {"STUDENT"}  # B의 로컬 캐시에 적재
+
+        # A에서 권한 변경 후 캐시 무효화 -> B의 로컬 캐시에서도 제거되어야 함
+        region_a.delete("user_roles_1")
+
+        assert region_b.get("user_roles_1") is None
+
+    def test_counter_shared_between_workers(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        worker_a = self.make_worker(path)
+        worker_b = self.make_worker(path)
+
+        worker_a.region("catalog").incr("version")
+        worker_b.region("catalog").incr("version")
+
+        assert worker_a.region("catalog").get_counter("version") == 2
+
+    def test_counter_survives_lru_eviction(self, tmp_path):
+        manager = CacheManager()
+        manager.configure(
+            backend="sqlite",
+            path=str(tmp_path / "cache.sqlite3"),
+            shared_max_entries=2,
+            sync_interval=0,
+        )
+        region = manager.region("catalog")
+        region.incr("version")
+        region.incr("version")
+
+        # 항목 수 제한으로 오래된 항목이 밀려나도 카운터는 0으로 돌아가지 않음
+        for i in range(5):
+            region.set(f"entry_{i}", i)
+        region.clear()
+
+        assert region.get_counter("version") == 2
+        assert region.incr("version") == 3
+
+    def test_get_does_not_write_on_every_hit(self, tmp_path):
+        backend = SQLiteBackend(str(tmp_path / "cache.sqlite3"))
+        backend.set("a", 1)
+        conn = backend._connect()
+        writes = conn.total_changes
+
+        for _ in range(10):
+            assert backend.get("a") == 1
+
+        # 마지막 접근 시각은 ACCESS_UPDATE_INTERVAL이 지났을 때만 갱신
+        assert conn.total_changes == writes
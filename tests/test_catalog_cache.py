@@ -0,0 +1,64 @@
+"""
+동아리 카탈로그 캐시 테스트
+"""
+
+import json
+from unittest.mock import patch
+from datetime import date
+
+from utils.catalog_cache import CatalogCache
+
+
+class TestCatalogCache:
+    """버전 기반 카탈로그 캐시 테스트"""
+
+    def test_returns_cached_bytes_until_version_bump(self):
+        cache = CatalogCache()
+        calls = []
+
+        def builder():
+            calls.append(1)
+            return {"count": len(calls), "clubs": [{"name": "구름톤"}]}
+
+        first = cache.get_or_build("clubs.all", builder)
+        second = cache.get_or_build("clubs.all", builder)
+
+        assert first is second
+        assert len(calls) == 1
+        assert json.loads(first)["clubs"][0]["name"] == "구름톤"
+
+        cache.bump_version()
+        third = cache.get_or_build("clubs.all", builder)
+
+        assert len(calls) == 2
+        assert json.loads(third)["count"] == 2
+
+    def test_entry_expires_on_date_change(self):
+        cache = CatalogCache()
+        calls = []
+
+        def builder():
+            calls.append(1)
+            return []
+
+        with patch("utils.catalog_cache.get_kst_today", return_value=date(2025, 3, 1)):
+            cache.get_or_build("clubs.open", builder)
+            cache.get_or_build("clubs.open", builder)
+        with patch("utils.catalog_cache.get_kst_today", return_value=date(2025, 3, 2)):
+            cache.get_or_build("clubs.open", builder)
+
+        assert len(calls) == 2
+
+    def test_stale_build_is_not_stored(self):
+        cache = CatalogCache()
+
+        def builder():
+            # 생성 도중 다른 요청이 동아리 정보를 변경한 상황
+            cache.bump_version()
+            return []
+
+        cache.get_or_build("clubs.all", builder)
+
+        assert cache.get_or_build("clubs.all", lambda: {"fresh": True}) == (
+            b'{"fresh": true}'
+        )
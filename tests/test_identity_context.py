@@ -0,0 +1,233 @@
+"""
+요청 단위 인증 정보(identity) 조회 테스트
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from flask import g, session
+
+from models import db, ClubCategory, Club, ClubMember, Department, Role, User
+from models import UserSession
+from services.permission_service import PermissionService
+from services import session_service
+from services.session_service import (
+    create_session,
+    deactivate_session,
+    get_current_identity,
+    get_current_session,
+    get_current_user,
+)
+from utils.cache import cache_manager
+
+
+@pytest.fixture
+def app(app):
+    """사용자 1명과 학생/동아리 회장 역할을 추가한 테스트용 앱"""
+    app.config["SECRET_KEY"] = "test"
+    cache_manager.configure(backend="memory")
+
+    db.session.add_all(
+        [
+            Department(id=1, degree_course="학사", college="공대", major="컴공"),
+            ClubCategory(id=1, name="학술"),
+            Role(id=1, role_name="STUDENT"),
+            Role(id=4, role_name="CLUB_PRESIDENT"),
+        ]
+    )
+    db.session.flush()
+    db.session.add(
+        Club(id=1, name="구름", category_id=1, president_name="a", contact="b")
+    )
+    db.session.add(
+        User(
+            id=1,
+            name="홍길동",
+            email="hong@unist.ac.kr",
+            password="x",
+            student_id="20250001",
+            department_id=1,
+            phone_number="01000000000",
+        )
+    )
+    db.session.flush()
+    db.session.add_all(
+        [
+            ClubMember(
+                id=1,
+                user_id=1,
+                club_id=None,
+                role_id=1,
+                generation=1,
+                joined_at=datetime(2025, 1, 1),
+            ),
+            ClubMember(
+                id=2,
+                user_id=1,
+                club_id=1,
+                role_id=4,
+                generation=1,
+                joined_at=datetime(2025, 1, 1),
+            ),
+            UserSession(
+                session_id="sid-1",
+                user_id=1,
+                channel="WEB",
+                expires_at=datetime.now() + timedelta(days=1),
+                is_active=True,
+            ),
+        ]
+    )
+    db.session.commit()
+    return app
+
+
+def test_identity_resolved_with_single_query(app, query_log):
+    service = PermissionService()
+
+    with app.test_request_context("/"):
+        session["session_id"] = "sid-1"
+
+        result = service.check_permission("clubs.update", club_id=1)
+        session_data = get_current_session()
+        user = get_current_user()
+        identity = get_current_identity()
+
+    assert result["has_permission"] is True
+    assert session_data["user_id"] == 1
+    assert user.id == 1
+    assert identity["memberships"] == {None: {"STUDENT"}, 1: {"CLUB_PRESIDENT"}}
+    assert len(query_log) == 1
+
+
+def test_identity_without_session_cookie(app, query_log):
+    with app.test_request_context("/"):
+        assert get_current_identity() is None
+        assert get_current_user() is None
+
+    assert query_log == []
+
+
+def test_club_scoped_check_uses_cached_memberships(app, query_log):
+    service = PermissionService()
+
+    with app.test_request_context("/"):
+        first = service.check_permission("clubs.update", user_id=1, club_id=1)
+        assert len(query_log) == 1
+
+        second = service.check_permission("clubs.members", user_id=1, club_id=1)
+        assert service.get_user_global_roles(1) == {"STUDENT"}
+        assert len(query_log) == 1
+
+        service.clear_user_cache(1)
+        service.get_user_roles_in_club(1, 1)
+        assert len(query_log) == 2
+
+    assert first["has_permission"] is True
+    assert second["has_permission"] is True
+
+
+def test_batch_permission_check_resolves_roles_once(app, query_log):
+    service = PermissionService()
+
+    with app.test_request_context("/"):
+        results = service.check_permissions(
+            ["clubs.update", "admin.users_list", "reservations.list"],
+            user_id=1,
+            club_id=1,
+        )
+        assert len(query_log) == 1
+
+    assert list(results) == ["clubs.update", "admin.users_list", "reservations.list"]
+    assert results["clubs.update"]["has_permission"] is True
+    assert results["admin.users_list"]["has_permission"] is False
+    assert results["reservations.list"]["has_permission"] is True
+
+
+def test_signed_session_token_skips_session_lookup(app, query_log):
+    app.config["SESSION_TOKEN_ENABLED"] = True
+
+    with app.test_request_context("/"):
+        created = create_session(1, "APP")
+        cookie = dict(session)
+
+    # 다른 워커처럼 세션/권한 캐시가 비어 있어도 토큰만으로 세션 검증
+    session_service._session_cache.clear()
+    PermissionService().clear_all_cache()
+    query_log.clear()
+
+    with app.test_request_context("/"):
+        session.update(cookie)
+        session_data = get_current_session()
+
+    assert session_data["session_id"] == created["session_id"]
+    assert session_data["channel"] == "APP"
+    assert not any("user_sessions" in statement for statement in query_log)
+
+
+def test_signed_session_token_rejected_after_revocation(app, query_log):
+    app.config["SESSION_TOKEN_ENABLED"] = True
+
+    with app.test_request_context("/"):
+        created = create_session(1, "APP")
+        cookie = dict(session)
+
+    with app.test_request_context("/"):
+        deactivate_session(created["session_id"])
+
+    # 같은 워커: 폐기 집합으로 즉시 거절
+    with app.test_request_context("/"):
+        session.update(cookie)
+        assert get_current_user() is None
+
+    # 다른 워커: 폐기 집합에는 없지만 epoch가 바뀌었으므로 DB에서 확인 후 거절
+    session_service._revoked_sessions.clear()
+    session_service._session_cache.clear()
+    g.pop("identity", None)
+    query_log.clear()
+
+    with app.test_request_context("/"):
+        session.update(cookie)
+        assert get_current_user() is None
+
+    assert any("user_sessions" in statement for statement in query_log)
+
+
+def test_cached_session_rechecked_after_revocation_elsewhere(app, query_log):
+    with app.test_request_context("/"):
+        session["session_id"] = "sid-1"
+        assert get_current_user().id == 1
+
+    # 다른 워커에서 세션을 비활성화: 이 워커의 세션 캐시는 그대로지만 epoch가 바뀜
+    UserSession.query.filter_by(session_id="sid-1").update({"is_active": False})
+    db.session.commit()
+    session_service._revocation_cache.incr("epoch")
+    g.pop("identity", None)
+    query_log.clear()
+
+    with app.test_request_context("/"):
+        session["session_id"] = "sid-1"
+        assert get_current_user() is None
+
+    assert any("user_sessions" in statement for statement in query_log)
+
+
+def test_memory_backend_with_multiple_workers_skips_session_cache(app, query_log):
+    app.config["WEB_CONCURRENCY"] = 2
+    app.config["SESSION_TOKEN_ENABLED"] = True
+
+    with app.test_request_context("/"):
+        create_session(1, "APP")
+        cookie = dict(session)
+
+    # 워커별 epoch로는 다른 워커의 폐기를 알 수 없으므로 세션 캐시/토큰을 쓰지 않음
+    assert "session_token" not in cookie
+    query_log.clear()
+
+    for _ in range(2):
+        g.pop("identity", None)
+        with app.test_request_context("/"):
+            session.update(cookie)
+            assert get_current_user().id == 1
+
+    assert sum("user_sessions" in statement for statement in query_log) == 2
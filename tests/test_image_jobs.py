@@ -0,0 +1,326 @@
+"""
+업로드 이미지 백그라운드 변환 작업 테스트
+"""
+
+import io
+import os
+
+import pytest
+from PIL import Image
+from werkzeug.datastructures import FileStorage
+
+from models import db, Club, ClubCategory, ImageJob, StoredAsset
+from services.banner_service import create_banner
+from services.image_job_service import enqueue_image_job, process_image_job
+from utils.image_utils import _open_for_target, delete_club_image, save_club_image
+from utils.image_worker import image_worker, init_image_worker
+
+
+@pytest.fixture
+def app(app, tmp_path):
+    """동아리 1개와 임시 업로드 디렉토리를 사용하는 테스트용 앱"""
+    app.config["CLUBS_DIR"] = str(tmp_path / "clubs")
+    app.config["IMAGE_JOB_MAX_ATTEMPTS"] = 2
+
+    db.session.add(ClubCategory(id=1, name="학술"))
+    db.session.flush()
+    db.session.add(
+        Club(id=1, name="구름", category_id=1, president_name="a", contact="b")
+    )
+    db.session.commit()
+    return app
+
+
+@pytest.fixture
+def submitted(monkeypatch):
+    """워커 풀에 제출된 작업 기록 (테스트에서는 직접 실행)"""
+    calls = []
+    monkeypatch.setattr(
+        image_worker, "submit", lambda func, *args: calls.append(args) or True
+    )
+    return calls
+
+
+def _png_upload(filename="logo.png", size=(40, 30)):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (200, 30, 30)).save(buffer, "PNG")
+    buffer.seek(0)
+    return FileStorage(stream=buffer, filename=filename, content_type="image/png")
+
+
+def _upload_logo(size=(40, 30), club_id=1):
+    image_info = save_club_image(_png_upload(size=size), club_id, "logo")
+    club = db.session.get(Club, club_id)
+    club.logo_image = image_info["file_path"]
+    db.session.commit()
+    return image_info, enqueue_image_job("CLUB_LOGO", club_id, image_info)
+
+
+def _add_club(club_id):
+    db.session.add(
+        Club(
+            id=club_id,
+            name=f"동아리{club_id}",
+            category_id=1,
+            president_name="a",
+            contact="b",
+        )
+    )
+    db.session.commit()
+
+
+def test_upload_returns_pending_original_and_converts_in_background(app, submitted):
+    image_info, job = _upload_logo()
+    conversion = image_info["conversion"]
+
+    # 요청 중에는 원본만 저장하고 변환은 워커 풀에 제출
+    assert job["status"] == "PENDING"
+    assert submitted == [(job["id"],)]
+    assert image_info["file_path"].endswith(".png")
+    assert os.path.exists(conversion["source_path"])
+    assert not os.path.exists(conversion["output_path"])
+
+    assert process_image_job(job["id"]) == "DONE"
+
+    assert db.session.get(Club, 1).logo_image == conversion["output_url"]
+    assert not os.path.exists(conversion["source_path"])
+    with Image.open(conversion["output_path"]) as img:
+        assert img.format == "WEBP"
+        assert img.size == (40, 30)
+
+    # 중복 제출된 작업은 다시 처리하지 않음
+    assert process_image_job(job["id"]) is None
+
+
+def test_replaced_image_cancels_conversion(app, submitted):
+    image_info, job = _upload_logo()
+
+    # 변환 전에 다른 이미지로 교체
+    club = db.session.get(Club, 1)
+    club.logo_image = "/clubs/1/images/other.webp"
+    db.session.commit()
+
+    assert process_image_job(job["id"]) == "CANCELLED"
+    assert db.session.get(Club, 1).logo_image == "/clubs/1/images/other.webp"
+    assert not os.path.exists(image_info["conversion"]["output_path"])
+
+
+def test_failed_conversion_is_retried_then_marked_failed(app, submitted):
+    image_info, job = _upload_logo()
+    with open(image_info["conversion"]["source_path"], "wb") as f:
+        f.write(b"not an image")
+
+    assert process_image_job(job["id"]) == "PENDING"
+    assert process_image_job(job["id"]) == "FAILED"
+
+    failed_job = db.session.get(ImageJob, job["id"])
+    assert failed_job.attempts == 2
+    assert failed_job.last_error
+    # 변환에 실패해도 원본 이미지는 계속 사용
+    assert db.session.get(Club, 1).logo_image == image_info["file_path"]
+
+
+def test_conversion_records_responsive_variants(app, submitted):
+    image_info, job = _upload_logo(size=(1200, 900))
+    output_url = image_info["conversion"]["output_url"]
+
+    assert process_image_job(job["id"]) == "DONE"
+
+    variants = db.session.get(Club, 1).logo_image_variants
+    assert {name: (v["width"], v["height"]) for name, v in variants.items()} == {
+        "full": (1200, 900),
+        "medium": (960, 720),
+        "thumbnail": (320, 240),
+    }
+    # 가장 큰 변형이 기본 이미지 URL, 나머지는 같은 디렉토리의 별도 파일
+    assert variants["full"]["webp"] == output_url
+    assert variants["thumbnail"]["webp"] == output_url.replace(
+        ".webp", "_thumbnail.webp"
+    )
+    assert "avif" not in variants["full"]
+
+    images_dir = os.path.dirname(image_info["conversion"]["output_path"])
+    thumbnail_path = os.path.join(
+        images_dir, os.path.basename(variants["thumbnail"]["webp"])
+    )
+    with Image.open(thumbnail_path) as img:
+        assert img.size == (320, 240)
+
+    # 이미지 삭제가 커밋되면 변형 파일도 함께 삭제
+    delete_club_image(image_info["conversion"]["output_path"])
+    db.session.commit()
+    assert os.listdir(images_dir) == []
+
+
+def test_avif_variants_when_enabled(app, submitted):
+    Image.init()
+    if "AVIF" not in Image.SAVE:
+        pytest.skip("Pillow 빌드가 AVIF 저장을 지원하지 않음")
+    app.config["IMAGE_AVIF_ENABLED"] = True
+    app.config["IMAGE_VARIANT_SIZES"] = "thumbnail:16,full:64"
+
+    image_info, job = _upload_logo()
+    assert process_image_job(job["id"]) == "DONE"
+
+    variants = db.session.get(Club, 1).logo_image_variants
+    assert variants["thumbnail"]["avif"].endswith("_thumbnail.avif")
+    assert variants["full"]["avif"] == image_info["conversion"]["output_url"].replace(
+        ".webp", ".avif"
+    )
+
+
+def test_upload_over_pixel_limit_is_rejected_before_decoding(app, submitted):
+    app.config["IMAGE_MAX_PIXELS"] = 1000
+
+    with pytest.raises(Exception, match="해상도"):
+        save_club_image(_png_upload(size=(40, 30)), 1, "logo")
+
+    # 거부된 원본은 디스크에 남지 않음
+    store_dir = os.path.join(app.config["CLUBS_DIR"], "store")
+    assert os.listdir(store_dir) == []
+    assert StoredAsset.query.count() == 0
+    assert submitted == []
+
+
+def test_jpeg_is_decoded_at_reduced_size(app, submitted):
+    app.config["IMAGE_VARIANT_SIZES"] = "thumbnail:100,full:400"
+    buffer = io.BytesIO()
+    Image.new("RGB", (1600, 1200), (30, 120, 200)).save(buffer, "JPEG")
+    buffer.seek(0)
+    upload = FileStorage(stream=buffer, filename="logo.jpg", content_type="image/jpeg")
+    image_info = save_club_image(upload, 1, "logo")
+
+    # draft 디코딩으로 1600x1200 전체가 아닌 1/4 크기(400x300)만 디코딩
+    with Image.open(image_info["conversion"]["source_path"]) as img:
+        img.draft("RGB", (400, 300))
+        assert img.size == (400, 300)
+
+    club = db.session.get(Club, 1)
+    club.logo_image = image_info["file_path"]
+    db.session.commit()
+    job = enqueue_image_job("CLUB_LOGO", 1, image_info)
+    assert process_image_job(job["id"]) == "DONE"
+
+    variants = db.session.get(Club, 1).logo_image_variants
+    assert (variants["full"]["width"], variants["full"]["height"]) == (400, 300)
+    assert (variants["thumbnail"]["width"], variants["thumbnail"]["height"]) == (
+        100,
+        75,
+    )
+
+
+def test_identical_upload_reuses_converted_output(app, submitted):
+    _add_club(2)
+    first_info, first_job = _upload_logo()
+    assert process_image_job(first_job["id"]) == "DONE"
+    first_club = db.session.get(Club, 1)
+
+    # 같은 내용은 변환 작업 없이 기존 변환본과 변형을 그대로 사용
+    second_info, second_job = _upload_logo(club_id=2)
+    assert second_info["conversion"] is None
+    assert second_job == {"id": None, "status": "DONE"}
+    assert second_info["file_path"] == first_club.logo_image
+    assert second_info["image_variants"] == first_club.logo_image_variants
+    assert ImageJob.query.count() == 1
+    assert StoredAsset.query.one().ref_count == 2
+
+    # 마지막 참조 해제가 커밋될 때만 파일 삭제
+    output_path = first_info["conversion"]["output_path"]
+    delete_club_image(first_club.logo_image.lstrip("/"))
+    db.session.commit()
+    assert os.path.exists(output_path)
+    assert StoredAsset.query.one().ref_count == 1
+
+    delete_club_image(second_info["file_path"].lstrip("/"))
+    assert os.path.exists(output_path)
+    db.session.commit()
+    assert not os.path.exists(output_path)
+    assert os.listdir(os.path.dirname(output_path)) == []
+    assert StoredAsset.query.count() == 0
+
+
+def test_identical_upload_during_conversion_shares_source(app, submitted):
+    _add_club(2)
+    first_info, first_job = _upload_logo()
+    second_info, second_job = _upload_logo(club_id=2)
+
+    # 변환 전에 같은 내용이 올라오면 같은 원본을 가리키고 각자 작업을 등록
+    assert second_info["file_path"] == first_info["file_path"]
+    source_path = first_info["conversion"]["source_path"]
+
+    # 같은 원본을 기다리는 작업이 남아 있으면 원본을 지우지 않음
+    assert process_image_job(first_job["id"]) == "DONE"
+    assert os.path.exists(source_path)
+
+    assert process_image_job(second_job["id"]) == "DONE"
+    assert not os.path.exists(source_path)
+    output_url = first_info["conversion"]["output_url"]
+    assert db.session.get(Club, 1).logo_image == output_url
+    assert db.session.get(Club, 2).logo_image == output_url
+
+
+def test_failed_save_releases_reference_and_removes_new_source(app, submitted):
+    image_info = save_club_image(_png_upload(), 1, "logo")
+    assert os.path.exists(image_info["conversion"]["source_path"])
+
+    # 이미지를 가리키는 행을 저장하지 못하고 롤백하면 참조 수 증가와 원본 모두 취소
+    db.session.rollback()
+
+    assert StoredAsset.query.count() == 0
+    assert not os.path.exists(image_info["conversion"]["source_path"])
+
+
+def test_invalid_banner_input_does_not_touch_store(app, submitted):
+    app.config["BANNERS_DIR"] = app.config["CLUBS_DIR"].replace("clubs", "banners")
+    banner_data = {"start_date": "2025-13-01", "end_date": "2025-03-31", "title": "t"}
+
+    with pytest.raises(Exception, match="배너 생성 중 오류"):
+        create_banner(1, 1, banner_data, _png_upload())
+
+    assert StoredAsset.query.count() == 0
+    assert not os.path.exists(app.config["BANNERS_DIR"])
+
+
+def test_rereferenced_content_is_kept_after_last_release(app, submitted):
+    image_info, job = _upload_logo()
+    assert process_image_job(job["id"]) == "DONE"
+    output_path = image_info["conversion"]["output_path"]
+
+    # 마지막 참조 해제와 같은 내용의 재업로드가 한 트랜잭션에서 일어나면 파일을 지우지 않음
+    delete_club_image(output_path)
+    reuploaded = save_club_image(_png_upload(), 1, "logo")
+    db.session.commit()
+
+    assert StoredAsset.query.one().ref_count == 1
+    assert os.path.exists(output_path)
+    assert os.path.exists(reuploaded["conversion"]["source_path"])
+
+
+def test_converted_file_name_changes_with_variant_settings(app, submitted):
+    first = save_club_image(_png_upload(), 1, "logo")
+    db.session.rollback()
+
+    # 변환 설정이 바뀌면 같은 내용이라도 변환본 URL이 달라져 immutable 캐시와 섞이지 않음
+    app.config["IMAGE_WEBP_QUALITY"] = 60
+    second = save_club_image(_png_upload(), 1, "logo")
+
+    assert first["file_path"] == second["file_path"]
+    assert first["optimized_path"] != second["optimized_path"]
+    assert os.path.basename(second["optimized_path"]).startswith(
+        os.path.basename(second["file_path"]).split(".")[0] + "_"
+    )
+
+
+def test_pixel_limit_is_checked_at_decode_without_changing_pillow_global(
+    app, submitted
+):
+    pillow_limit = Image.MAX_IMAGE_PIXELS
+    app.config["IMAGE_MAX_PIXELS"] = 1000
+    init_image_worker(app)
+    assert Image.MAX_IMAGE_PIXELS == pillow_limit
+
+    image_info = save_club_image(_png_upload(size=(20, 20)), 1, "logo")
+    # 업로드 후 제한이 낮아져도 변환 시 디코딩 전에 다시 확인
+    app.config["IMAGE_MAX_PIXELS"] = 100
+    with pytest.raises(ValueError, match="해상도"):
+        _open_for_target(image_info["conversion"]["source_path"], 64)
@@ -0,0 +1,77 @@
+"""
+공지 목록 조회 쿼리 수 테스트
+"""
+
+import pytest
+
+from models import db, Club, ClubCategory, Notice, NoticeAsset
+from services.notice_service import get_all_notices, get_club_notices
+
+
+@pytest.fixture
+def app(app):
+    """동아리 1개를 추가한 테스트용 앱"""
+    db.session.add(ClubCategory(id=1, name="학술"))
+    db.session.flush()
+    db.session.add(
+        Club(id=1, name="구름", category_id=1, president_name="a", contact="b")
+    )
+    db.session.commit()
+    return app
+
+
+def _add_notices(count):
+    """공지마다 이미지/파일 첨부 2개씩 생성"""
+    for _ in range(count):
+        notice = Notice(club_id=1, user_id=1, title="공지", content="내용")
+        db.session.add(notice)
+        db.session.flush()
+        db.session.add_all(
+            [
+                NoticeAsset(
+                    notices_id=notice.id,
+                    asset_type="IMAGE",
+                    file_url=f"/notices/{notice.id}/a.webp",
+                ),
+                NoticeAsset(
+                    notices_id=notice.id,
+                    asset_type="FILE",
+                    file_url=f"/notices/{notice.id}/b.pdf",
+                    original_filename="b.pdf",
+                ),
+            ]
+        )
+    db.session.commit()
+    db.session.expunge_all()
+
+
+def _count_queries(query_log, listing):
+    query_log.clear()
+    result = listing()
+    return len(query_log), result
+
+
+@pytest.mark.parametrize(
+    "listing", [lambda: get_club_notices(1), get_all_notices], ids=["club", "all"]
+)
+def test_notice_listing_uses_constant_number_of_queries(app, query_log, listing):
+    _add_notices(2)
+    few_queries, few = _count_queries(query_log, listing)
+    db.session.expunge_all()
+
+    _add_notices(48)
+    many_queries, many = _count_queries(query_log, listing)
+
+    assert len(few) == 2
+    assert len(many) == 50
+    assert few_queries == many_queries
+    # 첨부파일은 공지별 쿼리 대신 IN 쿼리 한 번으로 조회
+    asset_queries = [s for s in query_log if "FROM notice_assets" in s]
+    assert len(asset_queries) == 1
+
+    for notice in many:
+        assert [a["asset_type"] for a in notice["attachments"]] == ["IMAGE", "FILE"]
+        assert all(
+            a["file_url"].startswith(f"/notices/{notice['id']}/")
+            for a in notice["attachments"]
+        )
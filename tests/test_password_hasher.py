@@ -0,0 +1,115 @@
+"""
+비밀번호 해시 워커 풀 테스트
+"""
+
+import threading
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+from models import db, Department, User
+from services.auth_service import authenticate_user
+from utils.password_hasher import (
+    PasswordHashBusyError,
+    PasswordHasher,
+    password_hasher,
+)
+
+FAST_METHOD = "pbkdf2:sha256:1000"
+
+
+def test_hash_and_verify():
+    hasher = PasswordHasher(max_workers=1, max_queue=1, method=FAST_METHOD)
+
+    pwhash = hasher.hash("secret123!")
+
+    assert pwhash.startswith(FAST_METHOD + "$")
+    assert hasher.verify(pwhash, "secret123!") is True
+    assert hasher.verify(pwhash, "wrong") is False
+    assert hasher.needs_rehash(pwhash) is False
+    assert hasher.needs_rehash(generate_password_hash("x", method="pbkdf2:sha256:2000"))
+
+    metrics = hasher.metrics()
+    assert metrics["completed"] == 3
+    assert metrics["queued"] == 0
+
+
+@pytest.mark.parametrize("method", ["scrypt", "pbkdf2", "pbkdf2:sha256"])
+def test_shorthand_method_does_not_rehash_every_login(method):
+    hasher = PasswordHasher(max_workers=1, max_queue=1, method=method)
+
+    pwhash = hasher.hash("secret123!")
+
+    # 저장된 접두어("scrypt:32768:8:1" 등)가 설정 값과 달라도 같은 방식이면 재해시하지 않음
+    assert hasher.needs_rehash(pwhash) is False
+    assert hasher.needs_rehash(generate_password_hash("x", method=FAST_METHOD))
+
+
+@pytest.mark.parametrize(
+    "method", ["scrypt", "scrypt:16384:8:1", "pbkdf2", "pbkdf2:sha512", FAST_METHOD]
+)
+def test_configure_does_not_compute_a_hash(method, monkeypatch):
+    from utils import password_hasher as module
+
+    expected = generate_password_hash("", method=method).split("$", 1)[0]
+    monkeypatch.setattr(module, "generate_password_hash", pytest.fail, raising=True)
+
+    # 앱 시작 시(모듈 임포트, init_password_hasher) 해시를 계산하지 않고 접두어를 구함
+    hasher = PasswordHasher(max_workers=1, max_queue=1, method=method)
+
+    assert hasher.method_prefix == expected
+
+
+def test_rejects_when_queue_is_full():
+    hasher = PasswordHasher(max_workers=1, max_queue=0, method=FAST_METHOD)
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking_hash():
+        started.set()
+        release.wait(5)
+
+    worker = threading.Thread(target=hasher._run, args=(blocking_hash,))
+    worker.start()
+    started.wait(5)
+
+    with pytest.raises(PasswordHashBusyError):
+        hasher.hash("secret123!")
+
+    release.set()
+    worker.join(5)
+    assert hasher.metrics()["rejected"] == 1
+
+
+@pytest.fixture
+def app(app):
+    """이전 해시 방식으로 저장된 사용자 1명을 추가한 테스트용 앱"""
+    password_hasher.configure(method=FAST_METHOD)
+
+    db.session.add(Department(id=1, degree_course="학사", college="공대", major="컴공"))
+    db.session.flush()
+    db.session.add(
+        User(
+            id=1,
+            name="홍길동",
+            email="hong@unist.ac.kr",
+            password=generate_password_hash("secret123!", method="pbkdf2:sha256:2000"),
+            student_id="20250001",
+            department_id=1,
+            phone_number="01000000000",
+        )
+    )
+    db.session.commit()
+    return app
+
+
+def test_rehash_on_login_when_method_changes(app):
+    result = authenticate_user("hong@unist.ac.kr", "secret123!")
+
+    assert result["user_id"] == 1
+    user = db.session.get(User, 1)
+    assert user.password.startswith(FAST_METHOD + "$")
+    assert password_hasher.verify(user.password, "secret123!")
+
+    with pytest.raises(ValueError):
+        authenticate_user("hong@unist.ac.kr", "wrong")
@@ -51,6 +51,26 @@ class TestPermissionPolicy:
         policy = get_permission_policy("nonexistent.permission")
         assert policy is None
 
+    def test_compiled_permission_policy(self):
+        """컴파일된 권한 비트마스크 테스트"""
+        from config.permission_policy import (
+            PERMISSION_POLICY,
+            get_compiled_permission,
+            mask_to_roles,
+            roles_to_mask,
+        )
+
+        for permission_key, policy in PERMISSION_POLICY.items():
+            mask, allowed_roles = get_compiled_permission(permission_key)
+            assert mask_to_roles(mask) == policy["allowed_roles"]
+            assert allowed_roles == policy["allowed_roles"]
+
+        # 정책이 없는 권한은 기본 STUDENT 권한
+        mask, allowed_roles = get_compiled_permission("nonexistent.permission")
+        assert allowed_roles == {"STUDENT"}
+        assert mask & roles_to_mask({"STUDENT"})
+        assert not mask & roles_to_mask({"CLUB_MEMBER"})
+
     def test_role_hierarchy(self):
         """역할 계층 테스트"""
         assert ROLE_HIERARCHY["STUDENT"] == 1
@@ -0,0 +1,138 @@
+"""
+모집 상태 전이/조회 오버레이 테스트
+"""
+
+from datetime import date, datetime
+
+import pytest
+
+from models import db, Club, ClubCategory
+from services.club_service import (
+    apply_recruitment_transitions,
+    get_effective_recruitment_status,
+)
+
+TODAY = date(2025, 3, 2)
+
+
+@pytest.fixture
+def app(app):
+    """동아리 분류 1개를 추가한 테스트용 앱"""
+    db.session.add(ClubCategory(id=1, name="학술"))
+    db.session.commit()
+    return app
+
+
+def add_club(name, status, start, finish, updated_at):
+    club = Club(
+        name=name,
+        category_id=1,
+        president_name="회장",
+        contact="010-0000-0000",
+        recruitment_status=status,
+        recruitment_start=start,
+        recruitment_finish=finish,
+        updated_at=updated_at,
+    )
+    db.session.add(club)
+    db.session.commit()
+    return club
+
+
+class TestEffectiveRecruitmentStatus:
+    """조회 시점 모집 상태 계산 테스트"""
+
+    def test_open_outside_period_is_closed(self):
+        assert (
+            get_effective_recruitment_status(
+                "OPEN", date(2025, 2, 1), date(2025, 3, 1), today=TODAY
+            )
+            == "CLOSED"
+        )
+        assert (
+            get_effective_recruitment_status("OPEN", None, None, today=TODAY)
+            == "CLOSED"
+        )
+
+    def test_closed_on_start_day_is_open(self):
+        assert (
+            get_effective_recruitment_status(
+                "CLOSED",
+                TODAY,
+                date(2025, 3, 10),
+                updated_at=datetime(2025, 3, 2, 9, 0),
+                today=TODAY,
+            )
+            == "OPEN"
+        )
+
+    def test_manual_close_after_start_is_respected(self):
+        assert (
+            get_effective_recruitment_status(
+                "CLOSED",
+                date(2025, 3, 1),
+                date(2025, 3, 10),
+                updated_at=datetime(2025, 3, 1, 15, 0),
+                today=TODAY,
+            )
+            == "CLOSED"
+        )
+
+    def test_missed_transition_is_open(self):
+        assert (
+            get_effective_recruitment_status(
+                "CLOSED",
+                date(2025, 3, 1),
+                date(2025, 3, 10),
+                updated_at=datetime(2025, 2, 20, 12, 0),
+                today=TODAY,
+            )
+            == "OPEN"
+        )
+
+
+class TestRecruitmentTransitions:
+    """스케줄러 상태 전이 엔진 테스트"""
+
+    def test_transitions_match_overlay(self, app):
+        clubs = [
+            add_club(
+                "만료",
+                "OPEN",
+                date(2025, 2, 1),
+                date(2025, 3, 1),
+                datetime(2025, 2, 1),
+            ),
+            add_club(
+                "시작",
+                "CLOSED",
+                TODAY,
+                date(2025, 3, 10),
+                datetime(2025, 2, 1),
+            ),
+            add_club(
+                "수동마감",
+                "CLOSED",
+                date(2025, 3, 1),
+                date(2025, 3, 10),
+                datetime(2025, 3, 1, 15, 0),
+            ),
+            add_club("기간없음", "OPEN", None, None, datetime(2025, 2, 1)),
+        ]
+        expected = {
+            club.id: get_effective_recruitment_status(
+                club.recruitment_status,
+                club.recruitment_start,
+                club.recruitment_finish,
+                club.updated_at,
+                today=TODAY,
+            )
+            for club in clubs
+        }
+
+        result = apply_recruitment_transitions(TODAY)
+        assert result == {"opened": 1, "closed": 2}
+
+        db.session.expire_all()
+        for club in Club.query.all():
+            assert club.recruitment_status == expected[club.id]
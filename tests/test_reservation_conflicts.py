@@ -0,0 +1,417 @@
+"""
+예약 충돌/일일 사용 시간 검사 및 예약 목록 조회 테스트
+"""
+
+from datetime import time
+
+import pytest
+
+from models import db, Club, ClubCategory, Department, Room, RoomDay, User
+from services.reservation_service import ReservationService
+from utils.reservation_slots import interval_mask, slot_count, time_to_slot
+
+
+@pytest.fixture
+def app(app):
+    """동아리 2개, 공간 2개, 사용자 1명을 추가한 테스트용 앱"""
+    db.session.add_all(
+        [
+            Department(id=1, degree_course="학사", college="공대", major="컴공"),
+            ClubCategory(id=1, name="학술"),
+            Room(id=1, name="동아리방 A"),
+            Room(id=2, name="동아리방 B"),
+        ]
+    )
+    db.session.flush()
+    db.session.add_all(
+        [
+            Club(id=1, name="구름", category_id=1, president_name="a", contact="b"),
+            Club(id=2, name="바람", category_id=1, president_name="c", contact="d"),
+            User(
+                id=1,
+                name="홍길동",
+                email="hong@unist.ac.kr",
+                password="x",
+                student_id="20250001",
+                department_id=1,
+                phone_number="01000000000",
+            ),
+        ]
+    )
+    db.session.commit()
+    return app
+
+
+def _reserve(club_id, room_id, start, end):
+    return ReservationService.create_reservation(
+        club_id, 1, room_id, "2025-03-02", start, end
+    )
+
+
+def test_interval_mask():
+    assert time_to_slot(time(9, 30)) == 19
+    assert slot_count(interval_mask(time(9, 0), time(10, 30))) == 3
+    assert (
+        interval_mask(time(9, 0), time(10, 0)) & interval_mask(time(10, 0), time(11, 0))
+        == 0
+    )
+    with pytest.raises(ValueError):
+        time_to_slot(time(9, 15))
+
+
+def test_overlapping_reservation_rejected(app):
+    _reserve(1, 1, "10:00", "12:00")
+
+    with pytest.raises(ValueError, match="이미 예약"):
+        _reserve(2, 1, "11:30", "13:00")
+
+    # 경계가 맞닿는 예약과 다른 공간의 예약은 허용
+    _reserve(2, 1, "12:00", "13:00")
+    _reserve(2, 2, "11:00", "12:00")
+
+    assert RoomDay.query.count() == 2
+
+
+def test_daily_usage_limit_across_rooms(app):
+    _reserve(1, 1, "09:00", "13:00")
+
+    with pytest.raises(ValueError, match="일일 최대 사용 시간"):
+        _reserve(1, 2, "14:00", "16:30")
+
+    result = _reserve(1, 2, "14:00", "16:00")
+    assert result["duration_hours"] == 2.0
+
+
+def test_batch_booking_is_all_or_nothing(app):
+    from models import Reservation
+
+    slots = [
+        {
+            "room_id": 1,
+            "date": "2025-03-02",
+            "start_time": "09:00",
+            "end_time": "10:00",
+        },
+        {
+            "room_id": 2,
+            "date": "2025-03-03",
+            "start_time": "09:00",
+            "end_time": "10:00",
+        },
+        # 요청 슬롯끼리 겹침
+        {
+            "room_id": 1,
+            "date": "2025-03-02",
+            "start_time": "09:30",
+            "end_time": "11:00",
+        },
+    ]
+    with pytest.raises(ValueError, match="이미 예약"):
+        ReservationService.create_reservations_with_slots(1, 1, slots)
+    assert Reservation.query.count() == 0
+
+    result = ReservationService.create_reservations_with_slots(1, 1, slots[:2])
+    assert [r["room"]["id"] for r in result] == [1, 2]
+    assert Reservation.query.count() == 2
+
+    # 형식이 잘못된 슬롯이 있으면 DB 조회 전에 거절
+    with pytest.raises(ValueError, match="30분 단위"):
+        ReservationService.create_reservations_with_slots(
+            1,
+            1,
+            [
+                {
+                    "room_id": 1,
+                    "date": "2025-03-04",
+                    "start_time": "09:10",
+                    "end_time": "10:00",
+                }
+            ],
+        )
+
+
+def test_multi_room_availability_grid(app, query_log):
+    from services.room_service import RoomService
+
+    room = db.session.get(Room, 2)
+    room.open_time = time(10, 0)
+    room.close_time = time(12, 0)
+    db.session.commit()
+    _reserve(1, 1, "09:00", "10:30")
+    _reserve(2, 2, "11:00", "11:30")
+    query_log.clear()
+
+    result = RoomService.get_rooms_availability("2025-03-02", "2025-03-03")
+
+    # 공간 목록 + 기간 내 예약 범위 쿼리
+    assert len(query_log) == 2
+    room_a, room_b = result["rooms"]
+    assert room_a["days"][0]["booked_slots"] == [
+        {"start_time": "09:00", "end_time": "10:30"}
+    ]
+    assert room_a["days"][0]["available_slots"] == [
+        {"start_time": "10:30", "end_time": "22:00"}
+    ]
+    assert room_a["days"][1]["available_slots"] == [
+        {"start_time": "09:00", "end_time": "22:00"}
+    ]
+    assert room_b["days"][0]["available_slots"] == [
+        {"start_time": "10:00", "end_time": "11:00"},
+        {"start_time": "11:30", "end_time": "12:00"},
+    ]
+
+    single = RoomService.get_room_availability(1, "2025-03-02")
+    assert single["available_slots"][0] == {"start_time": "11:00", "end_time": "12:00"}
+    assert single["booked_slots"][0]["club_name"] == "구름"
+
+
+def test_room_operating_hours_until_end_of_day(app):
+    from services.room_service import RoomService
+
+    room = db.session.get(Room, 2)
+    # 30분 단위가 아닌 운영 시간은 저장 전에 거절
+    with pytest.raises(ValueError, match="30분 단위"):
+        room.open_time = time(9, 15)
+
+    room.open_time = time(22, 0)
+    room.close_time = time(0, 0)
+    db.session.commit()
+    _reserve(2, 2, "22:00", "23:00")
+
+    result = RoomService.get_rooms_availability("2025-03-02", "2025-03-02")
+    room_b = result["rooms"][1]
+    assert room_b["close_time"] == "24:00"
+    assert room_b["days"][0]["available_slots"] == [
+        {"start_time": "23:00", "end_time": "24:00"}
+    ]
+
+    # 검증을 거치지 않고 저장된 값은 운영 시간 안쪽 30분 단위로 맞춰 계산
+    Room.query.filter_by(id=2).update(
+        {"open_time": time(22, 10), "close_time": time(23, 50)}
+    )
+    db.session.commit()
+    db.session.expire_all()
+    expected = [{"start_time": "22:30", "end_time": "23:30"}]
+    single = RoomService.get_room_availability(2, "2025-03-03")
+    assert single["available_slots"] == expected
+    result = RoomService.get_rooms_availability("2025-03-03", "2025-03-03")
+    assert result["rooms"][1]["days"][0]["available_slots"] == expected
+
+
+def test_club_usage_counters_follow_create_and_cancel(app, query_log):
+    from datetime import date
+
+    from models import ClubDailyUsage, Reservation
+    from services.club_room_service import ClubRoomService
+
+    first = _reserve(1, 1, "09:00", "11:00")
+    _reserve(1, 2, "13:00", "14:30")
+    usage = db.session.get(ClubDailyUsage, (1, date(2025, 3, 2)))
+    assert usage.used_slots == 7
+
+    ReservationService.cancel_reservation(first["id"], 1)
+    assert db.session.get(ClubDailyUsage, (1, date(2025, 3, 2))).used_slots == 3
+
+    query_log.clear()
+    result = ClubRoomService.get_club_remaining_usage(1, "2025-02-28")
+    assert result["daily"]["used_hours"] == 0
+    assert result["weekly"]["used_hours"] == 1.5
+    assert result["weekly"]["remaining_hours"] == 18.5
+    assert len(result["weekly"]["reservations"]) == 1
+
+    # 집계가 어긋난 경우 재검증 작업이 예약 기준으로 수정
+    usage = db.session.get(ClubDailyUsage, (1, date(2025, 3, 2)))
+    usage.used_slots = 0
+    db.session.commit()
+    assert ReservationService.reconcile_club_usage(date(2025, 3, 1)) == {
+        "checked": 1,
+        "corrected": 1,
+    }
+    assert db.session.get(ClubDailyUsage, (1, date(2025, 3, 2))).used_slots == 3
+    assert Reservation.query.count() == 2
+
+
+def test_usage_totals_come_from_aggregate_backfilled_by_reconcile(app):
+    from datetime import date
+
+    from models import ClubDailyUsage, Reservation
+    from services.club_room_service import ClubRoomService
+
+    # 집계 테이블 도입 전에 생성되어 집계 행이 없는 예약
+    db.session.add(
+        Reservation(
+            club_id=1,
+            user_id=1,
+            room_id=1,
+            date=date(2025, 3, 2),
+            start_time=time(9),
+            end_time=time(14),
+            status="CONFIRMED",
+        )
+    )
+    db.session.commit()
+    assert ClubDailyUsage.query.count() == 0
+
+    # 사용 시간 합계는 집계만 조회하고, 예약은 상세 목록에만 사용
+    result = ClubRoomService.get_club_remaining_usage(1, "2025-03-02")
+    assert result["daily"]["used_hours"] == 0
+    assert len(result["daily"]["reservations"]) == 1
+
+    # 사용량 재검증 작업이 집계 행이 없는 날짜의 집계를 예약 기준으로 생성
+    ReservationService.reconcile_club_usage(date(2025, 3, 1))
+    result = ClubRoomService.get_club_remaining_usage(1, "2025-03-02")
+    assert result["daily"]["used_hours"] == 5
+    assert result["weekly"]["used_hours"] == 5
+
+    # 예약 시 집계 행이 없으면 기존 예약으로 초기화한 뒤 제한을 검사
+    with pytest.raises(ValueError, match="일일 최대 사용 시간"):
+        _reserve(1, 2, "15:00", "17:00")
+
+
+def test_recurring_reservations_dry_run_and_conflict_report(app, query_log):
+    from models import Reservation
+
+    # 다른 동아리가 3/10 같은 시간대를 먼저 예약
+    ReservationService.create_reservation(2, 1, 1, "2025-03-10", "18:00", "20:00")
+
+    rule = dict(
+        club_id=1,
+        user_id=1,
+        room_id=1,
+        start_date="2025-03-01",
+        end_date="2025-03-31",
+        weekdays=["MON"],
+        start_time="18:00",
+        end_time="20:00",
+        exceptions=["2025-03-17"],
+    )
+
+    preview = ReservationService.create_recurring_reservations(**rule, dry_run=True)
+    assert [o["date"] for o in preview["occurrences"]] == [
+        "2025-03-03",
+        "2025-03-10",
+        "2025-03-24",
+        "2025-03-31",
+    ]
+    assert [o["result"] for o in preview["occurrences"]] == [
+        "AVAILABLE",
+        "CONFLICT",
+        "AVAILABLE",
+        "AVAILABLE",
+    ]
+    assert preview["summary"] == {
+        "total": 4,
+        "created": 0,
+        "available": 3,
+        "conflicts": 1,
+    }
+    assert Reservation.query.count() == 1
+
+    query_log.clear()
+    result = ReservationService.create_recurring_reservations(**rule)
+    assert result["summary"]["created"] == 3
+    assert all(
+        o.get("reservation_id")
+        for o in result["occurrences"]
+        if o["result"] == "CREATED"
+    )
+    assert Reservation.query.filter_by(club_id=1).count() == 3
+    # 예약 현황은 날짜 수와 관계없이 한 번에 조회
+    occupancy_queries = [s for s in query_log if "reservations.status IN" in s]
+    assert len(occupancy_queries) == 1
+    # 예약은 한 번의 다중 행 INSERT로 저장하고 커밋 후 행마다 다시 조회하지 않음
+    inserts = [s for s in query_log if s.startswith("INSERT INTO reservations")]
+    assert len(inserts) == 1
+    assert not any("WHERE reservations.id =" in s for s in query_log)
+
+
+def test_recurring_rule_validation(app):
+    with pytest.raises(ValueError):
+        ReservationService.create_recurring_reservations(
+            1, 1, 1, "2025-03-01", "2025-03-31", ["XYZ"], "18:00", "20:00"
+        )
+    with pytest.raises(ValueError):
+        ReservationService.create_recurring_reservations(
+            1, 1, 1, "2025-01-01", "2027-12-31", [0, 1, 2, 3, 4], "18:00", "20:00"
+        )
+    # bool은 정수로 취급하지 않음
+    with pytest.raises(ValueError, match="interval_weeks"):
+        ReservationService.create_recurring_reservations(
+            1, 1, 1, "2025-03-01", "2025-03-31", ["MON"], "18:00", "20:00", True
+        )
+    with pytest.raises(ValueError, match="요일"):
+        ReservationService.create_recurring_reservations(
+            1, 1, 1, "2025-03-01", "2025-03-31", [True], "18:00", "20:00"
+        )
+    with pytest.raises(ValueError, match="room_id"):
+        ReservationService.create_recurring_reservations(
+            1, 1, "abc", "2025-03-01", "2025-03-31", ["MON"], "18:00", "20:00"
+        )
+    with pytest.raises(ValueError, match="슬롯"):
+        ReservationService.create_reservations_with_slots(1, 1, [])
+
+
+def test_recurring_room_id_given_as_string(app):
+    result = ReservationService.create_recurring_reservations(
+        1, 1, "1", "2025-03-01", "2025-03-10", ["MON"], "18:00", "20:00", dry_run=True
+    )
+
+    assert result["room"]["id"] == 1
+    assert result["summary"]["available"] == 2
+
+
+def test_reservation_listing_keyset_pagination(app, query_log):
+    for day, start, end in [
+        ("2025-03-01", "10:00", "11:00"),
+        ("2025-03-02", "09:00", "10:00"),
+        ("2025-03-02", "13:00", "14:00"),
+        ("2025-03-03", "10:00", "11:00"),
+        ("2025-03-03", "15:00", "16:00"),
+    ]:
+        ReservationService.create_reservation(1, 1, 1, day, start, end)
+    db.session.expire_all()
+
+    pages = []
+    cursor = None
+    while True:
+        query_log.clear()
+        page = ReservationService.get_user_reservations(1, cursor=cursor, limit=2)
+        # club/user/room을 JOIN으로 함께 조회하여 페이지당 한 번의 쿼리
+        assert len(query_log) == 1
+        pages.append(page["reservations"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert [len(items) for items in pages] == [2, 2, 1]
+    assert [(r["date"], r["start_time"]) for items in pages for r in items] == [
+        ("2025-03-03", "15:00"),
+        ("2025-03-03", "10:00"),
+        ("2025-03-02", "13:00"),
+        ("2025-03-02", "09:00"),
+        ("2025-03-01", "10:00"),
+    ]
+    assert pages[0][0]["user"]["name"] == "홍길동"
+
+
+def test_reservation_listing_fields_selector(app, query_log):
+    _reserve(1, 1, "10:00", "11:00")
+    db.session.expire_all()
+
+    query_log.clear()
+    page = ReservationService.get_all_reservations_integration(
+        fields=["id", "date", "room", "user.name"]
+    )
+    assert page["reservations"][0] == {
+        "id": page["reservations"][0]["id"],
+        "date": "2025-03-02",
+        "room": {"id": 1, "name": "동아리방 A", "location": None},
+        "user": {"name": "홍길동"},
+    }
+    # 선택하지 않은 관계(club)는 JOIN하지 않음
+    assert "clubs" not in query_log[0]
+
+    with pytest.raises(ValueError):
+        ReservationService.get_all_reservations_integration(fields=["user.password"])
+    with pytest.raises(ValueError):
+        ReservationService.get_user_reservations(1, cursor="not-a-cursor")
@@ -0,0 +1,129 @@
+"""
+예약/청소 현황 CSV 내보내기 테스트
+"""
+
+import csv
+import io
+from datetime import date, time
+
+import pytest
+
+from models import (
+    db,
+    CleaningPhoto,
+    Club,
+    ClubCategory,
+    Department,
+    Reservation,
+    Room,
+    User,
+)
+from services.reservation_export_service import ReservationExportService
+
+
+@pytest.fixture
+def app(app):
+    """예약 4건과 청소 사진을 추가한 테스트용 앱"""
+    db.session.add_all(
+        [
+            Department(id=1, degree_course="학사", college="공대", major="컴공"),
+            ClubCategory(id=1, name="학술"),
+            Room(id=1, name="동아리방 A"),
+        ]
+    )
+    db.session.flush()
+    db.session.add_all(
+        [
+            Club(id=1, name="구름", category_id=1, president_name="a", contact="b"),
+            User(
+                id=1,
+                name="홍길동",
+                email="hong@unist.ac.kr",
+                password="x",
+                student_id="20250001",
+                department_id=1,
+                phone_number="01000000000",
+            ),
+        ]
+    )
+    db.session.flush()
+    statuses = ["CONFIRMED", "CLEANING_DONE", "CLEANING_PHOTO_REJECT", "CONFIRMED"]
+    for index, status in enumerate(statuses, start=1):
+        db.session.add(
+            Reservation(
+                id=index,
+                club_id=1,
+                user_id=1,
+                room_id=1,
+                date=date(2025, 3, index),
+                start_time=time(10),
+                end_time=time(11, 30),
+                status=status,
+                is_photo_submitted=index in (2, 3, 4),
+                note='=HYPERLINK("x")' if index == 1 else None,
+            )
+        )
+    db.session.flush()
+    db.session.add_all(
+        [
+            CleaningPhoto(reservation_id=2, file_url="/a.jpg"),
+            CleaningPhoto(reservation_id=2, file_url="/b.jpg"),
+            CleaningPhoto(reservation_id=4, file_url="/c.jpg"),
+        ]
+    )
+    db.session.commit()
+    return app
+
+
+def _read_csv(chunks):
+    text = "".join(chunks)
+    assert text.startswith("\ufeff")
+    return list(csv.DictReader(io.StringIO(text[1:])))
+
+
+def test_export_includes_cleaning_status(app):
+    rows = _read_csv(ReservationExportService.export_reservations_csv())
+
+    assert [row["예약ID"] for row in rows] == ["1", "2", "3", "4"]
+    assert [row["청소 승인 상태"] for row in rows] == [
+        "NOT_SUBMITTED",
+        "APPROVED",
+        "REJECTED",
+        "PENDING",
+    ]
+    assert [row["청소 사진 수"] for row in rows] == ["0", "2", "0", "1"]
+    assert rows[0]["동아리"] == "구름"
+    assert rows[0]["이용 시간(시간)"] == "1.5"
+    # 수식으로 실행되지 않도록 이스케이프
+    assert rows[0]["메모"].startswith("'=")
+
+
+def test_export_streams_in_chunks(app):
+    chunks = list(
+        ReservationExportService.export_reservations_csv(
+            date_from="2025-03-02", chunk_size=2
+        )
+    )
+
+    # 헤더 + 2개씩 나눈 예약 행 조각
+    assert len(chunks) == 3
+    assert [row["날짜"] for row in _read_csv(chunks)] == [
+        "2025-03-02",
+        "2025-03-03",
+        "2025-03-04",
+    ]
+
+
+def test_export_rejects_invalid_filter_before_streaming(app):
+    with pytest.raises(ValueError):
+        ReservationExportService.export_reservations_csv(date_from="2025/03/01")
+
+
+def test_export_filename_is_built_from_validated_dates(app):
+    assert (
+        ReservationExportService.export_filename("2025-3-1", None)
+        == "reservations_2025-03-01_all.csv"
+    )
+    # 따옴표/개행이 섞인 값은 헤더에 들어가기 전에 거절
+    with pytest.raises(ValueError):
+        ReservationExportService.export_filename('2025-03-01"\r\nX-Evil: 1', None)
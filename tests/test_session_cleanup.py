@@ -0,0 +1,66 @@
+"""
+만료 세션 정리 테스트
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from models import db, Department, User, UserSession
+from services.session_service import cleanup_sessions
+from utils.time_utils import get_kst_now_naive
+
+
+@pytest.fixture
+def app(app):
+    """사용자 1명을 추가한 테스트용 앱"""
+    db.session.add(Department(id=1, degree_course="학사", college="공대", major="컴공"))
+    db.session.flush()
+    db.session.add(
+        User(
+            id=1,
+            name="홍길동",
+            email="hong@unist.ac.kr",
+            password="x",
+            student_id="20250001",
+            department_id=1,
+            phone_number="01000000000",
+        )
+    )
+    db.session.flush()
+    return app
+
+
+def _add_session(session_id, expires_at, is_active, created_at=None):
+    db.session.add(
+        UserSession(
+            session_id=session_id,
+            user_id=1,
+            channel="WEB",
+            expires_at=expires_at,
+            is_active=is_active,
+            created_at=created_at or get_kst_now_naive(),
+        )
+    )
+
+
+def test_cleanup_sessions_in_batches(app):
+    now = get_kst_now_naive()
+    for i in range(5):
+        _add_session(f"expired-{i}", now - timedelta(hours=1), True)
+    _add_session("active", now + timedelta(days=1), True)
+    _add_session("old-expired", now - timedelta(days=40), False)
+    _add_session("old-logout", now + timedelta(days=1), False, now - timedelta(days=40))
+    _add_session("recent-logout", now + timedelta(days=1), False)
+    db.session.commit()
+
+    result = cleanup_sessions(retention_days=30, batch_size=2)
+
+    assert result["deactivated"] == 5
+    assert result["purged"] == 2
+    assert result["duration_ms"] >= 0
+
+    remaining = {s.session_id: s.is_active for s in UserSession.query.all()}
+    assert remaining.pop("active") is True
+    assert remaining.pop("recent-logout") is False
+    assert remaining == {f"expired-{i}": False for i in range(5)}
@@ -0,0 +1,145 @@
+"""
+업로드 파일 서빙(ETag/304/Range/캐시 정책) 테스트
+"""
+
+import os
+
+import pytest
+from flask import Flask
+
+from utils.static_files import send_upload_file
+
+CONTENT_HASH = "ab" + "0" * 62
+
+
+@pytest.fixture
+def client(tmp_path):
+    """임시 업로드 디렉토리를 /files/로 서빙하는 테스트용 Flask 앱"""
+    upload_dir = tmp_path / "clubs"
+    (upload_dir / "store" / "ab").mkdir(parents=True)
+    (upload_dir / "store" / "ab" / f"{CONTENT_HASH}.webp").write_bytes(b"w" * 100)
+    (upload_dir / "1" / "images").mkdir(parents=True)
+    (upload_dir / "1" / "images" / "logo.webp").write_bytes(bytes(range(100)))
+    (tmp_path / "secret.txt").write_text("secret")
+
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    app.config["CLUBS_DIR"] = str(upload_dir)
+
+    @app.route("/files/<path:filename>")
+    def serve(filename):
+        return send_upload_file(str(upload_dir), filename)
+
+    with app.test_client() as client:
+        yield client
+
+
+def test_content_addressed_file_is_immutable(client):
+    response = client.get(f"/files/store/ab/{CONTENT_HASH}.webp")
+
+    assert response.status_code == 200
+    assert response.cache_control.immutable
+    assert response.cache_control.max_age == 365 * 24 * 3600
+    assert response.headers["ETag"] == f'"{CONTENT_HASH}.webp"'
+
+    revalidated = client.get(
+        f"/files/store/ab/{CONTENT_HASH}.webp",
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.data == b""
+
+
+def test_other_files_are_revalidated_with_strong_etag(client):
+    response = client.get("/files/1/images/logo.webp")
+
+    assert response.status_code == 200
+    assert response.cache_control.no_cache
+    etag = response.headers["ETag"]
+    assert not etag.startswith("W/")
+
+    revalidated = client.get(
+        "/files/1/images/logo.webp", headers={"If-None-Match": etag}
+    )
+    assert revalidated.status_code == 304
+
+
+def test_range_request_returns_partial_content(client):
+    response = client.get("/files/1/images/logo.webp", headers={"Range": "bytes=10-19"})
+
+    assert response.status_code == 206
+    assert response.headers["Content-Range"] == "bytes 10-19/100"
+    assert response.data == bytes(range(10, 20))
+
+
+def test_paths_outside_upload_dir_are_not_served(client):
+    assert client.get("/files/../secret.txt").status_code == 404
+    assert client.get("/files/1/images/missing.webp").status_code == 404
+
+
+def test_x_accel_redirect_mode_offloads_body_to_proxy(client):
+    client.application.config["FILE_SERVING_MODE"] = "x-accel-redirect"
+
+    # Range 요청도 그대로 프록시에 넘겨 프록시가 부분 응답
+    response = client.get(
+        f"/files/store/ab/{CONTENT_HASH}.webp", headers={"Range": "bytes=0-9"}
+    )
+
+    assert response.status_code == 200
+    assert (
+        response.headers["X-Accel-Redirect"]
+        == f"/_protected/clubs/store/ab/{CONTENT_HASH}.webp"
+    )
+    assert response.data == b""
+    # 캐시 정책과 ETag는 앱이 그대로 설정
+    assert response.cache_control.immutable
+    assert response.headers["ETag"] == f'"{CONTENT_HASH}.webp"'
+
+    # 304 응답에는 위임 헤더를 붙이지 않음 (프록시가 본문을 보내지 않도록)
+    revalidated = client.get(
+        f"/files/store/ab/{CONTENT_HASH}.webp",
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+    assert revalidated.status_code == 304
+    assert "X-Accel-Redirect" not in revalidated.headers
+
+
+def test_x_sendfile_mode_passes_absolute_path(client):
+    client.application.config["FILE_SERVING_MODE"] = "x-sendfile"
+
+    response = client.get("/files/1/images/logo.webp")
+
+    assert response.status_code == 200
+    assert os.path.isabs(response.headers["X-Sendfile"])
+    assert response.headers["X-Sendfile"].endswith(
+        os.path.join("1", "images", "logo.webp")
+    )
+    assert response.data == b""
+
+
+def test_download_with_unsatisfiable_range_returns_416(tmp_path, monkeypatch):
+    from flask_restx import Api
+
+    from controllers import file_download_controller
+    from routes.file_download_routes import file_download_ns
+
+    path = tmp_path / "report.pdf"
+    path.write_bytes(b"p" * 100)
+    monkeypatch.setattr(
+        file_download_controller,
+        "get_notice_asset_by_id",
+        lambda asset_id: {"file_path": str(path), "original_filename": "보고서.pdf"},
+    )
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    Api(app).add_namespace(file_download_ns, path="/api/v1")
+
+    with app.test_client() as client:
+        resumed = client.get("/api/v1/download/1", headers={"Range": "bytes=90-"})
+        response = client.get("/api/v1/download/1", headers={"Range": "bytes=500-"})
+
+    assert resumed.status_code == 206
+    assert resumed.data == b"p" * 10
+    # 컨트롤러의 except Exception에 잡혀 500이 되지 않고 416으로 응답
+    assert response.status_code == 416
+    assert response.headers["Content-Range"] == "bytes */100"
@@ -0,0 +1,166 @@
+"""
+업로드 스트리밍 저장 테스트
+"""
+
+import io
+import os
+import time
+
+import pytest
+from flask import Flask, request
+from flask.views import MethodView
+
+from utils.image_utils import save_notice_file
+from utils.upload_stream import UploadRequest, sweep_orphaned_uploads, upload_limit
+
+
+@pytest.fixture
+def app(tmp_path):
+    """업로드 임시 디렉토리와 공지 디렉토리를 임시 경로로 사용하는 테스트용 Flask 앱"""
+    app = Flask(__name__)
+    app.request_class = UploadRequest
+    app.config["TESTING"] = True
+    app.config["UPLOAD_TEMP_DIR"] = str(tmp_path / "uploads_tmp")
+    app.config["NOTICES_DIR"] = str(tmp_path / "notices")
+    app.config["NOTICE_FILE_MAX_BYTES"] = 1024 * 1024
+    app.config["IMAGE_MAX_FILE_BYTES"] = 1024 * 1024
+
+    @app.route("/upload", methods=["POST"])
+    def upload():
+        file = request.files["file"]
+        result = save_notice_file(file, 1)
+        return {**result, "stream": type(file.stream).__name__}
+
+    class NoticeFileView(MethodView):
+        @upload_limit("NOTICE_FILE_MAX_BYTES", 0)
+        def post(self):
+            return {"size": request.files["file"].stream.size_bytes}
+
+    @app.route("/image", methods=["POST"])
+    @upload_limit("IMAGE_MAX_FILE_BYTES", 0, single_file=True)
+    def upload_image():
+        return {"size": request.files["file"].stream.size_bytes}
+
+    app.add_url_rule("/notice-file", view_func=NoticeFileView.as_view("notice_file"))
+    return app
+
+
+def _post(app, content, filename="doc.pdf"):
+    return app.test_client().post(
+        "/upload",
+        data={"file": (io.BytesIO(content), filename)},
+        content_type="multipart/form-data",
+    )
+
+
+def test_upload_is_moved_from_temp_dir_without_copy(app):
+    content = os.urandom(300 * 1024)
+
+    response = _post(app, content)
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["stream"] == "HashingUploadFile"
+    assert data["file_size"] == len(content)
+
+    saved_path = os.path.join(
+        app.config["NOTICES_DIR"], "1", "files", os.path.basename(data["file_path"])
+    )
+    with open(saved_path, "rb") as f:
+        assert f.read() == content
+    # 임시 파일은 이름만 바뀌어 남지 않음
+    assert os.listdir(app.config["UPLOAD_TEMP_DIR"]) == []
+
+
+def test_oversized_upload_is_rejected_while_streaming(app):
+    response = _post(app, b"x" * (2 * 1024 * 1024))
+
+    assert response.status_code == 413
+    # 중단된 업로드의 임시 파일은 요청 종료 시 삭제
+    assert os.listdir(app.config["UPLOAD_TEMP_DIR"]) == []
+    assert not os.path.exists(os.path.join(app.config["NOTICES_DIR"], "1"))
+
+
+def test_sweep_removes_only_stale_temp_files(app):
+    temp_dir = app.config["UPLOAD_TEMP_DIR"]
+    store_dir = os.path.join(app.config["NOTICES_DIR"], "store", "ab")
+    os.makedirs(temp_dir)
+    os.makedirs(store_dir)
+
+    stale = [
+        os.path.join(temp_dir, "temp_old.part"),
+        os.path.join(store_dir, "a.webp.part"),
+    ]
+    recent = os.path.join(temp_dir, "temp_new.part")
+    kept = os.path.join(store_dir, "a.webp")
+    for path in stale + [recent, kept]:
+        open(path, "wb").close()
+    old = time.time() - 2 * 3600
+    for path in stale + [kept]:
+        os.utime(path, (old, old))
+
+    assert sweep_orphaned_uploads(app) == 2
+    assert not any(os.path.exists(path) for path in stale)
+    # 진행 중일 수 있는 최근 임시 파일과 일반 파일은 유지
+    assert os.path.exists(recent)
+    assert os.path.exists(kept)
+
+
+def test_upload_limit_is_chosen_per_endpoint(app):
+    app.config["NOTICE_FILE_MAX_BYTES"] = 3 * 1024 * 1024
+    content = b"x" * (2 * 1024 * 1024)
+
+    # 공지 첨부파일 엔드포인트는 공지 제한, 이미지 엔드포인트는 이미지 제한을 사용
+    response = app.test_client().post(
+        "/notice-file",
+        data={"file": (io.BytesIO(content), "doc.pdf")},
+        content_type="multipart/form-data",
+    )
+    assert response.status_code == 200
+    assert response.get_json()["size"] == len(content)
+
+    response = app.test_client().post(
+        "/upload",
+        data={"file": (io.BytesIO(content), "doc.pdf")},
+        content_type="multipart/form-data",
+    )
+    assert response.status_code == 413
+
+
+def test_single_file_endpoint_rejects_by_content_length(app):
+    response = app.test_client().post(
+        "/image",
+        data={"file": (io.BytesIO(b"x" * (3 * 1024 * 1024)), "a.png")},
+        content_type="multipart/form-data",
+    )
+
+    # Content-Length만으로 거절하여 본문을 임시 파일로 받지 않음
+    assert response.status_code == 413
+    assert not os.path.exists(app.config["UPLOAD_TEMP_DIR"])
+
+
+@pytest.mark.parametrize("size", [3 * 1024 * 1024, 100 * 1024])
+def test_oversized_image_through_controller_returns_413(tmp_path, size):
+    from app import create_app
+
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["UPLOAD_TEMP_DIR"] = str(tmp_path / "uploads_tmp")
+    app.config["IMAGE_MAX_FILE_BYTES"] = 10 * 1024
+
+    # Content-Length로 거절(3MB)하거나 스트리밍 중 거절(100KB)해도, 컨트롤러의
+    # except Exception에 잡혀 500이 되지 않고 413으로 응답
+    response = app.test_client().post(
+        "/api/v1/banners/",
+        data={
+            "club_id": "1",
+            "title": "t",
+            "start_date": "2025-03-01",
+            "end_date": "2025-03-31",
+            "image": (io.BytesIO(b"x" * size), "banner.png"),
+        },
+        content_type="multipart/form-data",
+    )
+
+    assert response.status_code == 413
+    assert "업로드 파일이 너무 큽니다" in response.get_json()["message"]
@@ -0,0 +1,288 @@
+"""
+내용 주소 기반 이미지 저장소
+업로드 이미지를 내용 해시(SHA-256)로 식별하여 같은 내용은 한 번만 저장/변환하고 참조 수를 관리
+(파일 저장은 utils.image_utils에서, 참조 수/변환 상태와 참조가 없어진 파일 삭제는 여기서 관리)
+"""
+
+import glob
+import logging
+import os
+import re
+from typing import Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import event, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from models import db, StoredAsset
+
+logger = logging.getLogger(__name__)
+
+# 네임스페이스별 저장 디렉토리 설정 키와 서빙 URL 경로
+STORE_NAMESPACES = {
+    "banners": ("BANNERS_DIR", "/banners"),
+    "clubs": ("CLUBS_DIR", "/clubs"),
+    "notices": ("NOTICES_DIR", "/notices"),
+    "reservations": ("RESERVATIONS_DIR", "/reservations"),
+}
+
+# 네임스페이스 디렉토리 아래 저장소 디렉토리 이름
+# (원본: "<네임스페이스>/store/<해시 앞 2자리>/<해시>.<확장자>",
+#  변환본: "<해시>_<변환 설정 지문>.webp", 크기별 변형: "<해시>_<변환 설정 지문>_<변형 이름>.webp")
+STORE_DIR_NAME = "store"
+
+_CONTENT_HASH_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+# 트랜잭션이 끝난 뒤 파일 삭제를 확인할 내용 해시 (session.info 키)
+_PENDING_REMOVALS = "asset_store.pending_removals"
+
+
+def get_store_dir(namespace: str) -> str:
+    """네임스페이스의 저장소 디렉토리 (파일 서빙과 동일한 절대 경로)"""
+    config_key, _ = STORE_NAMESPACES[namespace]
+    base_dir = current_app.config.get(config_key, namespace)
+    if not os.path.isabs(base_dir):
+        base_dir = os.path.join(current_app.root_path, base_dir)
+    return os.path.join(base_dir, STORE_DIR_NAME)
+
+
+def get_store_location(
+    namespace: str, content_hash: str, file_ext: str, suffix: Optional[str] = None
+) -> Tuple:
+    """
+    내용 해시에 해당하는 저장 위치
+
+    Args:
+        suffix: 변환본처럼 내용 해시만으로 내용이 정해지지 않는 파일의 구분자
+            ("<해시>_<suffix>.<확장자>")
+
+    Returns:
+        (파일 경로, 서빙 URL)
+    """
+    _, url_prefix = STORE_NAMESPACES[namespace]
+    stem = f"{content_hash}_{suffix}" if suffix else content_hash
+    filename = f"{stem}.{file_ext}"
+    return (
+        os.path.join(get_store_dir(namespace), content_hash[:2], filename),
+        f"{url_prefix}/{STORE_DIR_NAME}/{content_hash[:2]}/{filename}",
+    )
+
+
+def parse_content_hash(file_path: Optional[str]) -> Optional[str]:
+    """저장소 파일 경로(또는 URL)에서 내용 해시 추출 (저장소 파일이 아니면 None)"""
+    if not file_path:
+        return None
+
+    parts = file_path.replace("\\", "/").split("/")
+    if len(parts) < 3 or parts[-3] != STORE_DIR_NAME:
+        return None
+
+    # 변환본/크기별 변형("<해시>_<지문>_thumbnail.webp")도 같은 해시로 취급
+    stem = os.path.splitext(parts[-1])[0].split("_", 1)[0]
+    return stem if _CONTENT_HASH_PATTERN.match(stem) else None
+
+
+def acquire(
+    namespace: str,
+    content_hash: str,
+    size_bytes: int,
+    source_path: str,
+    source_url: str,
+    output_path: str,
+    output_url: str,
+) -> Tuple[StoredAsset, bool]:
+    """
+    내용 해시의 참조 수 증가 (처음 보는 내용이면 PENDING 항목 생성)
+
+    호출한 쪽의 트랜잭션에서 실행하고 커밋하지 않습니다. 이미지를 가리키는 행과 함께
+    커밋되고, 롤백되면 참조 수 증가도 함께 취소되며 새로 저장한 파일은 트랜잭션이
+    끝난 뒤 삭제됩니다.
+
+    Returns:
+        (저장소 항목, 새로 생성 여부)
+    """
+    # 생성/증가를 한 문장으로 처리 (같은 내용이 동시에 업로드되면 먼저 생성한 쪽의 커밋까지 대기)
+    db.session.execute(
+        _insert_or_increment(
+            {
+                "namespace": namespace,
+                "content_hash": content_hash,
+                "size_bytes": size_bytes,
+                "source_path": source_path,
+                "source_url": source_url,
+                "file_path": output_path,
+                "file_url": output_url,
+                "status": "PENDING",
+                "ref_count": 1,
+            }
+        )
+    )
+    asset = (
+        StoredAsset.query.filter_by(namespace=namespace, content_hash=content_hash)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+        .one()
+    )
+
+    # 참조 수가 0이 되면 항목을 삭제하므로 참조 수 1은 이 트랜잭션에서 생성한 항목
+    created = asset.ref_count == 1
+    if created:
+        remove_files_after_transaction(namespace, content_hash)
+    return asset, created
+
+
+def release(namespace: str, content_hash: str) -> bool:
+    """
+    내용 해시의 참조 수 감소
+
+    호출한 쪽의 트랜잭션에서 실행하고 커밋하지 않습니다. 마지막 참조가 해제되면
+    항목을 삭제하고, 파일은 트랜잭션이 커밋된 뒤 같은 내용이 다시 등록되지 않았을 때만
+    삭제합니다.
+
+    Returns:
+        마지막 참조가 해제되었거나 추적되지 않는 파일이면 True
+    """
+    updated = StoredAsset.query.filter_by(
+        namespace=namespace, content_hash=content_hash
+    ).update(
+        {StoredAsset.ref_count: StoredAsset.ref_count - 1},
+        synchronize_session=False,
+    )
+    if updated:
+        deleted = StoredAsset.query.filter(
+            StoredAsset.namespace == namespace,
+            StoredAsset.content_hash == content_hash,
+            StoredAsset.ref_count <= 0,
+        ).delete(synchronize_session=False)
+        if not deleted:
+            return False
+
+    remove_files_after_transaction(namespace, content_hash)
+    return True
+
+
+def remove_files_after_transaction(namespace: str, content_hash: str):
+    """
+    현재 트랜잭션이 끝난 뒤(커밋/롤백 모두) 저장소 항목이 없으면 내용 해시의 파일 삭제
+
+    - 마지막 참조 해제가 커밋된 경우: 원본/변환본/크기별 변형 삭제
+    - 새 항목 생성이 롤백된 경우: 새로 저장한 원본 삭제
+    - 롤백되어 참조가 남았거나 그 사이 같은 내용이 다시 등록된 경우: 삭제하지 않음
+    """
+    hash_dir = os.path.dirname(get_store_location(namespace, content_hash, "")[0])
+    db.session.info.setdefault(_PENDING_REMOVALS, set()).add(
+        (db.session.get_bind(), namespace, content_hash, hash_dir)
+    )
+
+
+def remove_unreferenced_files(bind, namespace: str, content_hash: str, hash_dir: str):
+    """
+    저장소 항목이 없을 때만 내용 해시의 파일 삭제
+
+    항목을 잠금 읽기로 확인한 트랜잭션 안에서 삭제하므로, 같은 내용을 등록 중인
+    트랜잭션이 있으면 그 트랜잭션이 끝날 때까지 기다렸다가 다시 확인합니다.
+    (MySQL에서는 없는 키의 잠금 읽기도 갭 잠금으로 같은 내용의 생성을 막음)
+
+    Returns:
+        삭제한 파일 수
+    """
+    removed = 0
+    with bind.begin() as conn:
+        referenced = conn.execute(
+            select(StoredAsset.id)
+            .where(
+                StoredAsset.namespace == namespace,
+                StoredAsset.content_hash == content_hash,
+            )
+            .with_for_update()
+        ).first()
+        if referenced is not None:
+            return removed
+
+        for path in glob.glob(os.path.join(glob.escape(hash_dir), f"{content_hash}*")):
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+    return removed
+
+
+def remove_source_if_converted(namespace: str, content_hash: str, source_path: str):
+    """
+    변환이 끝난 원본 파일 삭제 (변환 워커에서 호출)
+
+    그 사이 마지막 참조가 해제된 뒤 같은 내용이 다시 업로드되어 PENDING 항목이
+    새로 생겼으면 새 변환 작업이 원본을 사용하므로 삭제하지 않습니다.
+    """
+    status = (
+        db.session.query(StoredAsset.status)
+        .filter_by(namespace=namespace, content_hash=content_hash)
+        .with_for_update()
+        .scalar()
+    )
+    try:
+        if status != "PENDING" and os.path.exists(source_path):
+            os.remove(source_path)
+    finally:
+        db.session.commit()
+
+
+def _insert_or_increment(values: dict):
+    """저장소 항목 생성, 이미 있으면 참조 수 증가 (INSERT ... ON DUPLICATE KEY UPDATE)"""
+    increment = {"ref_count": StoredAsset.ref_count + 1}
+    if db.session.get_bind().dialect.name == "mysql":
+        return (
+            mysql_insert(StoredAsset)
+            .values(**values)
+            .on_duplicate_key_update(**increment)
+        )
+    return (
+        sqlite_insert(StoredAsset)
+        .values(**values)
+        .on_conflict_do_update(
+            index_elements=["namespace", "content_hash"], set_=increment
+        )
+    )
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _remove_files_after_transaction(session, transaction):
+    """세션의 최상위 트랜잭션이 끝나면 예약된 파일 삭제 실행"""
+    if transaction.parent is not None:
+        return
+
+    for bind, namespace, content_hash, hash_dir in session.info.pop(
+        _PENDING_REMOVALS, ()
+    ):
+        try:
+            remove_unreferenced_files(bind, namespace, content_hash, hash_dir)
+        except Exception as e:
+            logger.warning(
+                f"저장소 파일 삭제 실패: {namespace}/{content_hash[:12]} ({e})"
+            )
+
+
+def find_by_file_path(file_path: str) -> Optional[StoredAsset]:
+    """변환본 경로로 저장소 항목 조회"""
+    return (
+        StoredAsset.query.filter_by(file_path=file_path)
+        .execution_options(populate_existing=True)
+        .first()
+    )
+
+
+def mark_ready(asset_id: int, image_variants: dict) -> bool:
+    """
+    변환 완료 기록 (이후 같은 내용의 업로드는 변환 없이 변환본 사용)
+
+    Returns:
+        저장소 항목이 아직 남아 있으면 True (변환 중 마지막 참조가 해제되었으면 False)
+    """
+    updated = StoredAsset.query.filter_by(id=asset_id).update(
+        {StoredAsset.status: "READY", StoredAsset.image_variants: image_variants},
+        synchronize_session=False,
+    )
+    return bool(updated)
@@ -0,0 +1,469 @@
+"""
+캐시 유틸리티
+TTL/LRU 캐시 백엔드와 워커 간 무효화 전파를 제공
+
+- MemoryBackend: 프로세스 내 캐시 (기본값, 테스트/단일 워커용)
+- SQLiteBackend: 같은 호스트의 모든 워커가 공유하는 파일 기반 캐시 (Redis 대체용)
+
+서비스 코드는 get_cache(region)으로 받은 CacheRegion만 사용합니다.
+CacheRegion은 워커별 로컬 캐시(L1) 앞단을 두고, 공유 백엔드가 설정된 경우
+무효화 메시지를 공유 백엔드에 기록하여 다른 워커가 CACHE_SYNC_INTERVAL초 이내에
+같은 키를 로컬 캐시에서 제거하도록 합니다.
+"""
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# 무효화 메시지에서 영역 전체를 의미하는 키
+ALL_KEYS = "*"
+
+_MISSING = object()
+
+
+class MemoryBackend:
+    """
+    프로세스 내 TTL + LRU 캐시
+
+    카운터(incr)는 캐시 항목과 따로 보관하여 LRU/TTL로 삭제되지 않습니다.
+    """
+
+    def __init__(self, max_entries=1024, default_ttl=None):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._counters = {}  # key -> int
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix):
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def incr(self, key):
+        with self._lock:
+            value = self._counters.get(key, 0) + 1
+            self._counters[key] = value
+            return value
+
+    def get_counter(self, key):
+        return self._counters.get(key, 0)
+
+    def clear(self):
+        """캐시 항목 삭제 (카운터는 유지)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteBackend:
+    """
+    SQLite 파일 기반 공유 캐시 (같은 호스트의 여러 워커가 공유)
+
+    값은 pickle로 직렬화하여 저장하며, 항목 수가 max_entries를 넘으면
+    마지막 접근 시각이 가장 오래된 항목부터 삭제합니다.
+    조회는 쓰기 잠금을 잡지 않도록 읽기만 하고, 마지막 접근 시각은
+    ACCESS_UPDATE_INTERVAL초보다 오래된 경우에만 갱신합니다 (LRU 정밀도와 맞바꿈).
+    카운터(cache_counters)는 LRU/TTL 삭제 대상이 아닌 별도 테이블에,
+    무효화 메시지 로그(cache_messages)도 함께 관리합니다.
+    """
+
+    MESSAGE_RETENTION_SECONDS = 3600
+    ACCESS_UPDATE_INTERVAL = 60.0
+
+    def __init__(self, path, max_entries=10000, default_ttl=None):
+        self.path = path
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+            "expires_at REAL, last_access REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_cache_entries_last_access "
+            "ON cache_entries (last_access)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_counters ("
+            "key TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_messages ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, region TEXT NOT NULL, "
+            "key TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key, default=None):
+        now = time.time()
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT value, expires_at, last_access FROM cache_entries WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return default
+
+        value, expires_at, last_access = row
+        if expires_at is not None and expires_at <= now:
+            # 만료된 항목은 다음 set()의 정리 단계에서 삭제
+            return default
+
+        if now - last_access >= self.ACCESS_UPDATE_INTERVAL:
+            conn.execute(
+                "UPDATE cache_entries SET last_access = ? WHERE key = ?", (now, key)
+            )
+        return pickle.loads(value)
+
+    def set(self, key, value, ttl=None):
+        now = time.time()
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = now + ttl if ttl else None
+
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entries (key, value, expires_at, last_access) "
+            "VALUES (?, ?, ?, ?)",
+            (key, pickle.dumps(value), expires_at, now),
+        )
+        self._evict(conn, now)
+
+    def _evict(self, conn, now):
+        conn.execute(
+            "DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (now,),
+        )
+        (count,) = conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+        if count > self.max_entries:
+            conn.execute(
+                "DELETE FROM cache_entries WHERE key IN ("
+                "SELECT key FROM cache_entries ORDER BY last_access ASC LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def delete(self, key):
+        self._connect().execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix):
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        self._connect().execute(
+            "DELETE FROM cache_entries WHERE key LIKE ? ESCAPE '\\'",
+            (escaped + "%",),
+        )
+
+    def incr(self, key):
+        conn = self._connect()
+        with _immediate_transaction(conn):
+            conn.execute(
+                "INSERT INTO cache_counters (key, value) VALUES (?, 1) "
+                "ON CONFLICT (key) DO UPDATE SET value = value + 1",
+                (key,),
+            )
+            (value,) = conn.execute(
+                "SELECT value FROM cache_counters WHERE key = ?", (key,)
+            ).fetchone()
+        return value
+
+    def get_counter(self, key):
+        row = (
+            self._connect()
+            .execute("SELECT value FROM cache_counters WHERE key = ?", (key,))
+            .fetchone()
+        )
+        return row[0] if row else 0
+
+    def clear(self):
+        """캐시 항목 삭제 (카운터는 유지)"""
+        self._connect().execute("DELETE FROM cache_entries")
+
+    def publish(self, region, key):
+        """무효화 메시지 기록 (다른 워커가 poll로 수신)"""
+        now = time.time()
+        conn = self._connect()
+        conn.execute(
+            "INSERT INTO cache_messages (region, key, created_at) VALUES (?, ?, ?)",
+            (region, key, now),
+        )
+        conn.execute(
+            "DELETE FROM cache_messages WHERE created_at < ?",
+            (now - self.MESSAGE_RETENTION_SECONDS,),
+        )
+
+    def poll(self, after_id):
+        """after_id 이후의 무효화 메시지 조회 -> [(id, region, key), ...]"""
+        return (
+            self._connect()
+            .execute(
+                "SELECT id, region, key FROM cache_messages WHERE id > ? ORDER BY id",
+                (after_id,),
+            )
+            .fetchall()
+        )
+
+    def last_message_id(self):
+        (last_id,) = (
+            self._connect()
+            .execute("SELECT COALESCE(MAX(id), 0) FROM cache_messages")
+            .fetchone()
+        )
+        return last_id
+
+
+class _immediate_transaction:
+    """SQLite 쓰기 잠금을 즉시 획득하는 트랜잭션 (incr 후 같은 값을 읽도록 보장)"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+class CacheRegion:
+    """
+    용도별 캐시 영역 (예: 'permission.roles', 'session')
+
+    - 읽기: 로컬 캐시(L1) -> 공유 백엔드 순서로 조회
+    - 쓰기: 로컬 캐시와 공유 백엔드에 함께 저장
+    - 무효화: 로컬 캐시/공유 백엔드에서 삭제하고 다른 워커에 무효화 메시지 전파
+    """
+
+    def __init__(self, name, manager, ttl=None, max_entries=None):
+        self.name = name
+        self.ttl = ttl
+        self._manager = manager
+        self._local = MemoryBackend(
+            max_entries=max_entries or manager.local_max_entries, default_ttl=ttl
+        )
+
+    def _key(self, key):
+        return f"{self.name}:{key}"
+
+    def get(self, key, default=None):
+        key = str(key)
+        self._manager.sync()
+
+        value = self._local.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        shared = self._manager.shared
+        if shared is not None:
+            value = shared.get(self._key(key), _MISSING)
+            if value is not _MISSING:
+                self._local.set(key, value)
+                return value
+
+        return default
+
+    def set(self, key, value, ttl=None):
+        key = str(key)
+        ttl = self.ttl if ttl is None else ttl
+        self._local.set(key, value, ttl)
+
+        shared = self._manager.shared
+        if shared is not None:
+            shared.set(self._key(key), value, ttl)
+
+    def get_or_set(self, key, loader, ttl=None):
+        """캐시 조회 후 없으면 loader() 결과를 저장하여 반환"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            self.set(key, value, ttl)
+        return value
+
+    def delete(self, key):
+        """키 무효화 (모든 워커에 전파)"""
+        key = str(key)
+        self._local.delete(key)
+
+        shared = self._manager.shared
+        if shared is not None:
+            shared.delete(self._key(key))
+            self._manager.publish(self.name, key)
+
+    def clear(self):
+        """영역 전체 무효화 (모든 워커에 전파)"""
+        self._local.clear()
+
+        shared = self._manager.shared
+        if shared is not None:
+            shared.delete_prefix(self._key(""))
+            self._manager.publish(self.name, ALL_KEYS)
+
+    def incr(self, key):
+        """카운터 증가 (공유 백엔드가 있으면 모든 워커가 같은 값을 공유)"""
+        key = str(key)
+        shared = self._manager.shared
+        if shared is not None:
+            return shared.incr(self._key(key))
+        return self._local.incr(key)
+
+    def get_counter(self, key):
+        """카운터 현재 값 조회 (로컬 캐시를 거치지 않음)"""
+        key = str(key)
+        shared = self._manager.shared
+        if shared is not None:
+            return shared.get_counter(self._key(key))
+        return self._local.get_counter(key)
+
+    def _apply_invalidation(self, key):
+        if key == ALL_KEYS:
+            self._local.clear()
+        else:
+            self._local.delete(key)
+
+
+class CacheManager:
+    """캐시 영역 레지스트리 및 워커 간 무효화 동기화"""
+
+    def __init__(self):
+        self.shared = None
+        self.local_max_entries = 1024
+        self.sync_interval = 2.0
+        self._regions = {}
+        self._lock = threading.Lock()
+        self._last_message_id = 0
+        self._next_sync = 0.0
+
+    def configure(
+        self,
+        backend="memory",
+        path=None,
+        local_max_entries=1024,
+        shared_max_entries=10000,
+        sync_interval=2.0,
+    ):
+        """캐시 백엔드 설정 (앱 시작 시 1회)"""
+        self.local_max_entries = local_max_entries
+        self.sync_interval = sync_interval
+
+        if backend == "sqlite":
+            self.shared = SQLiteBackend(path, max_entries=shared_max_entries)
+            self._last_message_id = self.shared.last_message_id()
+        elif backend == "memory":
+            self.shared = None
+        else:
+            raise ValueError(f"지원하지 않는 캐시 백엔드입니다: {backend}")
+
+        for region in self._regions.values():
+            region._local.clear()
+
+    def region(self, name, ttl=None, max_entries=None):
+        with self._lock:
+            region = self._regions.get(name)
+            if region is None:
+                region = CacheRegion(name, self, ttl=ttl, max_entries=max_entries)
+                self._regions[name] = region
+            return region
+
+    def publish(self, region_name, key):
+        try:
+            self.shared.publish(region_name, key)
+        except Exception:
+            logger.exception(f"캐시 무효화 메시지 전파 실패: {region_name}:{key}")
+
+    def sync(self, force=False):
+        """다른 워커의 무효화 메시지를 로컬 캐시에 반영 (sync_interval 간격)"""
+        if self.shared is None:
+            return
+
+        now = time.monotonic()
+        if not force and now < self._next_sync:
+            return
+        self._next_sync = now + self.sync_interval
+
+        try:
+            messages = self.shared.poll(self._last_message_id)
+        except Exception:
+            logger.exception("캐시 무효화 메시지 조회 실패")
+            return
+
+        for message_id, region_name, key in messages:
+            region = self._regions.get(region_name)
+            if region is not None:
+                region._apply_invalidation(key)
+            self._last_message_id = message_id
+
+
+# 전역 인스턴스
+cache_manager = CacheManager()
+
+
+def get_cache(name, ttl=None, max_entries=None):
+    """캐시 영역 조회 (없으면 생성)"""
+    return cache_manager.region(name, ttl=ttl, max_entries=max_entries)
+
+
+def init_cache(app):
+    """앱 설정으로 캐시 백엔드 초기화"""
+    backend = app.config.get("CACHE_BACKEND", "memory")
+    path = app.config.get("CACHE_SQLITE_PATH", "cache/clubu_cache.sqlite3")
+    if not os.path.isabs(path):
+        path = os.path.join(app.root_path, path)
+
+    cache_manager.configure(
+        backend=backend,
+        path=path,
+        local_max_entries=app.config.get("CACHE_LOCAL_MAX_ENTRIES", 1024),
+        shared_max_entries=app.config.get("CACHE_SHARED_MAX_ENTRIES", 10000),
+        sync_interval=app.config.get("CACHE_SYNC_INTERVAL", 2.0),
+    )
+    return cache_manager
@@ -0,0 +1,76 @@
+"""
+동아리 카탈로그 캐시
+동아리 목록 응답을 직렬화된 JSON bytes로 보관하고, 카탈로그 버전으로 무효화
+"""
+
+import json
+import threading
+
+from utils.cache import get_cache
+from utils.time_utils import get_kst_today
+
+
+class CatalogCache:
+    """
+    버전 기반 동아리 카탈로그 캐시
+
+    - 동아리 정보를 변경하는 서비스는 커밋 후 bump_version()을 호출
+    - 카탈로그 버전은 캐시 백엔드의 카운터로 관리되어 공유 백엔드 사용 시 모든 워커가 공유
+    - 캐시 항목은 (카탈로그 버전, KST 날짜)가 모두 같을 때만 유효
+      (D-day와 모집 상태는 날짜에 따라 달라지므로 자정에 자동 무효화)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions = get_cache("catalog")
+        self._entries = {}  # key -> (version, date, payload bytes)
+
+    @property
+    def version(self) -> int:
+        return self._versions.get_counter("version")
+
+    def bump_version(self) -> int:
+        """카탈로그 버전 증가 (모든 워커의 캐시된 응답 무효화)"""
+        with self._lock:
+            self._entries.clear()
+            return self._versions.incr("version")
+
+    def get_or_build(self, key: str, builder) -> bytes:
+        """
+        캐시된 JSON bytes 반환, 없거나 오래된 경우 builder()로 생성 후 저장
+
+        Args:
+            key: 캐시 키 (예: 'clubs.all')
+            builder: 응답 데이터(dict/list)를 반환하는 함수
+
+        Returns:
+            직렬화된 JSON bytes
+        """
+        today = get_kst_today()
+        version = self.version
+        entry = self._entries.get(key)
+        if entry and entry[0] == version and entry[1] == today:
+            return entry[2]
+
+        payload = json.dumps(builder(), ensure_ascii=False).encode("utf-8")
+
+        with self._lock:
+            # 생성 도중 버전이 바뀌었다면 오래된 데이터이므로 저장하지 않음
+            if self.version == version:
+                self._entries[key] = (version, today, payload)
+
+        return payload
+
+    def clear(self):
+        """모든 캐시 항목 삭제 (버전 유지)"""
+        with self._lock:
+            self._entries.clear()
+
+
+# 전역 인스턴스
+catalog_cache = CatalogCache()
+
+
+def invalidate_club_catalog():
+    """동아리 카탈로그 캐시 무효화 (동아리 정보 변경 커밋 후 호출)"""
+    catalog_cache.bump_version()
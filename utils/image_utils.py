@@ -1,49 +1,374 @@
+import glob
+import hashlib
 import os
+import time
 import uuid
 from PIL import Image
 from werkzeug.utils import secure_filename
 from flask import current_app
 
+from utils import asset_store
+from utils.asset_store import get_store_dir, get_store_location, parse_content_hash
+from utils.upload_stream import (
+    DEFAULT_NOTICE_FILE_MAX_BYTES,
+    UPLOAD_TEMP_PREFIX,
+    UPLOAD_TEMP_SUFFIX,
+    consume_upload,
+)
+
+# 기본 이미지 변형 크기 ("이름:최대 변 길이" 쉼표 구분)
+DEFAULT_VARIANT_SIZES = "thumbnail:320,medium:960,full:2048"
+
+# 디코딩을 허용하는 최대 픽셀 수/파일 크기 (워커 1개당 최대 메모리 사용량의 상한)
+DEFAULT_MAX_PIXELS = 40_000_000
+DEFAULT_MAX_FILE_BYTES = 30 * 1024 * 1024
+# 헤더 기준으로 디코딩을 허용하는 이미지 형식 (MPO: 스마트폰 JPEG)
+DECODABLE_IMAGE_FORMATS = {"JPEG", "MPO", "PNG", "GIF", "BMP"}
+
+
+def get_image_variant_settings():
+    """
+    이미지 변형 생성 설정 조회
+
+    Returns:
+        dict: sizes([(이름, 최대 변 길이), ...] 큰 순서), webp_quality, avif(생성 여부), avif_quality,
+            fingerprint(위 설정의 짧은 해시, 변환본 파일 이름에 사용)
+    """
+    sizes = []
+    for item in current_app.config.get(
+        "IMAGE_VARIANT_SIZES", DEFAULT_VARIANT_SIZES
+    ).split(","):
+        name, _, max_size = item.strip().partition(":")
+        sizes.append((name, int(max_size)))
+
+    # AVIF는 설정으로 켜져 있고 Pillow 빌드가 AVIF 저장을 지원할 때만 생성
+    Image.init()
+    avif = current_app.config.get("IMAGE_AVIF_ENABLED", False) and "AVIF" in Image.SAVE
+
+    settings = {
+        "sizes": sorted(sizes, key=lambda size: size[1], reverse=True),
+        "webp_quality": current_app.config.get("IMAGE_WEBP_QUALITY", 82),
+        "avif": avif,
+        "avif_quality": current_app.config.get("IMAGE_AVIF_QUALITY", 55),
+    }
+    settings["fingerprint"] = hashlib.sha256(
+        repr(sorted(settings.items())).encode()
+    ).hexdigest()[:8]
+    return settings
+
+
+def get_image_limits():
+    """업로드 이미지 디코딩 제한 (최대 픽셀 수, 최대 파일 크기)"""
+    return {
+        "max_pixels": current_app.config.get("IMAGE_MAX_PIXELS", DEFAULT_MAX_PIXELS),
+        "max_file_bytes": current_app.config.get(
+            "IMAGE_MAX_FILE_BYTES", DEFAULT_MAX_FILE_BYTES
+        ),
+    }
+
+
+def inspect_image(path):
+    """
+    디코딩 전에 파일 크기와 이미지 헤더(형식, 해상도)만 읽어 제한 확인
+
+    Returns:
+        (형식, 가로, 세로)
+
+    Raises:
+        ValueError: 이미지가 아니거나 제한을 넘는 경우
+    """
+    limits = get_image_limits()
+    file_size = os.path.getsize(path)
+    if file_size > limits["max_file_bytes"]:
+        raise ValueError(
+            f"이미지 파일이 너무 큽니다 (최대 {limits['max_file_bytes'] // (1024 * 1024)}MB)"
+        )
 
-def create_banner_directories(club_id):
-    """배너 저장을 위한 디렉토리 생성"""
-    base_dir = current_app.config.get("BANNERS_DIR", "banners")
-    # 절대 경로로 변환 (파일 서빙과 동일한 경로 사용)
-    if not os.path.isabs(base_dir):
-        base_dir = os.path.join(current_app.root_path, base_dir)
-    optimized_dir = os.path.join(base_dir, str(club_id), "optimized")
-
-    os.makedirs(optimized_dir, exist_ok=True)
+    try:
+        # Image.open은 헤더만 읽고 픽셀 데이터는 load() 전까지 디코딩하지 않음
+        with Image.open(path) as img:
+            image_format, (width, height) = img.format, img.size
+    except Image.DecompressionBombError:
+        raise ValueError("이미지 해상도가 너무 큽니다")
+    except Exception:
+        raise ValueError("이미지 파일을 읽을 수 없습니다")
+
+    if image_format not in DECODABLE_IMAGE_FORMATS:
+        raise ValueError(f"지원하지 않는 이미지 형식입니다: {image_format}")
+    if width * height > limits["max_pixels"]:
+        raise ValueError(
+            f"이미지 해상도가 너무 큽니다 ({width}x{height}, 최대 {limits['max_pixels']:,}픽셀)"
+        )
+    return image_format, width, height
 
-    return optimized_dir
 
+def _open_for_target(source_path, max_size):
+    """
+    최대 변 길이가 max_size인 결과를 만들기 위해 필요한 만큼만 디코딩
 
-def optimize_image(image_path, output_path):
-    """이미지를 원본 해상도 그대로 WebP로 변환 (무손실 압축)"""
+    - JPEG은 draft()로 디코더 단계에서 1/2, 1/4, 1/8 축소 디코딩
+    - 그 밖의 형식은 디코딩 후 reduce()로 정수배 축소한 뒤 원본 해제
+    - 결과는 RGB (WebP는 RGBA를 지원하지만 일관성을 위해 RGB 사용)
+    - 디코딩 직전에 설정된 픽셀 제한(IMAGE_MAX_PIXELS)을 다시 확인
+      (Pillow 전역 Image.MAX_IMAGE_PIXELS는 변경하지 않음)
+    """
+    max_pixels = get_image_limits()["max_pixels"]
+    img = Image.open(source_path)
     try:
-        with Image.open(image_path) as img:
-            # RGB로 변환 (WebP는 RGBA를 지원하지만 일관성을 위해 RGB 사용)
-            if img.mode in ("RGBA", "LA", "P"):
-                img = img.convert("RGB")
-
-            # 원본 해상도를 유지한 채 WebP로 저장 (무손실 모드)
-            img.save(
-                output_path,
-                "WebP",
-                lossless=True,
-                quality=100,
-                optimize=True,
-                method=6,
+        if img.width * img.height > max_pixels:
+            raise ValueError(
+                f"이미지 해상도가 너무 큽니다 ({img.width}x{img.height}, 최대 {max_pixels:,}픽셀)"
             )
 
-        return True
+        scale = min(1.0, max_size / max(img.size))
+        target = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+        if img.format in ("JPEG", "MPO"):
+            img.draft("RGB", target)
+        img.load()
+
+        factor = min(img.width // target[0], img.height // target[1])
+        if factor >= 2:
+            reduced = img.reduce(factor)
+            img.close()
+            img = reduced
+
+        if img.mode != "RGB":
+            converted = img.convert("RGB")
+            img.close()
+            img = converted
+        return img
+    except Exception:
+        img.close()
+        raise
+
+
+def generate_image_variants(source_path, output_path):
+    """
+    원본 이미지로 크기별 변형(썸네일/중간/전체) 생성
+
+    - 헤더로 해상도/크기 제한을 먼저 확인한 뒤, 가장 큰 변형에 필요한 크기로만 디코딩
+    - 가장 큰 변형은 output_path에, 나머지는 "<이름>_<변형 이름>.webp"로 저장
+    - 손실 WebP(설정된 품질)로 저장하며, 설정 시 같은 크기의 AVIF도 함께 생성
+    - 원본보다 크게 확대하지 않고, 작은 변형은 바로 위 변형을 축소하여 생성
+    - 변환마다 디코딩 크기와 RSS(현재/프로세스 최대)를 로그로 기록
+
+    Returns:
+        {변형 이름: {"width", "height", "webp": 경로, "avif": 경로(선택)}}
+    """
+    settings = get_image_variant_settings()
+    image_format, width, height = inspect_image(source_path)
+    base_path = os.path.splitext(output_path)[0]
+    variants = {}
+    written = []
+    rss_before = _rss_bytes()
+    started = time.perf_counter()
+
+    try:
+        working = _open_for_target(source_path, settings["sizes"][0][1])
+        decoded_size = working.size
+        try:
+            for index, (name, max_size) in enumerate(settings["sizes"]):
+                if max(working.size) > max_size:
+                    working.thumbnail((max_size, max_size), Image.LANCZOS)
+
+                variant_base = base_path if index == 0 else f"{base_path}_{name}"
+                variant = {"width": working.width, "height": working.height}
+
+                variant["webp"] = f"{variant_base}.webp"
+                _save_atomically(
+                    working,
+                    variant["webp"],
+                    "WebP",
+                    quality=settings["webp_quality"],
+                    method=4,
+                )
+                written.append(variant["webp"])
+
+                if settings["avif"]:
+                    variant["avif"] = f"{variant_base}.avif"
+                    _save_atomically(
+                        working,
+                        variant["avif"],
+                        "AVIF",
+                        quality=settings["avif_quality"],
+                    )
+                    written.append(variant["avif"])
+
+                variants[name] = variant
+        finally:
+            working.close()
+    except Exception:
+        for path in written:
+            if os.path.exists(path):
+                os.remove(path)
+        raise
+
+    current_app.logger.info(
+        f"이미지 변환 완료: {os.path.basename(source_path)} {image_format} {width}x{height}"
+        f" -> 디코딩 {decoded_size[0]}x{decoded_size[1]}"
+        f" ({decoded_size[0] * decoded_size[1] * 3 / (1024 * 1024):.1f}MB),"
+        f" RSS {rss_before / (1024 * 1024):.0f}MB -> {_rss_bytes() / (1024 * 1024):.0f}MB,"
+        f" 최대 RSS {_peak_rss_bytes() / (1024 * 1024):.0f}MB,"
+        f" {(time.perf_counter() - started) * 1000:.0f}ms"
+    )
+    return variants
+
+
+def _rss_bytes():
+    """현재 프로세스 RSS (Linux /proc 기준, 읽을 수 없으면 최대 RSS)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return _peak_rss_bytes()
+
+
+def _peak_rss_bytes():
+    """프로세스 최대 RSS (Linux는 KB 단위)"""
+    try:
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except ImportError:
+        return 0
+
+
+def _save_atomically(img, path, image_format, **params):
+    """임시 파일에 저장한 뒤 이름을 바꿔 저장 중인 파일이 서빙되지 않도록 함"""
+    temp_path = f"{path}.part"
+    try:
+        img.save(temp_path, image_format, **params)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def convert_image(source_path, output_path):
+    """
+    원본 이미지를 크기별 WebP(및 AVIF) 변형으로 변환 (이미지 변환 워커에서 호출)
+
+    Returns:
+        generate_image_variants()의 변형 정보
+
+    Raises:
+        ValueError: 변환에 실패한 경우
+    """
+    try:
+        return generate_image_variants(source_path, output_path)
     except Exception as e:
-        print(f"이미지 최적화 중 오류 발생: {e}")
+        raise ValueError(f"이미지 최적화에 실패했습니다: {e}")
+
+
+def remove_image_variants(file_path):
+    """변환된 이미지(file_path)와 함께 생성된 크기별 변형 파일 삭제"""
+    if not file_path or not file_path.endswith(".webp"):
+        return
+
+    base_path = os.path.splitext(file_path)[0]
+    paths = [f"{base_path}.avif"] + glob.glob(f"{glob.escape(base_path)}_*")
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _store_image(file, namespace, file_ext):
+    """
+    업로드 이미지를 내용 주소 저장소에 저장
+
+    - 업로드 파일을 저장소 디렉토리로 옮기면서(또는 청크 단위로 쓰면서) SHA-256 해시 계산,
+      최대 크기(IMAGE_MAX_FILE_BYTES)를 넘으면 끝까지 받지 않고 중단
+    - 같은 내용이 이미 변환되어 있으면 업로드 파일을 버리고 기존 변환본/변형을
+      그대로 사용 (디코딩/인코딩 생략, conversion은 None)
+    - 처음 보는 내용이면 "<해시>.<확장자>"로 원본을 저장하고 변환 대기 정보 반환
+
+    변환이 끝나기 전까지는 원본 URL(file_path)을 사용하고, 변환 워커가
+    conversion 정보로 변환본을 만든 뒤 URL을 교체합니다.
+    참조 수는 호출한 쪽의 트랜잭션에서 증가하므로, 이미지를 가리키는 행을 커밋하거나
+    실패 시 롤백해야 합니다 (롤백되면 새로 저장한 원본은 삭제됨).
+    """
+    store_dir = get_store_dir(namespace)
+    os.makedirs(store_dir, exist_ok=True)
+    upload_path = os.path.join(
+        store_dir, f"{UPLOAD_TEMP_PREFIX}{uuid.uuid4()}{UPLOAD_TEMP_SUFFIX}"
+    )
+    max_bytes = get_image_limits()["max_file_bytes"]
+
+    try:
+        content_hash, size_bytes = consume_upload(
+            file,
+            upload_path,
+            max_bytes,
+            f"이미지 파일이 너무 큽니다 (최대 {max_bytes // (1024 * 1024)}MB)",
+        )
+        # 변환 대기열에 넣기 전에 헤더만 읽어 해상도/크기 제한 확인
+        inspect_image(upload_path)
+
+        source_path, source_url = get_store_location(namespace, content_hash, file_ext)
+        # 변환본은 변환 설정에 따라 내용이 달라지므로 설정 지문을 이름에 포함
+        # (설정이 바뀐 뒤 다시 변환되면 URL도 바뀌어 immutable 캐시가 오래된 변환본을 쓰지 않음)
+        output_path, output_url = get_store_location(
+            namespace,
+            content_hash,
+            "webp",
+            get_image_variant_settings()["fingerprint"],
+        )
+        asset, created = asset_store.acquire(
+            namespace,
+            content_hash,
+            size_bytes,
+            source_path,
+            source_url,
+            output_path,
+            output_url,
+        )
+        if created:
+            os.makedirs(os.path.dirname(source_path), exist_ok=True)
+            os.replace(upload_path, source_path)
+    finally:
+        if os.path.exists(upload_path):
+            os.remove(upload_path)
+
+    if asset.status == "READY":
+        return {
+            "file_path": asset.file_url,
+            "optimized_path": asset.file_path,
+            "original_filename": file.filename,
+            "image_variants": asset.image_variants,
+            "conversion": None,
+        }
+
+    return {
+        "file_path": asset.source_url,
+        "optimized_path": asset.file_path,
+        "original_filename": file.filename,
+        "image_variants": None,
+        "conversion": {
+            "source_path": asset.source_path,
+            "source_url": asset.source_url,
+            "output_path": asset.file_path,
+            "output_url": asset.file_url,
+        },
+    }
+
+
+def _release_image(namespace, file_path):
+    """
+    저장소 이미지 참조 해제 (마지막 참조 해제가 커밋되면 원본/변환본/변형 파일 삭제)
+
+    Returns:
+        저장소 이미지가 아니면 False (호출한 쪽에서 기존 방식으로 삭제)
+    """
+    content_hash = parse_content_hash(file_path)
+    if content_hash is None:
         return False
 
+    asset_store.release(namespace, content_hash)
+    return True
+
 
 def save_banner_image(file, club_id):
-    """배너 이미지 저장 및 최적화"""
+    """배너 이미지 원본 저장 (WebP 변환은 이미지 변환 워커에서 처리)"""
     try:
         from flask import current_app
 
@@ -67,43 +392,10 @@ def save_banner_image(file, club_id):
                 f"지원하지 않는 이미지 형식입니다. 허용된 형식: {', '.join(allowed_extensions)}. 업로드한 파일: {original_filename} (확장자: '{file_ext}')"
             )
 
-        # 고유한 파일명 생성 (WebP로 저장)
-        optimized_filename = f"{uuid.uuid4()}.webp"
-
-        # 디렉토리 생성
-        optimized_dir = create_banner_directories(club_id)
-        current_app.logger.info(f"Created directory: {optimized_dir}")
-
-        # 최적화된 파일 저장 경로
-        optimized_path = os.path.join(optimized_dir, optimized_filename)
-
-        # 임시 원본 파일 저장
-        temp_path = os.path.join(optimized_dir, f"temp_{uuid.uuid4()}.{file_ext}")
-        file.save(temp_path)
-        current_app.logger.info(f"Saved temp file: {temp_path}")
-
-        # 이미지 최적화
-        if optimize_image(temp_path, optimized_path):
-            # 임시 파일 삭제
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-
-            current_app.logger.info(
-                f"Banner image saved successfully: {optimized_path}"
-            )
-            return {
-                "file_path": (
-                    f"/{current_app.config.get('BANNERS_DIR', 'banners')}/{club_id}/optimized/{optimized_filename}"
-                ),
-                "optimized_path": optimized_path,
-                "original_filename": original_filename,
-            }
-        else:
-            # 최적화 실패 시 임시 파일 삭제
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-            current_app.logger.error("Image optimization failed")
-            raise ValueError("이미지 최적화에 실패했습니다")
+        # 내용 주소 저장소에 저장 (같은 이미지는 기존 변환본 재사용)
+        image_info = _store_image(file, "banners", file_ext)
+        current_app.logger.info(f"Banner image saved: {image_info['file_path']}")
+        return image_info
 
     except Exception as e:
         from flask import current_app
@@ -113,8 +405,14 @@ def save_banner_image(file, club_id):
 
 
 def delete_banner_image(file_path):
-    """배너 이미지 파일 삭제"""
+    """배너 이미지 파일 삭제 (저장소 이미지는 마지막 참조가 해제될 때만 삭제)"""
     try:
+        if _release_image("banners", file_path):
+            return True
+
+        # 크기별 변형 파일 삭제
+        remove_image_variants(file_path)
+
         # 최적화된 파일 삭제
         if file_path and os.path.exists(file_path):
             os.remove(file_path)
@@ -126,24 +424,8 @@ def delete_banner_image(file_path):
         return False
 
 
-def create_club_directories(club_id):
-    """동아리 이미지 저장을 위한 디렉토리 생성"""
-    base_dir = current_app.config.get("CLUBS_DIR", "clubs")
-    # 절대 경로로 변환 (파일 서빙과 동일한 경로 사용)
-    if not os.path.isabs(base_dir):
-        base_dir = os.path.join(current_app.root_path, base_dir)
-    club_dir = os.path.join(base_dir, str(club_id))
-    images_dir = os.path.join(club_dir, "images")
-    original_dir = os.path.join(club_dir, "original")
-
-    os.makedirs(images_dir, exist_ok=True)
-    os.makedirs(original_dir, exist_ok=True)
-
-    return images_dir, original_dir
-
-
 def save_club_image(file, club_id, image_type):
-    """동아리 이미지 저장 및 최적화 (로고 또는 소개글 이미지)"""
+    """동아리 이미지 원본 저장 (로고 또는 소개글 이미지, WebP 변환은 이미지 변환 워커에서 처리)"""
     try:
         # 파일명 보안 처리
         original_filename = file.filename
@@ -165,43 +447,22 @@ def save_club_image(file, club_id, image_type):
         if image_type not in ["logo", "introduction"]:
             raise ValueError("유효하지 않은 이미지 타입입니다")
 
-        # 고유한 파일명 생성 (WebP로 저장)
-        optimized_filename = f"{image_type}_{uuid.uuid4()}.webp"
-
-        # 디렉토리 생성
-        images_dir, original_dir = create_club_directories(club_id)
-
-        # 최적화된 파일 저장 경로
-        optimized_path = os.path.join(images_dir, optimized_filename)
-
-        # 임시 원본 파일 저장
-        temp_path = os.path.join(original_dir, f"temp_{uuid.uuid4()}.{file_ext}")
-        file.save(temp_path)
-
-        # 이미지 최적화
-        if optimize_image(temp_path, optimized_path):
-            # 임시 파일 삭제
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-
-            return {
-                "file_path": f"/{current_app.config.get('CLUBS_DIR', 'clubs')}/{club_id}/images/{optimized_filename}",
-                "optimized_path": optimized_path,
-                "original_filename": original_filename,
-            }
-        else:
-            # 최적화 실패 시 임시 파일 삭제
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-            raise ValueError("이미지 최적화에 실패했습니다")
+        # 내용 주소 저장소에 저장 (같은 이미지는 기존 변환본 재사용)
+        return _store_image(file, "clubs", file_ext)
 
     except Exception as e:
         raise Exception(f"이미지 저장 중 오류 발생: {e}")
 
 
 def delete_club_image(file_path):
-    """동아리 이미지 파일 삭제"""
+    """동아리 이미지 파일 삭제 (저장소 이미지는 마지막 참조가 해제될 때만 삭제)"""
     try:
+        if _release_image("clubs", file_path):
+            return True
+
+        # 크기별 변형 파일 삭제
+        remove_image_variants(file_path)
+
         # 최적화된 파일 삭제
         if file_path and os.path.exists(file_path):
             os.remove(file_path)
@@ -232,7 +493,7 @@ def create_notice_directories(notice_id):
 
 
 def save_notice_image(file, notice_id):
-    """공지사항 이미지 저장 및 최적화"""
+    """공지사항 이미지 원본 저장 (WebP 변환은 이미지 변환 워커에서 처리)"""
     try:
         from flask import current_app
 
@@ -256,41 +517,10 @@ def save_notice_image(file, notice_id):
                 f"지원하지 않는 이미지 형식입니다. 허용된 형식: {', '.join(allowed_extensions)}. 업로드한 파일: {original_filename} (확장자: '{file_ext}')"
             )
 
-        # 고유한 파일명 생성 (WebP로 저장)
-        optimized_filename = f"{uuid.uuid4()}.webp"
-
-        # 디렉토리 생성
-        images_dir, files_dir = create_notice_directories(notice_id)
-        current_app.logger.info(f"Created directory: {images_dir}")
-
-        # 최적화된 파일 저장 경로
-        optimized_path = os.path.join(images_dir, optimized_filename)
-
-        # 임시 원본 파일 저장
-        temp_path = os.path.join(images_dir, f"temp_{uuid.uuid4()}.{file_ext}")
-        file.save(temp_path)
-        current_app.logger.info(f"Saved temp file: {temp_path}")
-
-        # 이미지 최적화
-        if optimize_image(temp_path, optimized_path):
-            # 임시 파일 삭제
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-
-            current_app.logger.info(
-                f"Notice image saved successfully: {optimized_path}"
-            )
-            return {
-                "file_path": f"/{current_app.config.get('NOTICES_DIR', 'notices')}/{notice_id}/images/{optimized_filename}",
-                "optimized_path": optimized_path,
-                "original_filename": original_filename,
-            }
-        else:
-            # 최적화 실패 시 임시 파일 삭제
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-            current_app.logger.error("Image optimization failed")
-            raise ValueError("이미지 최적화에 실패했습니다")
+        # 내용 주소 저장소에 저장 (같은 이미지는 기존 변환본 재사용)
+        image_info = _store_image(file, "notices", file_ext)
+        current_app.logger.info(f"Notice image saved: {image_info['file_path']}")
+        return image_info
 
     except Exception as e:
         from flask import current_app
@@ -372,14 +602,6 @@ def save_notice_file(file, notice_id):
                 f"지원하지 않는 파일 형식입니다. 허용된 형식: {', '.join(sorted(allowed_extensions))}. 업로드한 파일: {original_filename} (확장자: '{file_ext}')"
             )
 
-        # 파일 크기 제한 (100MB)
-        file.seek(0, 2)  # 파일 끝으로 이동
-        file_size = file.tell()
-        file.seek(0)  # 파일 시작으로 이동
-
-        if file_size > 100 * 1024 * 1024:  # 100MB
-            raise ValueError("파일 크기가 너무 큽니다 (최대 100MB)")
-
         # 고유한 파일명 생성 (원본 확장자 유지)
         unique_filename = f"{uuid.uuid4()}.{file_ext}"
 
@@ -390,8 +612,16 @@ def save_notice_file(file, notice_id):
         # 파일 저장 경로
         file_path = os.path.join(files_dir, unique_filename)
 
-        # 파일 저장
-        file.save(file_path)
+        # 파일 저장 (크기 제한은 저장하면서 확인)
+        max_bytes = current_app.config.get(
+            "NOTICE_FILE_MAX_BYTES", DEFAULT_NOTICE_FILE_MAX_BYTES
+        )
+        _, file_size = consume_upload(
+            file,
+            file_path,
+            max_bytes,
+            f"파일 크기가 너무 큽니다 (최대 {max_bytes // (1024 * 1024)}MB)",
+        )
         current_app.logger.info(f"Notice file saved successfully: {file_path}")
 
         return {
@@ -408,8 +638,14 @@ def save_notice_file(file, notice_id):
 
 
 def delete_notice_asset(file_path):
-    """공지사항 첨부파일 삭제"""
+    """공지사항 첨부파일 삭제 (저장소 이미지는 마지막 참조가 해제될 때만 삭제)"""
     try:
+        if _release_image("notices", file_path):
+            return True
+
+        # 크기별 변형 파일 삭제
+        remove_image_variants(file_path)
+
         if file_path and os.path.exists(file_path):
             os.remove(file_path)
             print(f"공지사항 첨부파일 삭제: {file_path}")
@@ -420,23 +656,8 @@ def delete_notice_asset(file_path):
         return False
 
 
-def create_reservation_directories(reservation_id):
-    """청소 사진 저장을 위한 디렉토리 생성"""
-    from flask import current_app
-
-    base_dir = current_app.config.get("RESERVATIONS_DIR", "reservations")
-    # 절대 경로로 변환 (파일 서빙과 동일한 경로 사용)
-    if not os.path.isabs(base_dir):
-        base_dir = os.path.join(current_app.root_path, base_dir)
-    reservation_dir = os.path.join(base_dir, str(reservation_id))
-
-    os.makedirs(reservation_dir, exist_ok=True)
-
-    return reservation_dir
-
-
 def save_cleaning_photo(file, reservation_id):
-    """청소 사진 저장 및 최적화"""
+    """청소 사진 원본 저장 (WebP 변환은 이미지 변환 워커에서 처리)"""
     try:
         from flask import current_app
 
@@ -460,41 +681,10 @@ def save_cleaning_photo(file, reservation_id):
                 f"지원하지 않는 이미지 형식입니다. 허용된 형식: {', '.join(allowed_extensions)}. 업로드한 파일: {original_filename} (확장자: '{file_ext}')"
             )
 
-        # 고유한 파일명 생성 (WebP로 저장)
-        optimized_filename = f"{uuid.uuid4()}.webp"
-
-        # 디렉토리 생성
-        reservation_dir = create_reservation_directories(reservation_id)
-        current_app.logger.info(f"Created directory: {reservation_dir}")
-
-        # 최적화된 파일 저장 경로
-        optimized_path = os.path.join(reservation_dir, optimized_filename)
-
-        # 임시 원본 파일 저장
-        temp_path = os.path.join(reservation_dir, f"temp_{uuid.uuid4()}.{file_ext}")
-        file.save(temp_path)
-        current_app.logger.info(f"Saved temp file: {temp_path}")
-
-        # 이미지 최적화
-        if optimize_image(temp_path, optimized_path):
-            # 임시 파일 삭제
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-
-            current_app.logger.info(
-                f"Cleaning photo saved successfully: {optimized_path}"
-            )
-            return {
-                "file_path": f"/{current_app.config.get('RESERVATIONS_DIR', 'reservations')}/{reservation_id}/{optimized_filename}",
-                "optimized_path": optimized_path,
-                "original_filename": original_filename,
-            }
-        else:
-            # 최적화 실패 시 임시 파일 삭제
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-            current_app.logger.error("Image optimization failed")
-            raise ValueError("이미지 최적화에 실패했습니다")
+        # 내용 주소 저장소에 저장 (같은 이미지는 기존 변환본 재사용)
+        image_info = _store_image(file, "reservations", file_ext)
+        current_app.logger.info(f"Cleaning photo saved: {image_info['file_path']}")
+        return image_info
 
     except Exception as e:
         from flask import current_app
@@ -504,8 +694,14 @@ def save_cleaning_photo(file, reservation_id):
 
 
 def delete_cleaning_photo(file_path):
-    """청소 사진 파일 삭제"""
+    """청소 사진 파일 삭제 (저장소 이미지는 마지막 참조가 해제될 때만 삭제)"""
     try:
+        if _release_image("reservations", file_path):
+            return True
+
+        # 크기별 변형 파일 삭제
+        remove_image_variants(file_path)
+
         if file_path and os.path.exists(file_path):
             os.remove(file_path)
             print(f"청소 사진 삭제: {file_path}")
@@ -0,0 +1,103 @@
+"""
+이미지 변환 워커 풀
+업로드 이미지 변환을 요청 스레드 대신 동시 실행 수가 제한된 백그라운드 워커에서 수행
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class ImageWorkerPool:
+    """
+    이미지 변환 워커 풀
+
+    - 동시에 변환하는 이미지 수를 max_workers로 제한
+    - 대기 중인 작업이 max_queue를 넘으면 submit()이 False를 반환하며,
+      작업은 DB에 PENDING으로 남아 재시도 스케줄러가 다시 제출
+    - 작업은 Flask 앱 컨텍스트 안에서 실행
+    """
+
+    def __init__(self, max_workers=2, max_queue=64):
+        self._lock = threading.Lock()
+        self._app = None
+        self._executor = None
+        self._pending = 0  # 실행 중 + 대기 중인 작업 수
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self.configure(max_workers, max_queue)
+
+    def configure(self, max_workers=2, max_queue=64, app=None):
+        """워커 수/대기열 크기 설정 (기존 워커 풀은 남은 작업 처리 후 종료)"""
+        with self._lock:
+            old_executor = self._executor
+            self.max_workers = max_workers
+            self.max_queue = max_queue
+            if app is not None:
+                self._app = app
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="image-worker"
+            )
+
+        if old_executor is not None:
+            old_executor.shutdown(wait=False)
+
+    def submit(self, func, *args) -> bool:
+        """작업 제출 (대기열이 가득 차면 False)"""
+        with self._lock:
+            if self._app is None or self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                return False
+            self._pending += 1
+            app = self._app
+            executor = self._executor
+
+        def task():
+            with self._lock:
+                self._running += 1
+            failed = False
+            try:
+                with app.app_context():
+                    func(*args)
+            except Exception:
+                failed = True
+                logger.exception("이미지 변환 작업 실행 중 오류 발생")
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._pending -= 1
+                    self._completed += 1
+                    self._failed += int(failed)
+
+        executor.submit(task)
+        return True
+
+    def metrics(self) -> dict:
+        """워커 풀 상태 (실행/대기 중인 작업 수, 처리 수)"""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "max_queue": self.max_queue,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+            }
+
+
+# 전역 인스턴스
+image_worker = ImageWorkerPool()
+
+
+def init_image_worker(app):
+    """앱 설정으로 이미지 변환 워커 풀 구성"""
+    image_worker.configure(
+        max_workers=app.config.get("IMAGE_WORKERS", 2),
+        max_queue=app.config.get("IMAGE_QUEUE_MAX", 64),
+        app=app,
+    )
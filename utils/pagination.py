@@ -0,0 +1,37 @@
+"""
+커서 기반 페이지네이션 유틸리티
+마지막으로 반환한 행의 정렬 키 (date, start_time, id)를 URL에 안전한 불투명 문자열로 인코딩
+"""
+
+import base64
+from datetime import date, datetime, time
+
+
+def encode_cursor(date_value: date, start_time: time, row_id: int) -> str:
+    """정렬 키를 커서 문자열로 변환"""
+    raw = f"{date_value.isoformat()}|{start_time.strftime('%H:%M:%S')}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """
+    커서 문자열을 정렬 키로 변환
+
+    Returns:
+        (date, time, id)
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        date_part, time_part, id_part = (
+            base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+        )
+        return (
+            datetime.strptime(date_part, "%Y-%m-%d").date(),
+            datetime.strptime(time_part, "%H:%M:%S").time(),
+            int(id_part),
+        )
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("cursor 형식이 올바르지 않습니다.")
@@ -0,0 +1,147 @@
+"""
+비밀번호 해시 워커 풀
+PBKDF2 해시 계산을 요청 스레드 대신 동시 실행 수가 제한된 워커 풀에서 수행
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.security import (
+    DEFAULT_PBKDF2_ITERATIONS,
+    check_password_hash,
+    generate_password_hash,
+)
+
+DEFAULT_HASH_METHOD = "pbkdf2:sha256:600000"
+
+
+class PasswordHashBusyError(Exception):
+    """해시 대기열이 가득 차 요청을 처리할 수 없는 경우"""
+
+
+class PasswordHasher:
+    """
+    비밀번호 해시/검증 워커 풀
+
+    - 동시에 계산하는 해시 수를 max_workers로 제한하여 로그인/회원가입이 몰려도
+      다른 API 요청이 CPU를 얻을 수 있도록 함
+    - 대기 중인 작업이 max_queue를 넘으면 PasswordHashBusyError 발생
+    - 설정된 해시 방식(method)과 다른 방식으로 저장된 비밀번호는 needs_rehash()로 확인
+    """
+
+    def __init__(self, max_workers=2, max_queue=32, method=DEFAULT_HASH_METHOD):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pending = 0  # 실행 중 + 대기 중인 작업 수
+        self._running = 0
+        self._max_queue_depth = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_seconds = 0.0
+        self.configure(max_workers, max_queue, method)
+
+    def configure(self, max_workers=2, max_queue=32, method=DEFAULT_HASH_METHOD):
+        """워커 수/대기열 크기/해시 방식 설정 (기존 워커 풀은 남은 작업 처리 후 종료)"""
+        method_prefix = _stored_method_prefix(method)
+
+        with self._lock:
+            old_executor = self._executor
+            self.max_workers = max_workers
+            self.max_queue = max_queue
+            self.method = method
+            self.method_prefix = method_prefix
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="password-hash"
+            )
+
+        if old_executor is not None:
+            old_executor.shutdown(wait=False)
+
+    def hash(self, password: str) -> str:
+        """설정된 방식으로 비밀번호 해시 생성"""
+        return self._run(generate_password_hash, password, method=self.method)
+
+    def verify(self, pwhash: str, password: str) -> bool:
+        """저장된 해시와 비밀번호 비교"""
+        return self._run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash: str) -> bool:
+        """저장된 해시의 방식/비용이 현재 설정과 다른지 확인"""
+        return pwhash.split("$", 1)[0] != self.method_prefix
+
+    def metrics(self) -> dict:
+        """워커 풀 상태 (대기열 길이, 처리 수, 평균 소요 시간)"""
+        with self._lock:
+            return {
+                "method": self.method,
+                "workers": self.max_workers,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "max_queue": self.max_queue,
+                "max_queue_depth": self._max_queue_depth,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_ms": (
+                    round(self._total_seconds / self._completed * 1000, 1)
+                    if self._completed
+                    else 0.0
+                ),
+            }
+
+    def _run(self, func, *args, **kwargs):
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise PasswordHashBusyError("요청이 많아 잠시 후 다시 시도해주세요.")
+            self._pending += 1
+            self._max_queue_depth = max(
+                self._max_queue_depth, self._pending - self.max_workers
+            )
+            executor = self._executor
+
+        def task():
+            with self._lock:
+                self._running += 1
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                with self._lock:
+                    self._running -= 1
+                    self._pending -= 1
+                    self._completed += 1
+                    self._total_seconds += elapsed
+
+        return executor.submit(task).result()
+
+
+def _stored_method_prefix(method: str) -> str:
+    """
+    해시 방식으로 생성되는 해시에 저장되는 접두어
+
+    "scrypt", "pbkdf2"처럼 줄여 쓴 방식은 werkzeug 기본값이 채워진 접두어
+    ("scrypt:32768:8:1", "pbkdf2:sha256:600000")로 저장되므로 같은 규칙으로 변환
+    (해시를 실제로 계산하지 않음)
+    """
+    name, *args = method.split(":")
+    if name == "scrypt" and not args:
+        return "scrypt:32768:8:1"
+    if name == "pbkdf2" and len(args) < 2:
+        hash_name = args[0] if args else "sha256"
+        return f"pbkdf2:{hash_name}:{DEFAULT_PBKDF2_ITERATIONS}"
+    return method
+
+
+# 전역 인스턴스
+password_hasher = PasswordHasher()
+
+
+def init_password_hasher(app):
+    """앱 설정으로 비밀번호 해시 워커 풀 구성"""
+    password_hasher.configure(
+        max_workers=app.config.get("PASSWORD_HASH_WORKERS", 2),
+        max_queue=app.config.get("PASSWORD_HASH_MAX_QUEUE", 32),
+        method=app.config.get("PASSWORD_HASH_METHOD", DEFAULT_HASH_METHOD),
+    )
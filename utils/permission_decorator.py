@@ -116,14 +116,13 @@ def require_any_permission(*permission_keys: str):
             if request.method == "OPTIONS":
                 return f(*args, **kwargs)
 
-            # 모든 권한 검사
-            results = []
-            for permission_key in permission_keys:
-                result = permission_service.check_permission(permission_key)
-                results.append(result)
-                if result["has_permission"]:
-                    # 하나라도 통과하면 OK
-                    return f(*args, **kwargs)
+            # 모든 권한 일괄 검사 (사용자/역할은 한 번만 조회)
+            results = list(
+                permission_service.check_permissions(permission_keys).values()
+            )
+            if any(r["has_permission"] for r in results):
+                # 하나라도 통과하면 OK
+                return f(*args, **kwargs)
 
             # 모든 권한 검사 실패
             if not any(r["user_id"] for r in results):
@@ -169,11 +168,9 @@ def require_all_permissions(*permission_keys: str):
             if request.method == "OPTIONS":
                 return f(*args, **kwargs)
 
-            # 모든 권한 검사
-            results = []
-            for permission_key in permission_keys:
-                result = permission_service.check_permission(permission_key)
-                results.append(result)
+            # 모든 권한 일괄 검사 (사용자/역할은 한 번만 조회)
+            results = permission_service.check_permissions(permission_keys)
+            for result in results.values():
                 if not result["has_permission"]:
                     # 하나라도 실패하면 중단
                     if not result["user_id"]:
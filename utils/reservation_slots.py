@@ -0,0 +1,100 @@
+"""
+예약 슬롯 비트맵 유틸리티
+하루를 30분 단위 슬롯 48개로 나누어 공간/동아리의 하루 예약 현황을 정수 비트맵으로 표현
+"""
+
+from datetime import time
+
+# 예약 최소 단위 (분)
+SLOT_MINUTES = 30
+# 하루 슬롯 수 (00:00 ~ 24:00)
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+# 운영 종료 시각으로 저장된 00:00은 하루의 끝(24:00)을 의미
+END_OF_DAY = time(0, 0)
+
+
+def time_to_slot(value: time) -> int:
+    """시각을 슬롯 인덱스로 변환 (30분 단위가 아니면 ValueError)"""
+    minutes = value.hour * 60 + value.minute
+    if value.second or value.microsecond or minutes % SLOT_MINUTES:
+        raise ValueError(f"시간은 {SLOT_MINUTES}분 단위여야 합니다: {value}")
+    return minutes // SLOT_MINUTES
+
+
+def slot_to_time(slot: int) -> time:
+    """슬롯 인덱스를 시작 시각으로 변환"""
+    minutes = slot * SLOT_MINUTES
+    return time(minutes // 60, minutes % 60)
+
+
+def interval_mask(start: time, end: time) -> int:
+    """[start, end) 구간에 해당하는 슬롯 비트맵"""
+    start_slot = time_to_slot(start)
+    end_slot = time_to_slot(end)
+    if end_slot <= start_slot:
+        raise ValueError("시작 시간은 종료 시간보다 빨라야 합니다.")
+    return ((1 << (end_slot - start_slot)) - 1) << start_slot
+
+
+def operating_slots(open_time: time, close_time: time):
+    """
+    운영 시간을 슬롯 범위로 변환 -> (시작 슬롯, 끝 슬롯(미포함))
+
+    30분 단위가 아닌 값은 운영 시간 안쪽으로 맞추고(시작은 올림, 종료는 내림),
+    종료 시각 00:00(END_OF_DAY)은 24:00으로 취급합니다.
+    """
+    open_slot, remainder = divmod(open_time.hour * 60 + open_time.minute, SLOT_MINUTES)
+    if remainder or open_time.second or open_time.microsecond:
+        open_slot += 1
+
+    if close_time == END_OF_DAY:
+        close_slot = SLOTS_PER_DAY
+    else:
+        close_slot = (close_time.hour * 60 + close_time.minute) // SLOT_MINUTES
+    return open_slot, close_slot
+
+
+def operating_mask(open_time: time, close_time: time) -> int:
+    """운영 시간에 해당하는 슬롯 비트맵 (운영 시간이 30분보다 짧으면 0)"""
+    open_slot, close_slot = operating_slots(open_time, close_time)
+    if close_slot <= open_slot:
+        return 0
+    return ((1 << (close_slot - open_slot)) - 1) << open_slot
+
+
+def close_time_to_str(value: time) -> str:
+    """운영 종료 시각을 "HH:MM" 문자열로 변환 (END_OF_DAY는 "24:00")"""
+    return "24:00" if value == END_OF_DAY else value.strftime("%H:%M")
+
+
+def slot_count(mask: int) -> int:
+    """비트맵에 포함된 슬롯 수"""
+    return bin(mask).count("1")
+
+
+def slot_hours(slots: int) -> float:
+    """슬롯 수를 시간 단위로 변환"""
+    return slots * SLOT_MINUTES / 60
+
+
+def slot_to_str(slot: int) -> str:
+    """슬롯 인덱스를 "HH:MM" 문자열로 변환 (하루의 끝은 "24:00")"""
+    minutes = slot * SLOT_MINUTES
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def mask_to_ranges(mask: int):
+    """비트맵의 연속된 슬롯 구간 목록 -> [(시작 슬롯, 끝 슬롯(미포함)), ...]"""
+    ranges = []
+    slot = 0
+    while mask:
+        if mask & 1:
+            start = slot
+            while mask & 1:
+                mask >>= 1
+                slot += 1
+            ranges.append((start, slot))
+        else:
+            mask >>= 1
+            slot += 1
+    return ranges
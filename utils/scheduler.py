@@ -5,6 +5,7 @@
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 import pytz
 import logging
 
@@ -22,8 +23,19 @@ def init_scheduler(app):
 
     def recruitment_job_wrapper():
         with app.app_context():
-            open_started_recruitments_job()
-            close_expired_recruitments_job()
+            manage_recruitment_status_job()
+
+    def session_cleanup_job_wrapper():
+        with app.app_context():
+            cleanup_sessions_job()
+
+    def club_usage_job_wrapper():
+        with app.app_context():
+            reconcile_club_usage_job()
+
+    def image_job_retry_wrapper():
+        with app.app_context():
+            retry_image_jobs_job()
 
     # 매일 자정(KST)에 만료된 배너 아카이브
     scheduler.add_job(
@@ -43,9 +55,36 @@ def init_scheduler(app):
         replace_existing=True,
     )
 
+    # 매일 새벽 4시(KST)에 만료 세션 비활성화 및 보관 기간이 지난 세션 삭제
+    scheduler.add_job(
+        func=session_cleanup_job_wrapper,
+        trigger=CronTrigger(hour=4, minute=0, timezone=pytz.timezone("Asia/Seoul")),
+        id="cleanup_sessions",
+        name="만료 세션 정리",
+        replace_existing=True,
+    )
+
+    # 매일 새벽 4시 30분(KST)에 동아리 사용량 집계를 예약 기준으로 재검증
+    scheduler.add_job(
+        func=club_usage_job_wrapper,
+        trigger=CronTrigger(hour=4, minute=30, timezone=pytz.timezone("Asia/Seoul")),
+        id="reconcile_club_usage",
+        name="동아리 공간 사용량 집계 재검증",
+        replace_existing=True,
+    )
+
+    # 1분마다 대기열에 들어가지 못했거나 실패한 이미지 변환 작업 재시도
+    scheduler.add_job(
+        func=image_job_retry_wrapper,
+        trigger=IntervalTrigger(minutes=1),
+        id="retry_image_jobs",
+        name="이미지 변환 작업 재시도",
+        replace_existing=True,
+    )
+
     scheduler.start()
     logger.info(
-        "스케줄러가 시작되었습니다. 매일 자정(KST)에 만료된 배너를 아카이브하고, 모집 기간 상태를 자동으로 관리합니다."
+        "스케줄러가 시작되었습니다. 매일 자정(KST)에 만료된 배너를 아카이브하고, 모집 기간 상태를 자동으로 관리하며, 매일 새벽 4시(KST)에 만료 세션을 정리합니다."
     )
 
     return scheduler
@@ -67,35 +106,79 @@ def archive_expired_banners_job():
         )
 
 
-def open_started_recruitments_job():
-    """모집 시작일이 된 동아리를 OPEN으로 변경하는 스케줄러 작업"""
+def manage_recruitment_status_job():
+    """모집 기간에 맞춰 동아리 모집 상태(OPEN/CLOSED)를 DB에 반영하는 스케줄러 작업"""
     try:
-        from services.club_service import open_started_recruitments
+        from services.club_service import apply_recruitment_transitions
 
-        opened_count = open_started_recruitments()
-        if opened_count > 0:
+        result = apply_recruitment_transitions()
+        if result["opened"] > 0:
             logger.info(
-                f"모집 시작일이 된 동아리 {opened_count}개를 OPEN으로 변경했습니다."
+                f"모집 기간이 시작된 동아리 {result['opened']}개를 OPEN으로 변경했습니다."
             )
-        else:
-            logger.debug("OPEN으로 변경할 모집 시작일이 된 동아리가 없습니다.")
+        if result["closed"] > 0:
+            logger.info(
+                f"모집 기간이 아닌 동아리 {result['closed']}개를 CLOSED로 변경했습니다."
+            )
+        if result["opened"] == 0 and result["closed"] == 0:
+            logger.debug("모집 상태를 변경할 동아리가 없습니다.")
     except Exception as e:
         logger.error(
-            f"모집 시작 처리 스케줄러 작업 중 오류 발생: {str(e)}", exc_info=True
+            f"모집 상태 관리 스케줄러 작업 중 오류 발생: {str(e)}", exc_info=True
+        )
+
+
+def cleanup_sessions_job():
+    """만료 세션을 비활성화하고 보관 기간이 지난 비활성 세션을 삭제하는 스케줄러 작업"""
+    try:
+        from services.session_service import cleanup_sessions
+
+        result = cleanup_sessions()
+        logger.info(
+            f"세션 정리 완료: 비활성화 {result['deactivated']}개, "
+            f"삭제 {result['purged']}개, 소요 시간 {result['duration_ms']}ms"
         )
+    except Exception as e:
+        logger.error(f"세션 정리 스케줄러 작업 중 오류 발생: {str(e)}", exc_info=True)
 
 
-def close_expired_recruitments_job():
-    """만료된 모집 기간을 CLOSED로 변경하는 스케줄러 작업"""
+def reconcile_club_usage_job():
+    """최근 1주 이후의 동아리 사용량 집계를 예약 기준으로 재검증하는 스케줄러 작업"""
     try:
-        from services.club_service import close_expired_recruitments
+        from datetime import timedelta
+
+        from services.reservation_service import ReservationService
+        from utils.time_utils import get_kst_today
 
-        closed_count = close_expired_recruitments()
-        if closed_count > 0:
-            logger.info(f"만료된 모집 기간 {closed_count}개를 CLOSED로 변경했습니다.")
+        result = ReservationService.reconcile_club_usage(
+            get_kst_today() - timedelta(days=7)
+        )
+        if result["corrected"] > 0:
+            logger.warning(
+                f"동아리 사용량 집계 {result['corrected']}개를 예약 기준으로 수정했습니다. (확인: {result['checked']}개)"
+            )
         else:
-            logger.debug("CLOSED로 변경할 만료된 모집 기간이 없습니다.")
+            logger.debug(f"동아리 사용량 집계 {result['checked']}개가 일치합니다.")
+    except Exception as e:
+        logger.error(
+            f"동아리 사용량 집계 재검증 스케줄러 작업 중 오류 발생: {str(e)}",
+            exc_info=True,
+        )
+
+
+def retry_image_jobs_job():
+    """대기 중이거나 중단된 이미지 변환 작업을 워커 풀에 다시 제출하는 스케줄러 작업"""
+    try:
+        from services.image_job_service import retry_image_jobs
+
+        result = retry_image_jobs()
+        if result["recovered"] or result["submitted"]:
+            logger.info(
+                f"이미지 변환 작업 재시도: 중단 작업 복구 {result['recovered']}개, "
+                f"재제출 {result['submitted']}개"
+            )
     except Exception as e:
         logger.error(
-            f"모집 기간 만료 처리 스케줄러 작업 중 오류 발생: {str(e)}", exc_info=True
+            f"이미지 변환 작업 재시도 스케줄러 작업 중 오류 발생: {str(e)}",
+            exc_info=True,
         )
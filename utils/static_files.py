@@ -0,0 +1,118 @@
+"""
+업로드 파일 서빙 유틸리티
+업로드 디렉토리 파일을 ETag/조건부 요청(304)/Range 요청과 캐시 정책을 적용해 응답
+(FILE_SERVING_MODE 설정 시 파일 전송은 앞단 프록시에 위임)
+"""
+
+import os
+from urllib.parse import quote
+
+from flask import abort, current_app, request, send_file
+from werkzeug.security import safe_join
+from werkzeug.utils import send_file as werkzeug_send_file
+
+from utils.asset_store import STORE_NAMESPACES, parse_content_hash
+
+# 내용 주소 파일은 내용이 바뀌면 URL도 바뀌므로 재검증 없이 1년 동안 캐시
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+
+def get_upload_dir(config_key, default):
+    """업로드 디렉토리 절대 경로 (상대 경로는 앱 루트 기준)"""
+    base_dir = current_app.config.get(config_key, default)
+    if not os.path.isabs(base_dir):
+        base_dir = os.path.join(current_app.root_path, base_dir)
+    return base_dir
+
+
+def send_upload_file(directory, filename):
+    """업로드 디렉토리의 파일 응답 (디렉토리 밖 경로나 없는 파일은 404)"""
+    path = safe_join(directory, filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+    return send_cached_file(path)
+
+
+def send_cached_file(path, download_name=None, mimetype=None):
+    """
+    캐시 정책을 적용한 파일 응답
+
+    - 내용 주소 파일(store/): 파일 이름(내용 해시, 변환본은 변환 설정 지문 포함) 기반
+      강한 ETag, Cache-Control: public, max-age=1년, immutable
+    - 그 밖의 파일: 수정 시각+크기 기반 강한 ETag, Cache-Control: no-cache (매번 재검증)
+    - If-None-Match/If-Modified-Since가 일치하면 304, Range 요청에는 206 부분 응답
+    - download_name이 있으면 첨부파일(Content-Disposition: attachment)로 응답
+    - 프록시 위임 모드에서는 헤더와 304만 앱이 처리하고 본문/Range는 프록시가 전송
+    """
+    immutable = parse_content_hash(path) is not None
+    if immutable:
+        etag = os.path.basename(path)
+    else:
+        stat = os.stat(path)
+        etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+    options = {
+        "mimetype": mimetype,
+        "as_attachment": download_name is not None,
+        "download_name": download_name,
+        "etag": etag,
+        "max_age": IMMUTABLE_MAX_AGE if immutable else None,
+    }
+
+    offload_header = _get_offload_header(path)
+    if offload_header is None:
+        response = send_file(path, conditional=True, **options)
+    else:
+        response = werkzeug_send_file(
+            path,
+            request.environ,
+            use_x_sendfile=True,
+            response_class=current_app.response_class,
+            conditional=False,
+            **options,
+        )
+        # 본문 길이와 Range 요청은 파일을 보내는 프록시가 처리
+        del response.headers["X-Sendfile"]
+        del response.headers["Content-Length"]
+        response.headers[offload_header[0]] = offload_header[1]
+        response = response.make_conditional(request.environ)
+        # 프록시는 상태 코드와 관계없이 위임 헤더가 있으면 파일을 보내므로 304에서는 제거
+        if response.status_code == 304:
+            del response.headers[offload_header[0]]
+
+    if immutable:
+        response.cache_control.immutable = True
+    return response
+
+
+def _get_offload_header(path):
+    """
+    프록시 위임 헤더 (이름, 값)
+
+    FILE_SERVING_MODE
+    - direct: 앱 워커가 파일을 직접 전송 (None)
+    - x-accel-redirect: nginx 내부 위치(X_ACCEL_REDIRECT_PREFIX/<네임스페이스>/<상대 경로>)로 위임
+    - x-sendfile: Apache/lighttpd 등에 파일 절대 경로로 위임
+
+    업로드 디렉토리 밖의 파일처럼 내부 위치로 매핑할 수 없으면 None (앱이 직접 전송)
+    """
+    mode = current_app.config.get("FILE_SERVING_MODE", "direct")
+    if mode == "x-sendfile":
+        return "X-Sendfile", os.path.realpath(path)
+    if mode != "x-accel-redirect":
+        return None
+
+    real_path = os.path.realpath(path)
+    prefix = current_app.config.get("X_ACCEL_REDIRECT_PREFIX", "/_protected").rstrip(
+        "/"
+    )
+    for namespace, (config_key, _) in STORE_NAMESPACES.items():
+        base_dir = os.path.realpath(get_upload_dir(config_key, namespace))
+        if real_path.startswith(base_dir + os.sep):
+            relative_path = os.path.relpath(real_path, base_dir).replace(os.sep, "/")
+            return "X-Accel-Redirect", quote(f"{prefix}/{namespace}/{relative_path}")
+
+    current_app.logger.warning(
+        f"X-Accel-Redirect 내부 위치로 매핑할 수 없어 직접 전송합니다: {path}"
+    )
+    return None
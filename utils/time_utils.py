@@ -30,3 +30,8 @@ def get_kst_now_naive():
     """
     kst = pytz.timezone("Asia/Seoul")
     return datetime.now(kst).replace(tzinfo=None)
+
+
+def get_kst_today():
+    """현재 KST 날짜(date)를 반환 (스케줄러의 자정 기준과 동일)"""
+    return get_kst_now().date()
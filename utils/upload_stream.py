@@ -0,0 +1,277 @@
+"""
+업로드 스트리밍 유틸리티
+multipart 업로드 파일을 메모리/시스템 임시 디렉토리 대신 업로드 임시 디렉토리에 바로 쓰고,
+저장할 때는 다시 복사하지 않고 최종 위치로 이름만 변경
+"""
+
+import errno
+import hashlib
+import io
+import logging
+import os
+import time
+import uuid
+
+from flask import Request, current_app, request
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from utils.asset_store import STORE_NAMESPACES
+
+logger = logging.getLogger(__name__)
+
+# 업로드 임시 파일 이름 (서버가 중단되어 남은 파일은 시작 시 정리)
+UPLOAD_TEMP_PREFIX = "temp_"
+UPLOAD_TEMP_SUFFIX = ".part"
+# 업로드 임시 디렉토리가 최종 위치와 다른 파일 시스템일 때 복사 단위
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+DEFAULT_NOTICE_FILE_MAX_BYTES = 100 * 1024 * 1024
+DEFAULT_IMAGE_FILE_MAX_BYTES = 30 * 1024 * 1024
+# 파일 하나만 받는 엔드포인트에서 파일 외 본문(multipart 경계, 폼 필드)에 허용하는 크기
+UPLOAD_FORM_OVERHEAD_BYTES = 1024 * 1024
+DEFAULT_ORPHAN_SECONDS = 3600
+
+
+class HashingUploadFile(io.FileIO):
+    """
+    업로드 임시 파일
+
+    multipart 파서가 청크를 쓰는 동안 SHA-256 해시와 크기를 계산하고,
+    파일 하나가 max_bytes를 넘으면 요청 본문을 끝까지 받지 않고 413으로 중단
+    """
+
+    def __init__(self, path, max_bytes=None):
+        super().__init__(path, "w+b")
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self._digest = hashlib.sha256()
+
+    def write(self, data):
+        self.size_bytes += len(data)
+        if self.max_bytes is not None and self.size_bytes > self.max_bytes:
+            raise RequestEntityTooLarge(
+                f"업로드 파일이 너무 큽니다 (최대 {self.max_bytes // (1024 * 1024)}MB)"
+            )
+        self._digest.update(data)
+        return super().write(data)
+
+    def hexdigest(self):
+        return self._digest.hexdigest()
+
+
+class UploadRequest(Request):
+    """
+    업로드 파일을 업로드 임시 디렉토리(UPLOAD_TEMP_DIR)로 스트리밍하는 요청 클래스
+
+    저장되지 않은 임시 파일은 요청이 끝날 때 삭제됩니다.
+    파일 크기 제한은 요청된 엔드포인트의 upload_limit 설정을 따릅니다.
+    """
+
+    @property
+    def max_content_length(self):
+        """
+        요청 본문 최대 크기
+
+        파일 하나만 받는 엔드포인트는 (파일 크기 제한 + 폼 여유분)으로 줄여,
+        Content-Length가 이를 넘으면 본문을 읽기 전에 413으로 거절
+        """
+        max_length = super().max_content_length
+        limit = _get_upload_limit(self)
+        if limit is None or not limit[2]:
+            return max_length
+
+        request_max = _resolve_max_bytes(limit) + UPLOAD_FORM_OVERHEAD_BYTES
+        return request_max if max_length is None else min(max_length, request_max)
+
+    def _get_file_stream(
+        self, total_content_length, content_type, filename=None, content_length=None
+    ):
+        temp_dir = get_upload_temp_dir()
+        os.makedirs(temp_dir, exist_ok=True)
+        path = os.path.join(
+            temp_dir, f"{UPLOAD_TEMP_PREFIX}{uuid.uuid4()}{UPLOAD_TEMP_SUFFIX}"
+        )
+        self.__dict__.setdefault("_upload_temp_paths", []).append(path)
+        return HashingUploadFile(path, get_max_upload_file_bytes())
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            for path in self.__dict__.pop("_upload_temp_paths", []):
+                _remove_quietly(path)
+
+
+def get_upload_temp_dir():
+    """업로드 임시 디렉토리 (최종 저장 위치와 같은 파일 시스템이어야 복사 없이 이동)"""
+    temp_dir = current_app.config.get("UPLOAD_TEMP_DIR", "uploads_tmp")
+    if not os.path.isabs(temp_dir):
+        temp_dir = os.path.join(current_app.root_path, temp_dir)
+    return temp_dir
+
+
+def init_upload_limits(app):
+    """
+    upload_limit이 지정된 엔드포인트는 뷰 실행 전에 폼을 파싱
+
+    크기 제한 초과(RequestEntityTooLarge)는 폼을 처음 읽을 때 발생하므로, 컨트롤러의
+    except Exception 안에서 읽으면 500으로 바뀝니다. 뷰 전에 파싱하여 413 오류 핸들러가
+    처리하도록 합니다.
+    """
+
+    @app.before_request
+    def parse_limited_upload():
+        if _get_upload_limit(request) is None:
+            return
+
+        max_length = request.max_content_length
+        if max_length is not None and (request.content_length or 0) > max_length:
+            raise RequestEntityTooLarge(
+                f"업로드 파일이 너무 큽니다 (최대 {get_max_upload_file_bytes() // (1024 * 1024)}MB)"
+            )
+        request.files
+
+    return app
+
+
+def upload_limit(config_key, default, single_file=False):
+    """
+    업로드 엔드포인트의 파일 크기 제한 지정 (폼을 파싱하기 전에 적용)
+
+    Args:
+        config_key: 파일 하나의 최대 크기 설정 키
+        default: 설정이 없을 때의 최대 크기
+        single_file: 파일을 하나만 받으면 True (Content-Length로 미리 거절)
+    """
+
+    def decorator(f):
+        f.upload_limit = (config_key, default, single_file)
+        return f
+
+    return decorator
+
+
+def get_max_upload_file_bytes():
+    """현재 요청 엔드포인트의 업로드 파일 하나의 최대 크기 (지정이 없으면 이미지 제한)"""
+    limit = _get_upload_limit(request) or (
+        "IMAGE_MAX_FILE_BYTES",
+        DEFAULT_IMAGE_FILE_MAX_BYTES,
+    )
+    return _resolve_max_bytes(limit)
+
+
+def _get_upload_limit(req):
+    """요청된 엔드포인트의 뷰 메서드에 지정된 upload_limit (없으면 None)"""
+    if not current_app or req.url_rule is None:
+        return None
+
+    view = current_app.view_functions.get(req.endpoint)
+    view_class = getattr(view, "view_class", None)
+    if view_class is not None:
+        view = getattr(view_class, req.method.lower(), None)
+    return getattr(view, "upload_limit", None)
+
+
+def _resolve_max_bytes(limit):
+    config_key, default = limit[0], limit[1]
+    return current_app.config.get(config_key, default)
+
+
+def consume_upload(file, dest_path, max_bytes, too_large_message):
+    """
+    업로드 파일을 dest_path로 저장
+
+    - 업로드 임시 파일이면 파싱 중 계산한 해시/크기를 사용하고 이름만 변경
+    - 그 밖의 스트림(다른 파일 시스템, 테스트 등)은 청크 단위로 복사하며
+      max_bytes를 넘는 즉시 중단
+
+    Returns:
+        (SHA-256 해시, 크기)
+
+    Raises:
+        ValueError: 파일이 max_bytes보다 큰 경우
+    """
+    stream = file.stream
+    if isinstance(stream, HashingUploadFile):
+        if stream.size_bytes > max_bytes:
+            raise ValueError(too_large_message)
+        try:
+            os.replace(stream.name, dest_path)
+            return stream.hexdigest(), stream.size_bytes
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            stream.seek(0)
+
+    temp_path = f"{dest_path}{UPLOAD_TEMP_SUFFIX}"
+    digest = hashlib.sha256()
+    size_bytes = 0
+    try:
+        with open(temp_path, "wb") as out:
+            while True:
+                chunk = stream.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size_bytes += len(chunk)
+                if size_bytes > max_bytes:
+                    raise ValueError(too_large_message)
+                digest.update(chunk)
+                out.write(chunk)
+        os.replace(temp_path, dest_path)
+    finally:
+        _remove_quietly(temp_path)
+
+    return digest.hexdigest(), size_bytes
+
+
+def sweep_orphaned_uploads(app):
+    """
+    서버가 중단되어 남은 업로드 임시 파일 정리 (앱 시작 시 호출)
+
+    업로드 임시 디렉토리와 업로드 디렉토리의 temp_*, *.part 파일 중
+    UPLOAD_ORPHAN_SECONDS보다 오래된 파일을 삭제합니다.
+
+    Returns:
+        삭제한 파일 수
+    """
+    with app.app_context():
+        base_dirs = [get_upload_temp_dir()]
+        for config_key, _ in STORE_NAMESPACES.values():
+            base_dir = app.config.get(config_key)
+            if base_dir and not os.path.isabs(base_dir):
+                base_dir = os.path.join(app.root_path, base_dir)
+            if base_dir:
+                base_dirs.append(base_dir)
+
+    cutoff = time.time() - app.config.get(
+        "UPLOAD_ORPHAN_SECONDS", DEFAULT_ORPHAN_SECONDS
+    )
+    removed = 0
+    for base_dir in base_dirs:
+        for dirpath, _, filenames in os.walk(base_dir):
+            for filename in filenames:
+                if not (
+                    filename.startswith(UPLOAD_TEMP_PREFIX)
+                    or filename.endswith(UPLOAD_TEMP_SUFFIX)
+                ):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                        removed += 1
+                except OSError as e:
+                    logger.warning(f"업로드 임시 파일 삭제 실패: {path} ({e})")
+
+    if removed:
+        logger.info(f"남아 있던 업로드 임시 파일 {removed}개 삭제")
+    return removed
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"업로드 임시 파일 삭제 실패: {path} ({e})")